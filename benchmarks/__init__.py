@@ -0,0 +1,5 @@
+# =================================================================
+# benchmarks — PRANA PERFORMANCE SUITE
+# Run the full suite with `python -m benchmarks` (see __main__.py);
+# the bench_*.py modules are focused comparisons for single subsystems.
+# =================================================================
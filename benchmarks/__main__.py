@@ -0,0 +1,80 @@
+# =================================================================
+# python -m benchmarks — PRANA BENCHMARK SUITE RUNNER
+#
+#   python -m benchmarks                       # run everything, print a table
+#   python -m benchmarks -k lyapunov echo      # substring filter on case names
+#   python -m benchmarks --save baseline.json  # record a baseline
+#   python -m benchmarks --baseline baseline.json --threshold 0.25
+#                                              # exit 1 on >25% throughput loss
+#
+# Offline and CPU-only: inputs come from benchmarks.synthetic.
+# =================================================================
+
+import argparse
+import json
+import platform
+import sys
+
+import numpy as np
+
+from benchmarks.suite import CASES, measure, select
+
+def _meta() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="PRANA hot-path benchmarks")
+    parser.add_argument("-k", "--filter", nargs="*", default=[], help="substring(s) of case names")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing round")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional ops/sec loss vs baseline")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    names = select(args.filter)
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh).get("results", {})
+
+    results = {}
+    regressions = []
+    print(f"{'case':48s} {'ops/sec':>14s} {'us/call':>12s} {'peak KiB':>10s} {'vs base':>8s}")
+    for name in names:
+        r = measure(CASES[name], min_time=args.min_time, rounds=args.rounds)
+        results[name] = r
+        ratio = ""
+        if name in baseline:
+            change = r["ops_per_sec"] / baseline[name]["ops_per_sec"]
+            ratio = f"{change:7.2f}x"
+            if change < 1.0 - args.threshold:
+                regressions.append((name, change))
+        print(f"{name:48s} {r['ops_per_sec']:14,.0f} {r['us_per_call']:12.1f} {r['peak_kib']:10.1f} {ratio:>8s}")
+        sys.stdout.flush()
+
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump({"meta": _meta(), "results": results}, fh, indent=2, sort_keys=True)
+        print(f"baseline written to {args.save}")
+
+    if regressions:
+        print(f"\nREGRESSIONS (> {args.threshold:.0%} slower than baseline):")
+        for name, change in regressions:
+            print(f"  {name}: {change:.2f}x")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,164 @@
+# =================================================================
+# bench_api.py — READ API UNDER LOAD
+# Reads/sec against /v1/snapshot (half conditional, served as 304) from client
+# processes, and the tick latency of the pipeline publishing underneath.
+# --server poll: SnapshotServer (asyncio); --server wsgi: serve() (werkzeug + Flask)
+#
+# Run: python -m benchmarks.bench_api [--server poll] [--clients 4] [--seconds 5] [--hz 100]
+# =================================================================
+
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import socket
+import threading
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from evolution_pro import MonteCarloEngine
+from prana_api import SnapshotPublisher, SnapshotServer, serve
+from prana_pipeline import PranaPipeline
+
+def _read_response(conn: socket.socket, pending: bytes):
+    """(status, etag, close, leftover bytes) of one response on a keep-alive socket."""
+    while b"\r\n\r\n" not in pending:
+        chunk = conn.recv(65536)
+        if not chunk:
+            raise ConnectionError("server closed the connection")
+        pending += chunk
+    head, _, pending = pending.partition(b"\r\n\r\n")
+    lines = head.split(b"\r\n")
+    status, etag, close, length = int(lines[0].split()[1]), None, False, 0
+    for line in lines[1:]:
+        name, _, value = line.partition(b":")
+        name = name.lower()
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"etag":
+            etag = value.strip()
+        elif name == b"connection":
+            close = value.strip().lower() == b"close"
+    while len(pending) < length:
+        pending += conn.recv(65536)
+    return status, etag, close, pending[length:]
+
+def _client(port: int, route: str, seconds: float, results):
+    """
+    A dashboard poller: one keep-alive connection, every other read conditional.
+    Requests are prebuilt bytes and responses are framed by Content-Length, so
+    the client spends its CPU on the socket, not on http.client.
+    """
+    os.nice(19) # stands in for a remote reader: its own CPU time is not the server's
+    conn = socket.create_connection(("127.0.0.1", port), timeout=5)
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    plain = b"GET %s HTTP/1.1\r\nHost: prana\r\n\r\n" % route.encode()
+    conditional = plain
+    pending, reads, not_modified, errors = b"", 0, 0, 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            conn.sendall(conditional if reads % 2 else plain)
+            status, etag, close, pending = _read_response(conn, pending)
+        except OSError:
+            errors += 1
+            conn.close()
+            conn = socket.create_connection(("127.0.0.1", port), timeout=5)
+            pending = b""
+            continue
+        reads += 1
+        if close: # werkzeug: one request per connection
+            conn.close()
+            conn = socket.create_connection(("127.0.0.1", port), timeout=5)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            pending = b""
+        if status == 304:
+            not_modified += 1
+        elif etag:
+            conditional = plain[:-2] + b"If-None-Match: %s\r\n\r\n" % etag
+    conn.close()
+    results.put((reads, not_modified, errors))
+
+class _Ticker(threading.Thread):
+    """Ticks the pipeline at `hz`, publishing every tick; records tick + publish latency."""
+
+    def __init__(self, publisher, hz: float):
+        super().__init__(name="prana-tick", daemon=True)
+        self.publisher = publisher
+        self.period = 1.0 / hz
+        self.pipeline = PranaPipeline(shadow_engine=MonteCarloEngine(seed=1), instrument=False)
+        self.states = synthetic.market_states(1024, seed=1)
+        self.latencies = []
+        self.stop = threading.Event()
+        self.pipeline.tick(self.states[-1]) # warm-up: lazy torch import, first fit
+
+    def run(self):
+        i = 0
+        while not self.stop.is_set():
+            t0 = time.perf_counter_ns()
+            ctx = self.pipeline.tick(self.states[i % len(self.states)])
+            self.publisher.publish_tick(ctx)
+            self.latencies.append(time.perf_counter_ns() - t0)
+            i += 1
+            self.stop.wait(max(0.0, self.period - (time.perf_counter_ns() - t0) / 1e9))
+
+    def take(self):
+        lat, self.latencies = np.array(self.latencies) / 1e3, []
+        return np.percentile(lat, (50, 99)) if len(lat) else (0.0, 0.0)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--hz", type=float, default=100.0)
+    parser.add_argument("--route", default="/v1/snapshot")
+    parser.add_argument("--server", choices=("poll", "wsgi"), default="poll")
+    parser.add_argument("--switch-interval", type=float, default=None, help="GIL switch interval while serving (s)")
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR) # no per-request access log
+    publisher = SnapshotPublisher()
+    ticker = _Ticker(publisher, args.hz)
+    ticker.start()
+    time.sleep(1.0)
+    ticker.take()
+    time.sleep(args.seconds)
+    idle = ticker.take()
+
+    if args.server == "poll":
+        server = SnapshotServer(publisher, port=0, switch_interval=args.switch_interval).start()
+        port = server.server_port
+    else:
+        server = serve(publisher, port=0, switch_interval=args.switch_interval)
+        port = server.server_port
+        threading.Thread(target=server.serve_forever, name="prana-http", daemon=True).start()
+
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    clients = [ctx.Process(target=_client, args=(port, args.route, args.seconds, results)) for _ in range(args.clients)]
+    for p in clients:
+        p.start()
+    time.sleep(0.5) # client interpreters starting up
+    ticker.take()
+    counts = np.array([results.get() for _ in clients])
+    loaded = ticker.take()
+    for p in clients:
+        p.join()
+    ticker.stop.set()
+    if args.server == "poll":
+        server.stop()
+    else:
+        server.shutdown()
+        server.server_close()
+
+    reads, not_modified, errors = counts.sum(axis=0)
+    print(f"--- READ API ({args.server}): {args.clients} client processes, {args.seconds:.0f}s, ticking at {args.hz:.0f} Hz ---")
+    print(f"reads/s    : {reads / args.seconds:10,.0f}  ({not_modified} x 304, {errors} errors)")
+    print(f"tick p50/p99 idle   : {idle[0]:8.0f} / {idle[1]:8.0f} us")
+    print(f"tick p50/p99 loaded : {loaded[0]:8.0f} / {loaded[1]:8.0f} us")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
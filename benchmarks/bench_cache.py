@@ -0,0 +1,85 @@
+# =================================================================
+# bench_cache.py — SHADOW & BICAMERAL MEMOIZATION IN A CALM REGIME
+# Hit rates, stage latency and accuracy loss of QuantizedCache per
+# resolution, against the uncached pipeline on the same drifting market.
+# The shadow is Monte Carlo: the "noise" row is a second uncached run with
+# another seed, i.e. the disagreement the shadow already has with itself.
+#
+# Run: python -m benchmarks.bench_cache [--ticks 5000] [--sigma 0.002]
+# =================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from bicameral_mind import BicameralMind
+from evolution_pro import MonteCarloEngine
+from prana_cache import QuantizedCache
+from prana_pipeline import PranaPipeline
+
+RESOLUTIONS = (0.001, 0.005, 0.01, 0.02, 0.05)
+
+def _run(states, resolution=None, seed=1):
+    shadow_cache = mind_cache = None
+    if resolution is not None:
+        shadow_cache = QuantizedCache(resolution)
+        mind_cache = QuantizedCache(resolution)
+    pipeline = PranaPipeline(
+        mind=BicameralMind(history_window=1, cache=mind_cache),
+        shadow_engine=MonteCarloEngine(seed=seed),
+        shadow_cache=shadow_cache,
+    )
+    fear = np.empty(len(states))
+    shadow = np.empty(len(states))
+    modes = []
+    t0 = time.perf_counter()
+    for i, state in enumerate(states):
+        ctx = pipeline.tick(state)
+        fear[i] = ctx["decision"].final_fear
+        shadow[i] = ctx["shadow"].shadow_fear
+        modes.append(ctx["decision"].mode)
+    elapsed = time.perf_counter() - t0
+    return {
+        "us_tick": elapsed / len(states) * 1e6,
+        "shadow_us": pipeline.snapshot()["shadow"]["mean_us"],
+        "mind_us": pipeline.snapshot()["bicameral"]["mean_us"],
+        "fear": fear,
+        "shadow": shadow,
+        "modes": modes,
+        "stats": pipeline.cache_stats(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--sigma", type=float, default=0.002, help="per-tick drift of every organ")
+    args = parser.parse_args()
+
+    states = synthetic.drifting_states(args.ticks, seed=3, sigma=args.sigma)
+    _run(states) # Warm the brain, the engine imports and the allocator
+    base = _run(states)
+
+    print(f"--- QUANTIZED CACHE: {args.ticks} calm ticks (drift sigma {args.sigma}) ---")
+    print(f"{'resolution':>10s} {'shadow hit':>10s} {'mind hit':>9s} {'shadow us':>9s} {'mind us':>8s} {'us/tick':>8s}"
+          f" {'|dFear|':>8s} {'max':>6s} {'mode =':>7s} {'|dShadow|':>9s}")
+
+    def row(label, run, stats=None):
+        d_fear = np.abs(run["fear"] - base["fear"])
+        same = np.mean([a == b for a, b in zip(run["modes"], base["modes"])])
+        hits = ("-", "-") if stats is None else (
+            f"{stats['shadow']['hit_rate']:.1%}", f"{stats['bicameral']['hit_rate']:.1%}"
+        )
+        print(f"{label:>10s} {hits[0]:>10s} {hits[1]:>9s} {run['shadow_us']:9.1f} {run['mind_us']:8.2f}"
+              f" {run['us_tick']:8.0f} {d_fear.mean():8.4f} {d_fear.max():6.3f} {same:7.1%}"
+              f" {np.abs(run['shadow'] - base['shadow']).mean():9.4f}")
+
+    row("uncached", base)
+    row("noise", _run(states, seed=2))
+    for resolution in RESOLUTIONS:
+        run = _run(states, resolution)
+        row(f"{resolution:g}", run, run["stats"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# =================================================================
+# bench_echo.py — THALAMIC JUNCTION THROUGHPUT
+# Per-stream process_echo calls vs one process_echo_batch pass, and
+# single-call latency of the torch and NumPy inference backends
+#
+# Run: python -m benchmarks.bench_echo [--streams 1 100 1000] [--threads 1] [--calls 5000]
+# =================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+import thalamic_junction as tj
+from thalamic_junction import ECHO_KEYS, process_echo, process_echo_batch, set_inference_threads
+
+def synthetic_pulses(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    values = rng.random((n, len(ECHO_KEYS)))
+    phases = rng.random(n)
+    return [
+        {"echo": dict(zip(ECHO_KEYS, row.tolist())), "rhythm_phase": float(phase)}
+        for row, phase in zip(values, phases)
+    ]
+
+def _timed(fn, repeat: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+def call_latencies(pulses, last, calls: int) -> np.ndarray:
+    """Per-call process_echo latency (us) on the current backend."""
+    out = np.empty(calls)
+    n = len(pulses)
+    for i in range(calls):
+        t0 = time.perf_counter_ns()
+        process_echo(pulses[i % n], last[i % n])
+        out[i] = time.perf_counter_ns() - t0
+    return out / 1e3
+
+def backend_agreement(pulses, last) -> float:
+    """Max |torch - numpy| over the raw brain outputs for the given pulses."""
+    import torch
+    features = np.array([tj._echo_features(p, l)[0] for p, l in zip(pulses, last)], dtype=np.float32)
+    with torch.no_grad():
+        reference = tj.get_brain()(torch.from_numpy(features)).numpy()
+    kernel = tj._numpy_kernel()
+    kernel.inputs(len(features))[:] = features
+    return float(np.abs(kernel.forward(len(features)) - reference).max())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    set_inference_threads(args.threads)
+    print(f"--- PROCESS ECHO: intra-op threads = {args.threads} ---")
+    for n in args.streams:
+        pulses, last = synthetic_pulses(n, 1), synthetic_pulses(n, 2)
+        loop = _timed(lambda: [process_echo(p, l) for p, l in zip(pulses, last)], args.repeat)
+        batch = _timed(lambda: process_echo_batch(pulses, last), args.repeat)
+        print(f"{n:6d} streams | per-call {loop * 1e3:8.2f} ms ({n / loop:10.0f} streams/s)"
+              f" | batch {batch * 1e3:8.2f} ms ({n / batch:10.0f} streams/s) | {loop / batch:6.1f}x")
+
+    print(f"--- PROCESS ECHO BACKENDS: {args.calls} single-pulse calls ---")
+    pulses, last = synthetic_pulses(1000, 3), synthetic_pulses(1000, 4)
+    for backend in tj.ECHO_BACKENDS:
+        tj.set_echo_backend(backend)
+        call_latencies(pulses, last, 200) # warm-up (torch import, weight load)
+        lat = call_latencies(pulses, last, args.calls)
+        print(f"{backend:6s} p50 {np.percentile(lat, 50):7.1f} us  p99 {np.percentile(lat, 99):7.1f} us"
+              f"  mean {lat.mean():7.1f} us")
+    tj.set_echo_backend("torch")
+    print(f"max |torch - numpy| raw output: {backend_agreement(pulses, last):.2e}")
+
+if __name__ == "__main__":
+    main()
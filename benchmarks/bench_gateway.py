@@ -0,0 +1,129 @@
+# =================================================================
+# bench_gateway.py — SENSORY GATEWAY TICK LATENCY
+# Sequential polling vs VitalsGateway against a local stub HTTP server
+#
+# Run: python -m benchmarks.bench_gateway [--ticks 50] [--delay-ms 5] [--slow-ms 400]
+# =================================================================
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import requests
+
+from sensory_gateway import VitalSource, VitalsGateway
+from sensory_onchain_ingestor import VITAL_KEYS, GravityWellEngine
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """GET /vital/<n>?delay_ms=<d> -> {"value": x} after d milliseconds."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        delay = float(parse_qs(url.query).get("delay_ms", ["0"])[0])
+        if delay:
+            time.sleep(delay / 1000.0)
+        seed = int(url.path.rsplit("/", 1)[-1] or 0)
+        body = json.dumps({"value": (seed * 0.137 + time.time()) % 1.0}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass # The client already gave up on this endpoint (timeout)
+
+    def log_message(self, *args):
+        pass
+
+class StubVitalsServer:
+    """Local stub of the gas / MEV-relay / liquidity endpoints, served from a thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def make_sources(base_url: str, n: int, delay_ms: float, slow_ms: float, timeout: float):
+    """n sources spread over the vitals; source 0 is the slow endpoint."""
+    return [
+        VitalSource(
+            name=f"source-{i}",
+            url=f"{base_url}/vital/{i}?delay_ms={slow_ms if i == 0 else delay_ms}",
+            key=VITAL_KEYS[i % len(VITAL_KEYS)],
+            timeout=timeout,
+        )
+        for i in range(n)
+    ]
+
+def bench_sequential(sources, ticks: int) -> np.ndarray:
+    session = requests.Session()
+    engine = GravityWellEngine()
+    latencies = []
+    for _ in range(ticks):
+        t0 = time.perf_counter()
+        vitals = {}
+        for s in sources:
+            try:
+                vitals[s.key] = session.get(s.url, timeout=s.timeout).json()["value"]
+            except requests.RequestException:
+                pass
+        engine.update({k: vitals.get(k, 0.0) for k in VITAL_KEYS})
+        latencies.append(time.perf_counter() - t0)
+    session.close()
+    return np.array(latencies)
+
+async def bench_gateway(sources, ticks: int) -> np.ndarray:
+    gateway = VitalsGateway(sources)
+    engine = GravityWellEngine()
+    latencies = []
+    try:
+        for _ in range(ticks):
+            t0 = time.perf_counter()
+            await gateway.tick(engine.update)
+            latencies.append(time.perf_counter() - t0)
+    finally:
+        gateway.close()
+    return np.array(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=5.0)
+    parser.add_argument("--slow-ms", type=float, default=400.0)
+    parser.add_argument("--timeout", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"--- SENSORY GATEWAY: {args.ticks} ticks, {args.delay_ms} ms endpoints, "
+          f"one {args.slow_ms} ms endpoint, {args.timeout * 1000:.0f} ms timeout ---")
+    with StubVitalsServer() as server:
+        for n in (1, 5, 20):
+            sources = make_sources(server.base_url, n, args.delay_ms, args.slow_ms, args.timeout)
+            seq = bench_sequential(sources, args.ticks) * 1000
+            sources = make_sources(server.base_url, n, args.delay_ms, args.slow_ms, args.timeout)
+            conc = asyncio.run(bench_gateway(sources, args.ticks)) * 1000
+            print(f"{n:3d} sources | sequential p50 {np.percentile(seq, 50):7.1f} ms  p99 {np.percentile(seq, 99):7.1f} ms"
+                  f" | gateway p50 {np.percentile(conc, 50):7.1f} ms  p99 {np.percentile(conc, 99):7.1f} ms")
+
+if __name__ == "__main__":
+    main()
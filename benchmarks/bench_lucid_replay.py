@@ -0,0 +1,60 @@
+# =================================================================
+# bench_lucid_replay.py — BICAMERAL BACKTEST THROUGHPUT
+# Object API loop vs lucid_replay, with a bit-for-bit identity check
+#
+# Run: python -m benchmarks.bench_lucid_replay [--records 5000000] [--check 100000]
+# =================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+import bicameral_mind as bm
+
+def object_api(l, s, d, r) -> dict:
+    """Reference: drive BicameralMind record by record."""
+    mind = bm.BicameralMind(history_window=1)
+    out = {k: [] for k in ("mode", "final_fear", "conflict_level", "arrogance", "rigidity", "shame_mult")}
+    for i in range(len(l)):
+        decision = mind.resolve_conflict(l[i], s[i], d[i])
+        mind.judge_past_self(decision, r[i])
+        mind.update_metabolism()
+        out["mode"].append(bm.MODE_CODES[decision["mode"]])
+        out["final_fear"].append(decision["final_fear"])
+        out["conflict_level"].append(decision.get("conflict_level", 0.0))
+        out["arrogance"].append(mind.arrogance_score)
+        out["rigidity"].append(mind.rigidity_score)
+        out["shame_mult"].append(mind.shame_multiplier)
+    return out
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=5_000_000)
+    parser.add_argument("--check", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    l, s, d, r = rng.random((4, args.records))
+    backend = "numba" if bm._kernel() is not None else "python"
+
+    n = min(args.check, args.records)
+    t0 = time.perf_counter()
+    ref = object_api(l[:n].tolist(), s[:n].tolist(), d[:n].tolist(), r[:n].tolist())
+    t_obj = time.perf_counter() - t0
+    replay = bm.lucid_replay(l[:n], s[:n], d[:n], r[:n])
+    identical = all(np.array_equal(np.asarray(ref[k], dtype=replay[k].dtype), replay[k]) for k in ref)
+
+    t0 = time.perf_counter()
+    bm.lucid_replay(l, s, d, r)
+    t_rep = time.perf_counter() - t0
+
+    print(f"--- LUCID REPLAY ({backend} kernel) ---")
+    print(f"object API   : {n / t_obj / 1e6:8.3f} M records/s  ({n} records)")
+    print(f"lucid_replay : {args.records / t_rep / 1e6:8.3f} M records/s  ({args.records} records)")
+    print(f"identical to object API on first {n}: {identical}")
+    return 0 if identical else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
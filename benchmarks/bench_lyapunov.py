@@ -0,0 +1,126 @@
+# =================================================================
+# bench_lyapunov.py — CHAOS ATTRACTOR FIT BENCHMARK
+# Cold curve_fit (calculate_lyapunov_divergence) vs LyapunovEstimator
+#
+# Run: python -m benchmarks.bench_lyapunov [--ticks 2000] [--seed 7]
+# =================================================================
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from sensory_onchain_ingestor import (
+    HISTORY_MAX, LyapunovEstimator, calculate_lyapunov_divergence, chaos_mapping_kernel
+)
+
+def synthetic_series(ticks: int, seed: int) -> np.ndarray:
+    """Reflected random walk in [0, 1] with occasional exponential bursts."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, 0.03, ticks)
+    burst = rng.random(ticks) < 0.01
+    steps[burst] += rng.normal(0.0, 0.15, burst.sum())
+    walk = np.empty(ticks)
+    level = 0.3
+    for i, step in enumerate(steps):
+        level += step
+        level = -level if level < 0.0 else (2.0 - level if level > 1.0 else level)
+        walk[i] = level
+    return walk
+
+def _polish(window: np.ndarray, score: float):
+    """Score of curve_fit converged from the estimator's optimum (None if not fitted)."""
+    if len(window) < 5 or score in (0.05, 0.08):
+        return None
+    est = LyapunovEstimator()
+    est.update(window)
+    x = np.arange(len(window), dtype=np.float64)
+    b = est.growth_rate
+    if b == 0.0:
+        return None
+    g = np.expm1(b * x) / b
+    beta = np.dot(g - g.mean(), window - window.mean()) / np.dot(g - g.mean(), g - g.mean())
+    a = beta / b
+    c = window.mean() - beta * g.mean() - a
+    try:
+        popt, _ = curve_fit(chaos_mapping_kernel, x, window, p0=[a, b, c], maxfev=2000)
+    except Exception:
+        return None
+    linear_projection = np.linspace(window[0], window[-1], len(window))
+    divergence = np.mean(np.abs(chaos_mapping_kernel(x, *popt) - linear_projection))
+    return min(1.0, divergence / 0.35)
+
+def run(ticks: int, seed: int) -> dict:
+    walk = synthetic_series(ticks + HISTORY_MAX, seed)
+    windows = [walk[max(0, i - HISTORY_MAX):i] for i in range(1, len(walk) + 1)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        t0 = time.perf_counter()
+        reference = [calculate_lyapunov_divergence(list(w)) for w in windows]
+        t_ref = time.perf_counter() - t0
+
+    estimator = LyapunovEstimator()
+    t0 = time.perf_counter()
+    incremental = [estimator.update(w) for w in windows]
+    t_inc = time.perf_counter() - t0
+
+    # Cold full-grid search of every window: what the warm start must reproduce
+    t0 = time.perf_counter()
+    full = [float(LyapunovEstimator.fit_windows(w)[0][0]) if len(w) >= 5 else 0.05 for w in windows]
+    t_full = time.perf_counter() - t0
+    fallbacks = 0
+    estimator = LyapunovEstimator()
+    for w in windows:
+        fallbacks += len(w) >= 5 and estimator._warm_fit(np.asarray(w, dtype=np.float64)) is None
+        estimator.update(w)
+
+    # Fully converged reference: curve_fit polished from the estimator's own optimum
+    converged = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for w, score in zip(windows, incremental):
+            polished = _polish(w, score)
+            if polished is not None:
+                converged.append(abs(polished - score))
+
+    diff = np.abs(np.array(reference) - np.array(incremental))
+    n = len(windows)
+    return {
+        "ticks": n,
+        "curve_fit_us": t_ref / n * 1e6,
+        "estimator_us": t_inc / n * 1e6,
+        "full_grid_us": t_full / n * 1e6,
+        "speedup": t_ref / t_inc,
+        "fallback": fallbacks / n,
+        "warm_max": float(np.abs(np.array(full) - np.array(incremental)).max()),
+        "diff_p50": float(np.percentile(diff, 50)),
+        "diff_p99": float(np.percentile(diff, 99)),
+        "diff_max": float(diff.max()),
+        "converged_max": float(max(converged, default=0.0)),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    r = run(args.ticks, args.seed)
+    print(f"--- LYAPUNOV DIVERGENCE: {r['ticks']} ticks, window {HISTORY_MAX} ---")
+    print(f"curve_fit (cold p0)   : {r['curve_fit_us']:9.1f} us/tick")
+    print(f"LyapunovEstimator     : {r['estimator_us']:9.1f} us/tick  ({r['speedup']:.1f}x)")
+    print(f"  cold full-grid fit  : {r['full_grid_us']:9.1f} us/tick  (warm start widened on {r['fallback']:.1%},"
+          f" max |diff| {r['warm_max']:.1e})")
+    print(f"|score diff| vs cold curve_fit p50/p99/max: {r['diff_p50']:.2e} / {r['diff_p99']:.2e} / {r['diff_max']:.2e}")
+    print(f"|score diff| vs converged fit, max: {r['converged_max']:.2e}")
+    cold = r["diff_p99"] <= LyapunovEstimator.SCORE_TOLERANCE
+    converged = r["converged_max"] <= LyapunovEstimator.CONVERGED_TOLERANCE
+    print(f"contract: cold p99 <= {LyapunovEstimator.SCORE_TOLERANCE} {'OK' if cold else 'FAIL'},"
+          f" converged max <= {LyapunovEstimator.CONVERGED_TOLERANCE} {'OK' if converged else 'FAIL'}")
+    return 0 if cold and converged else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+# =================================================================
+# bench_records.py — PER-TICK ALLOCATION & GC CHURN
+# The six per-tick containers (pulse + echo, command, shadow, decision,
+# system state, law state) built as the old string-keyed dicts vs the
+# slotted records: build time, bytes retained per tick, gen-0 collections
+# and collector pause time; then the same GC figures for the live pipeline.
+#
+# Run: python -m benchmarks.bench_records [--ticks 100000] [--pipeline-ticks 3000]
+# =================================================================
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks import synthetic
+from prana_pipeline import PranaPipeline
+from prana_records import Command, Decision, Echo, Pulse, ShadowResult, SystemState, TickState
+
+class GcMeter:
+    """Counts collections per generation and the time spent inside them."""
+
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause_ns = 0
+        self._t0 = 0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._t0 = time.perf_counter_ns()
+        else:
+            self.pause_ns += time.perf_counter_ns() - self._t0
+            self.collections[info["generation"]] += 1
+
+    def __enter__(self):
+        gc.collect()
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        gc.callbacks.remove(self)
+
+def _dict_tick(s: dict, i: int) -> dict:
+    """One tick's containers in the pre-record shapes."""
+    echo = {"stress": s["stress"], "entropy": s["entropy"], "toxicity": s["toxicity"],
+            "glycogen": s["glycogen"], "predictive_error": s["predictive_error"]}
+    system = {k: float(v) for k, v in s.items()}
+    return {
+        "pulse": {"voltage": 0.6, "echo": echo, "rhythm_phase": 0.5, "ts": float(i)},
+        "command": {"action_potential": 0.1, "sensory_gain": 0.2, "energy_gate": 0.3,
+                    "mood_tone": 0.4, "nervous_tension": 0.5},
+        "shadow": {"shadow_fear": 0.1, "panic_probability": 12.0, "panic_interval": [8.0, 16.0],
+                   "samples": 100, "uncertainty_index": 0.01, "interpretation": "STABLE BEHAVIORAL DRIFT",
+                   "status": "MCBS_ENCRYPTED_LOGIC"},
+        "decision": {"final_fear": 0.3, "mode": "DEFAULT", "narrative": "", "conflict_level": 0.0},
+        "next_state": {"system": system, "latent": {}, "fear_index": 0.3, "threat_state": "NORMAL"},
+    }
+
+def _record_tick(s: dict, i: int) -> dict:
+    """The same tick as slotted records (the ctx dict itself stays)."""
+    system = SystemState(**s)
+    return {
+        "pulse": Pulse(0.6, system.echo(), 0.5, float(i)),
+        "command": Command(0.1, 0.2, 0.3, 0.4, 0.5),
+        "shadow": ShadowResult(0.1, 12.0, [8.0, 16.0], 100, 0.01, "STABLE BEHAVIORAL DRIFT"),
+        "decision": Decision(0.3, "DEFAULT", ""),
+        "next_state": TickState(system, {}, 0.3, "NORMAL"),
+    }
+
+def _build(make, systems, ticks: int, keep: int):
+    """Builds `ticks` ticks, retaining the last `keep` (a history window)."""
+    window = [None] * keep
+    n = len(systems)
+    with GcMeter() as meter:
+        t0 = time.perf_counter()
+        for i in range(ticks):
+            window[i % keep] = make(systems[i % n], i)
+        elapsed = time.perf_counter() - t0
+    return elapsed, meter, window
+
+def _retained_bytes(make, systems, keep: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    window = [make(systems[i % len(systems)], i) for i in range(keep)]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del window
+    return size / keep
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--keep", type=int, default=1000, help="ticks retained (history window)")
+    parser.add_argument("--pipeline-ticks", type=int, default=3000)
+    args = parser.parse_args()
+
+    systems = [s["system"] for s in synthetic.market_states(1000, seed=4)]
+    print(f"--- PER-TICK CONTAINERS: {args.ticks} ticks, last {args.keep} retained ---")
+    print(f"{'shape':8s} {'us/tick':>8s} {'B/tick':>8s} {'gen0':>6s} {'gen1':>5s} {'gen2':>5s} {'gc ms':>7s}")
+    for name, make in (("dicts", _dict_tick), ("records", _record_tick)):
+        make(systems[0], 0) # warm
+        elapsed, meter, _ = _build(make, systems, args.ticks, args.keep)
+        g0, g1, g2 = meter.collections
+        print(f"{name:8s} {elapsed / args.ticks * 1e6:8.2f} {_retained_bytes(make, systems, args.keep):8.0f}"
+              f" {g0:6d} {g1:5d} {g2:5d} {meter.pause_ns / 1e6:7.1f}")
+
+    states = synthetic.market_states(args.pipeline_ticks, seed=9)
+    pipeline = PranaPipeline(instrument=False)
+    pipeline.run(states[:100])
+    with GcMeter() as meter:
+        t0 = time.perf_counter()
+        pipeline.run(states)
+        elapsed = time.perf_counter() - t0
+    per_k = 1000 / args.pipeline_ticks
+    g0, g1, g2 = meter.collections
+    print(f"--- PIPELINE: {args.pipeline_ticks} ticks, {elapsed / args.pipeline_ticks * 1e6:.0f} us/tick ---")
+    print(f"per 1000 ticks: gen0 {g0 * per_k:.1f} | gen1 {g1 * per_k:.1f} | gen2 {g2 * per_k:.1f}"
+          f" | gc pause {meter.pause_ns / 1e6 * per_k:.2f} ms ({meter.pause_ns / 1e9 / elapsed:.2%} of tick time)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# =================================================================
+# bench_replay.py — LUCID REPLAY TRAINING vs INFERENCE LATENCY
+# process_echo latency with the background trainer idle and running,
+# plus the trainer's samples/sec.
+#
+# Run: python -m benchmarks.bench_replay [--calls 3000] [--batch 256] [--pause 0.001]
+# =================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+import thalamic_junction as tj
+from benchmarks.bench_echo import synthetic_pulses
+
+def echo_latencies(pulses, calls: int) -> np.ndarray:
+    out = np.empty(calls)
+    n = len(pulses)
+    for i in range(calls):
+        t0 = time.perf_counter()
+        tj.process_echo(pulses[i % n], pulses[(i + 1) % n])
+        out[i] = time.perf_counter() - t0
+    return out * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=3000)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--pause", type=float, default=0.001)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    tj.set_inference_threads(args.threads)
+    pulses = synthetic_pulses(512, 3)
+    buffer = tj.get_replay_buffer()
+    rng = np.random.default_rng(0)
+    for a, b in zip(pulses, pulses[1:]):
+        tj.update_subconscious(float(rng.random()), tj.build_input_vector(a, b))
+    buffer.push_many(rng.random((20000, 12)), rng.random(20000))
+
+    echo_latencies(pulses, 200)
+    idle = echo_latencies(pulses, args.calls)
+
+    trainer = tj.start_subconscious_training(batch_size=args.batch, pause=args.pause, seed=0)
+    time.sleep(0.2)
+    s0, t0 = trainer.samples_trained, time.perf_counter()
+    busy = echo_latencies(pulses, args.calls)
+    rate = (trainer.samples_trained - s0) / (time.perf_counter() - t0)
+    tj.stop_subconscious_training()
+
+    print(f"--- LUCID REPLAY: batch {args.batch}, pause {args.pause * 1000:.1f} ms, "
+          f"{args.threads} intra-op thread(s) ---")
+    print(f"process_echo idle    : p50 {np.percentile(idle, 50):7.1f} us  p99 {np.percentile(idle, 99):7.1f} us")
+    print(f"process_echo training: p50 {np.percentile(busy, 50):7.1f} us  p99 {np.percentile(busy, 99):7.1f} us")
+    print(f"trainer throughput   : {rate:10.0f} samples/s  ({trainer.steps} steps, "
+          f"{trainer.publishes} publishes, loss {trainer.last_loss:.4f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# =================================================================
+# bench_scheduler.py — BREATH CADENCE (Simulated Six Hours)
+# Legacy dynamic_sleep (10 s / 60 s) vs AdaptiveScheduler on a deterministic
+# calm -> build-up -> event horizon -> recovery trajectory (SimulatedClock)
+#
+# Run: python -m benchmarks.bench_scheduler [--sensors 3]
+# =================================================================
+
+import argparse
+
+import numpy as np
+
+from prana_scheduler import AdaptiveScheduler, Sensor, SimulatedClock
+
+HOUR = 3600.0
+# (start, end, gravity, chaos) phases; values ramp linearly between phase edges
+PHASES = (
+    (0.0 * HOUR, 3.0 * HOUR, 0.15, 0.05),   # calm
+    (3.0 * HOUR, 3.5 * HOUR, 0.85, 0.60),   # fear builds toward the horizon
+    (3.5 * HOUR, 4.0 * HOUR, 0.85, 0.60),   # event horizon
+    (4.0 * HOUR, 6.0 * HOUR, 0.15, 0.05),   # recovery
+)
+HORIZON_AT = 3.0 * HOUR + 0.5 * HOUR * (0.78 - 0.15) / (0.85 - 0.15) # gravity crosses 0.78
+END = 6.0 * HOUR
+
+def signals(t: float):
+    prev_g, prev_c = PHASES[0][2], PHASES[0][3]
+    for start, end, g, c in PHASES:
+        if t < end:
+            f = (t - start) / (end - start)
+            return prev_g + (g - prev_g) * f, prev_c + (c - prev_c) * f
+        prev_g, prev_c = g, c
+    return prev_g, prev_c
+
+def legacy():
+    """The old loop: poll, then sleep the returned dynamic_sleep."""
+    t, polls = 0.0, []
+    while t < END:
+        polls.append(t)
+        g, c = signals(t)
+        t += 10.0 if (g > 0.78 and c > 0.5) else 60.0
+    return np.array(polls), len(polls)
+
+def adaptive(n_sensors: int):
+    clock = SimulatedClock()
+    polls = []
+
+    def fetch_batch(names):
+        polls.append(clock.now())
+        return {name: signals(clock.now()) for name in names}
+
+    sensors = [Sensor(f"sensor_{i}") for i in range(n_sensors)]
+    scheduler = AdaptiveScheduler(sensors, fetch_batch, clock=clock)
+
+    def on_batch(readings):
+        g, c = next(iter(readings.values()))
+        scheduler.observe(gravity_index=g, chaos_attractor=c, nervous_tension=0.0)
+    scheduler.run(until=END, on_batch=on_batch)
+    return np.array(polls), sum(s.polls for s in sensors)
+
+def report(label, batches, sensor_polls):
+    calm = np.sum(batches < 3.0 * HOUR) / 3.0
+    gaps = np.diff(batches)
+    starts = batches[:-1]
+    build = gaps[(starts >= 3.0 * HOUR) & (starts < HORIZON_AT)]
+    horizon = gaps[(starts >= HORIZON_AT) & (starts < 4.0 * HOUR)]
+    print(f"{label:10s} batches {len(batches):5d}  sensor polls {sensor_polls:5d}  calm {calm:5.1f}/h  "
+          f"build-up gap mean/max {build.mean():5.1f}/{build.max():5.1f}s  horizon gap {horizon.mean():5.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sensors", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"--- POLLING CADENCE: 6 simulated hours, {args.sensors} sensors ---")
+    batches, _ = legacy()
+    report("legacy", batches, len(batches) * args.sensors)
+    first, polls = adaptive(args.sensors)
+    report("adaptive", first, polls)
+    second, _ = adaptive(args.sensors)
+    deterministic = np.array_equal(first, second)
+    print(f"deterministic under SimulatedClock: {deterministic}")
+    return 0 if deterministic else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+# =================================================================
+# bench_sharding.py — COLONY SCALING (1 → N cores)
+# Markets per second of ShardedPranaExecutor at 0 (inline), 1, 2, ... N workers,
+# with a check that the shard-independent columns match the inline run
+#
+# Run: python -m benchmarks.bench_sharding [--markets 512] [--ticks 50] [--max-workers N]
+# =================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from prana_sharding import SYSTEM_KEYS, ShardedPranaExecutor, usable_cpus
+
+# Columns that do not depend on how the Monte Carlo streams are split
+DETERMINISTIC = ("action_potential", "sensory_gain", "energy_gate", "mood_tone",
+                 "nervous_tension", "gravity_index", "chaos_attractor", "event_horizon")
+
+def _inputs(markets: int, ticks: int, seed: int):
+    vitals = synthetic.vitals_stream(ticks, markets, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    system = rng.random((ticks, markets, len(SYSTEM_KEYS)))
+    return vitals, system
+
+def _run(workers: int, vitals, system, warmup: int):
+    markets = vitals.shape[1]
+    with ShardedPranaExecutor(markets, workers=workers, seed=7) as ex:
+        outs = []
+        for t in range(warmup):
+            ex.tick(vitals[t], system[t], now=1000.0 + t, copy=False)
+        t0 = time.perf_counter()
+        for t in range(warmup, len(vitals)):
+            outs.append(ex.tick(vitals[t], system[t], now=1000.0 + t))
+        elapsed = time.perf_counter() - t0
+    return elapsed, outs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--markets", type=int, default=512)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=25)
+    parser.add_argument("--max-workers", type=int, default=usable_cpus())
+    args = parser.parse_args()
+
+    total = args.warmup + args.ticks
+    vitals, system = _inputs(args.markets, total, seed=3)
+    cpus = usable_cpus()
+
+    print(f"--- COLONY SCALING: {args.markets} markets, {args.ticks} ticks, {cpus} usable CPUs ---")
+    print(f"{'workers':>8s} {'ticks/s':>10s} {'markets/s':>12s} {'ms/tick':>9s} {'speedup':>8s}  match")
+    base, ref = None, None
+    ok = True
+    for workers in [0] + list(range(1, args.max_workers + 1)):
+        elapsed, outs = _run(workers, vitals, system, args.warmup)
+        if ref is None:
+            ref = outs
+        match = all(np.array_equal(a[k], b[k]) for a, b in zip(ref, outs) for k in DETERMINISTIC)
+        ok &= match
+        rate = args.ticks / elapsed
+        base = base or rate
+        label = "inline" if workers == 0 else str(workers)
+        print(f"{label:>8s} {rate:10.1f} {rate * args.markets:12,.0f} {1e3 / rate:9.2f} {rate / base:7.2f}x  {match}")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
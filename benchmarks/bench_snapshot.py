@@ -0,0 +1,95 @@
+# =================================================================
+# bench_snapshot.py — HIBERNATION COST
+# Capture / write / load / restore timings, a round-trip identity check,
+# and tick latency with and without the background writer
+#
+# Run: python -m benchmarks.bench_snapshot [--chains 100] [--history 200] [--ticks 2000]
+# =================================================================
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import prana_snapshot as ps
+import thalamic_junction as tj
+from benchmarks import synthetic
+from bicameral_mind import BicameralMind
+from evolution_pro import MonteCarloEngine
+from prana_pipeline import PranaPipeline
+from sensory_onchain_ingestor import GravityWellEngine
+
+def _best(fn, repeat=20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+def _tick_p99(pipeline, states, on_tick=None) -> float:
+    lat = []
+    for state in states:
+        t0 = time.perf_counter_ns()
+        ctx = pipeline.tick(state)
+        if on_tick is not None:
+            on_tick(ctx)
+        lat.append(time.perf_counter_ns() - t0)
+    return float(np.percentile(lat, 99)) / 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chains", type=int, default=100)
+    parser.add_argument("--history", type=int, default=200)
+    parser.add_argument("--decisions", type=int, default=4096)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = GravityWellEngine(args.chains, history_max=args.history)
+    for row in synthetic.vitals_stream(args.history, args.chains, seed=1):
+        engine.update_many(row)
+    mind = BicameralMind()
+    s = synthetic.bicameral_series(args.decisions, seed=2)
+    for l, sh, d, r in zip(s["logic_fear"], s["shadow_fear"], s["dopamine"], s["reality"]):
+        mind.judge_past_self(mind.resolve_conflict(l, sh, d), r)
+    tj.get_brain()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="prana-snap-"), "snapshot.bin")
+    arrays = ps.capture(engine, mind)
+    t_capture = _best(lambda: ps.capture(engine, mind))
+    t_save = _best(lambda: ps.save_snapshot(arrays, path))
+    t_load = _best(lambda: ps.load_snapshot(path))
+
+    engine2 = GravityWellEngine(args.chains, history_max=args.history)
+    mind2 = BicameralMind()
+    loaded = ps.load_snapshot(path)
+    t_restore = _best(lambda: ps.restore(loaded, engine2, mind2))
+    again = ps.capture(engine2, mind2)
+    identical = all(np.array_equal(arrays[k], again[k]) for k in arrays if not k.startswith("meta/"))
+
+    print(f"--- SNAPSHOT: {args.chains} chains x {args.history} ticks, {args.decisions} decisions ---")
+    print(f"file size : {os.path.getsize(path) / 1024:9.1f} KiB ({len(arrays)} arrays)")
+    print(f"capture   : {t_capture:9.3f} ms (tick thread)")
+    print(f"write     : {t_save:9.3f} ms (writer thread, fsync + rename)")
+    print(f"load      : {t_load:9.3f} ms")
+    print(f"restore   : {t_restore:9.3f} ms")
+    print(f"round trip identical: {identical}")
+
+    states = synthetic.market_states(args.ticks, seed=3)
+    plain = PranaPipeline(shadow_engine=MonteCarloEngine(seed=3), instrument=False)
+    _tick_p99(plain, states[:200])
+    base = _tick_p99(plain, states)
+    writer = ps.SnapshotWriter(path)
+    snap = PranaPipeline(shadow_engine=MonteCarloEngine(seed=3), instrument=False)
+    _tick_p99(snap, states[:200])
+    with_writer = _tick_p99(snap, states, writer.every(10, snap.engine, snap.mind))
+    writer.flush()
+    writer.close()
+    print(f"tick p99  : {base:9.1f} us plain, {with_writer:.1f} us snapshotting every 10 ticks "
+          f"({writer.written} written, {writer.dropped} coalesced)")
+    return 0 if identical else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+# =================================================================
+# bench_startup.py — COLD START COST PER ENGINE MODULE
+# Parses `python -X importtime` for each module, optionally for an older
+# git revision too, so deferred imports can be compared before/after.
+#
+# Run: python -m benchmarks.bench_startup [--ref HEAD~1] [--runs 3]
+# =================================================================
+
+import argparse
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import io
+
+MODULES = (
+    "prana_laws",
+    "bicameral_mind",
+    "evolution_pro",
+    "sensory_onchain_ingestor",
+    "sensory_gateway",
+    "thalamic_junction",
+)
+HEAVY = ("numpy", "scipy.optimize", "torch", "requests")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_profile(module: str, cwd: str) -> dict:
+    """Cumulative import time (ms) of `module` and of any heavy dependency it pulled in."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": cwd, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if proc.returncode != 0:
+        return {"total": float("nan")}
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name == module:
+            profile["total"] = int(cumulative) / 1000.0
+        elif name in HEAVY:
+            profile[name] = int(cumulative) / 1000.0
+    return profile
+
+def best_of(module: str, cwd: str, runs: int) -> dict:
+    profiles = [import_profile(module, cwd) for _ in range(runs)]
+    return min(profiles, key=lambda p: p.get("total", float("inf")))
+
+def export_revision(ref: str, dest: str) -> bool:
+    """Extracts the tracked files of `ref` into `dest` via `git archive`."""
+    proc = subprocess.run(["git", "-C", ROOT, "archive", ref], capture_output=True)
+    if proc.returncode != 0:
+        return False
+    with tarfile.open(fileobj=io.BytesIO(proc.stdout)) as tar:
+        tar.extractall(dest)
+    return True
+
+def report(label: str, cwd: str, runs: int) -> dict:
+    print(f"--- {label} ---")
+    results = {}
+    for module in MODULES:
+        if not os.path.exists(os.path.join(cwd, module + ".py")):
+            continue
+        p = best_of(module, cwd, runs)
+        results[module] = p["total"]
+        deps = ", ".join(f"{k} {v:.0f}" for k, v in p.items() if k != "total")
+        print(f"{module:26s} {p['total']:9.1f} ms   {deps}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ref", help="git revision to compare against (e.g. HEAD~1)")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    after = report("working tree", ROOT, args.runs)
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            if not export_revision(args.ref, tmp):
+                print(f"cannot export {args.ref}")
+                return 1
+            before = report(args.ref, tmp, args.runs)
+        print("--- speedup ---")
+        for module, t in after.items():
+            if module in before:
+                print(f"{module:26s} {before[module]:9.1f} -> {t:7.1f} ms  ({before[module] / t:5.1f}x)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+# =================================================================
+# bench_ticklog.py — TICK LOG RECORD & REPLAY
+# Recording overhead per tick, bytes per tick, memmap open time, replay
+# throughput and an exactness check in a fresh process (new random brain).
+#
+# Run: python -m benchmarks.bench_ticklog [--ticks 5000] [--speed 4]
+# =================================================================
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from evolution_pro import MonteCarloEngine
+from prana_pipeline import PranaPipeline
+from prana_ticklog import TickLog, TickLogWriter, replay
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--speed", type=float, default=4.0, help="N x real-time replay of a 5 ms-cadence log")
+    parser.add_argument("--sampler", default="plain")
+    args = parser.parse_args()
+
+    states = synthetic.market_states(args.ticks, seed=11)
+    pipeline = PranaPipeline(shadow_engine=MonteCarloEngine(seed=5, sampler=args.sampler), instrument=False)
+    pipeline.run(states[:50]) # Warm the engine: the log must capture a mid-run start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.tlg")
+        record_ns = np.empty(args.ticks - 50)
+        with TickLogWriter.for_pipeline(path, pipeline) as log:
+            t_run = time.perf_counter()
+            for i, state in enumerate(states[50:]):
+                ctx = pipeline.tick(state)
+                t0 = time.perf_counter_ns()
+                log.record_tick(ctx)
+                record_ns[i] = time.perf_counter_ns() - t0
+            t_run = time.perf_counter() - t_run
+        size = os.path.getsize(path)
+
+        t0 = time.perf_counter()
+        n = len(TickLog(path))
+        open_ms = (time.perf_counter() - t0) * 1e3
+
+        print(f"--- TICK LOG: {n} ticks recorded ({t_run / n * 1e6:.0f} us/tick live) ---")
+        print(f"record  p50 {np.percentile(record_ns, 50) / 1e3:6.2f} us  p99 {np.percentile(record_ns, 99) / 1e3:6.2f} us"
+              f" | {size / n:.0f} B/tick | open (memmap) {open_ms:.2f} ms")
+
+        report = replay(path)
+        print(f"replay  max speed {report['ticks_per_s']:8.0f} ticks/s | exact (same process): {report['exact']}")
+
+        fresh = subprocess.run(
+            [sys.executable, "-m", "prana_ticklog", path], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        print("fresh process:", fresh.stdout.strip().splitlines()[-1] if fresh.stdout else fresh.stderr.strip())
+
+        short = os.path.join(tmp, "short.tlg")
+        with TickLogWriter(short, buffer_ticks=64) as log:
+            for state in states[:300]:
+                log.record_tick(pipeline.tick(state))
+                time.sleep(0.005)
+        timed = replay(short, speed=args.speed, restore=False, check=False)
+        print(f"replay  {args.speed:g}x real time: {timed['seconds']:.3f}s for {timed['recorded_seconds']:.3f}s recorded"
+              f" (max lag {timed['max_lag_s'] * 1e3:.2f} ms)")
+
+if __name__ == "__main__":
+    main()
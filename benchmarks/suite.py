@@ -0,0 +1,217 @@
+# =================================================================
+# suite.py — PRANA HOT-PATH BENCHMARK CASES
+# Each case builds its inputs once and returns (op, items): `op()` is the
+# timed call and `items` the streams / records it processes per call.
+# =================================================================
+
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from benchmarks import synthetic
+
+Op = Tuple[Callable[[], object], int]
+CASES: Dict[str, Callable[[], Op]] = {}
+
+def case(name: str, **params):
+    """Registers one case per combination of the given scale parameters."""
+    def register(factory):
+        keys = list(params)
+        combos = [()]
+        for key in keys:
+            combos = [c + (v,) for c in combos for v in params[key]]
+        for combo in combos:
+            kwargs = dict(zip(keys, combo))
+            label = ",".join(f"{k}={v}" for k, v in kwargs.items())
+            CASES[f"{name}[{label}]" if label else name] = (
+                lambda kwargs=kwargs: factory(**kwargs)
+            )
+        return factory
+    return register
+
+# -----------------------------------------------------------
+# 1. SHADOW (Monte Carlo)
+# -----------------------------------------------------------
+
+@case("shadow_step", streams=(1, 100))
+def _shadow_step(streams: int) -> Op:
+    from evolution_pro import MonteCarloEngine, shadow_step
+    states = synthetic.market_states(streams, seed=1)
+    engine = MonteCarloEngine(seed=1)
+    return (lambda: [shadow_step(s, engine=engine) for s in states]), streams
+
+@case("mcbs_batch", streams=synthetic.STREAM_SCALES)
+def _mcbs_batch(streams: int) -> Op:
+    from evolution_pro import MonteCarloEngine
+    states = synthetic.market_states(streams, seed=1)
+    stress = np.array([s["system"]["stress"] for s in states])
+    energy = np.array([s["system"]["energy"] for s in states])
+    engine = MonteCarloEngine(seed=1)
+    return (lambda: engine.simulate(stress, energy)), streams
+
+# -----------------------------------------------------------
+# 2. CHAOS ATTRACTOR (Gravity Well)
+# -----------------------------------------------------------
+
+@case("lyapunov_curve_fit", history=(synthetic.HISTORY_SHORT,))
+def _lyapunov_curve_fit(history: int) -> Op:
+    from sensory_onchain_ingestor import calculate_lyapunov_divergence
+    window = synthetic.reflected_walk(history, 1, seed=2)[:, 0].tolist()
+    return (lambda: calculate_lyapunov_divergence(window)), 1
+
+@case("lyapunov_estimator", history=(synthetic.HISTORY_SHORT, synthetic.HISTORY_LONG))
+def _lyapunov_estimator(history: int) -> Op:
+    from sensory_onchain_ingestor import LyapunovEstimator
+    walk = synthetic.reflected_walk(history + 64, 1, seed=2)[:, 0]
+    windows = [walk[i:i + history] for i in range(64)]
+    estimator = LyapunovEstimator()
+    state = {"i": 0}
+
+    def op():
+        state["i"] = (state["i"] + 1) % len(windows)
+        return estimator.update(windows[state["i"]])
+    return op, 1
+
+@case("gravity_update_many", streams=synthetic.STREAM_SCALES,
+      history=(synthetic.HISTORY_SHORT, synthetic.HISTORY_LONG))
+def _gravity_update_many(streams: int, history: int) -> Op:
+    from sensory_onchain_ingestor import GravityWellEngine
+    vitals = synthetic.vitals_stream(history + 32, streams, seed=3)
+    engine = GravityWellEngine(streams, history_max=history)
+    for t in range(history):
+        engine.update_many(vitals[t])
+    state = {"t": history}
+
+    def op():
+        state["t"] = history + (state["t"] + 1 - history) % 32
+        return engine.update_many(vitals[state["t"]])
+    return op, streams
+
+# -----------------------------------------------------------
+# 3. THALAMIC JUNCTION (Neural Echo)
+# -----------------------------------------------------------
+
+@case("process_echo", streams=(1, 100))
+def _process_echo(streams: int) -> Op:
+    from thalamic_junction import process_echo
+    current, last = synthetic.pulses(streams, 4), synthetic.pulses(streams, 5)
+    return (lambda: [process_echo(c, l) for c, l in zip(current, last)]), streams
+
+@case("process_echo_numpy", streams=(1, 100))
+def _process_echo_numpy(streams: int) -> Op:
+    import thalamic_junction as tj
+    current, last = synthetic.pulses(streams, 4), synthetic.pulses(streams, 5)
+
+    def op():
+        tj.set_echo_backend("numpy")
+        try:
+            return [tj.process_echo(c, l) for c, l in zip(current, last)]
+        finally:
+            tj.set_echo_backend("torch")
+    return op, streams
+
+@case("process_echo_batch", streams=synthetic.STREAM_SCALES)
+def _process_echo_batch(streams: int) -> Op:
+    from thalamic_junction import process_echo_batch
+    current, last = synthetic.pulses(streams, 4), synthetic.pulses(streams, 5)
+    return (lambda: process_echo_batch(current, last)), streams
+
+# -----------------------------------------------------------
+# 4. BICAMERAL MIND
+# -----------------------------------------------------------
+
+@case("resolve_conflict", streams=(1, 100))
+def _resolve_conflict(streams: int) -> Op:
+    from bicameral_mind import BicameralMind
+    s = synthetic.bicameral_series(streams, seed=6)
+    rows = list(zip(s["logic_fear"].tolist(), s["shadow_fear"].tolist(), s["dopamine"].tolist()))
+    mind = BicameralMind()
+    return (lambda: [mind.resolve_conflict(*r) for r in rows]), streams
+
+@case("lucid_replay", records=(synthetic.RECORDS_LONG,))
+def _lucid_replay(records: int) -> Op:
+    from bicameral_mind import lucid_replay
+    s = synthetic.bicameral_series(records, seed=6)
+    args = (s["logic_fear"], s["shadow_fear"], s["dopamine"], s["reality"])
+    return (lambda: lucid_replay(*args)), records
+
+# -----------------------------------------------------------
+# 5. PRANA LAWS
+# -----------------------------------------------------------
+
+@case("assert_prana_laws", streams=(1, 100))
+def _assert_prana_laws(streams: int) -> Op:
+    from prana_laws import PranaLawViolation, assert_prana_laws
+    pairs = synthetic.law_pairs(streams, seed=7)
+
+    def op():
+        for prev, curr in pairs:
+            try:
+                assert_prana_laws(prev, curr)
+            except PranaLawViolation:
+                pass
+    return op, streams
+
+@case("validate_prana_laws", records=(synthetic.RECORDS_LONG,))
+def _validate_prana_laws(records: int) -> Op:
+    from prana_laws import validate_prana_laws
+    h = synthetic.law_history(records, seed=7)
+    return (lambda: validate_prana_laws(h["fear"], h["threat"], h["entropy"], h["crash_coherence"])), records
+
+# -----------------------------------------------------------
+# 6. FULL TICK
+# -----------------------------------------------------------
+
+@case("pipeline_tick", instrument=(False, True))
+def _pipeline_tick(instrument: bool) -> Op:
+    from evolution_pro import MonteCarloEngine
+    from prana_pipeline import PranaPipeline
+    states = synthetic.market_states(256, seed=8)
+    pipeline = PranaPipeline(shadow_engine=MonteCarloEngine(seed=8), instrument=instrument)
+    state = {"i": 0}
+
+    def op():
+        state["i"] = (state["i"] + 1) % len(states)
+        return pipeline.tick(states[state["i"]])
+    return op, 1
+
+# -----------------------------------------------------------
+# RUNNER
+# -----------------------------------------------------------
+
+def measure(factory: Callable[[], Op], min_time: float = 0.2, rounds: int = 3) -> Dict[str, float]:
+    """Best-of-`rounds` throughput plus the traced peak memory of one call."""
+    op, items = factory()
+    op() # warm-up (lazy imports, JIT, buffer growth)
+
+    best = float("inf")
+    for _ in range(rounds):
+        calls = 0
+        t0 = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            op()
+            calls += 1
+            elapsed = time.perf_counter() - t0
+        best = min(best, elapsed / calls)
+
+    gc.collect()
+    tracemalloc.start()
+    op()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": items / best,
+        "calls_per_sec": 1.0 / best,
+        "us_per_call": best * 1e6,
+        "peak_kib": peak / 1024.0,
+    }
+
+def select(patterns: List[str]) -> List[str]:
+    if not patterns:
+        return list(CASES)
+    return [name for name in CASES if any(p in name for p in patterns)]
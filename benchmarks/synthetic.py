@@ -0,0 +1,133 @@
+# =================================================================
+# synthetic.py — DETERMINISTIC SYNTHETIC MARKET DATA
+# Every generator is a pure function of its size arguments and seed.
+# =================================================================
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+from prana_laws import THREAT_ORDER
+from sensory_onchain_ingestor import VITAL_KEYS
+from thalamic_junction import ECHO_KEYS
+
+# Stream counts and history lengths used by the suite
+STREAM_SCALES = (1, 100, 10_000)
+HISTORY_SHORT = 20
+HISTORY_LONG = 200
+RECORDS_LONG = 1_000_000
+
+def reflected_walk(ticks: int, streams: int = 1, seed: int = 0,
+                   sigma: float = 0.03, burst_rate: float = 0.01) -> np.ndarray:
+    """
+    (ticks x streams) random walks folded into [0, 1], with occasional
+    large bursts so the chaos attractor has something to find.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, sigma, (ticks, streams))
+    burst = rng.random((ticks, streams)) < burst_rate
+    steps[burst] += rng.normal(0.0, 5.0 * sigma, int(burst.sum()))
+    level = 0.3 + np.cumsum(steps, axis=0)
+    # Folding at 0 and 1 is the same as reflecting every step off the walls
+    return 1.0 - np.abs(np.mod(level, 2.0) - 1.0)
+
+def vitals_stream(ticks: int, streams: int, seed: int = 0) -> np.ndarray:
+    """(ticks x streams x 3) vitals in VITAL_KEYS order."""
+    return np.stack(
+        [reflected_walk(ticks, streams, seed + k) for k in range(len(VITAL_KEYS))], axis=-1
+    )
+
+def market_states(streams: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """One PRANA state dict per stream (system organs, latent layer and vitals)."""
+    rng = np.random.default_rng(seed)
+    cols = rng.random((streams, 12))
+    states = []
+    for row in cols.tolist():
+        states.append({
+            "system": {
+                "stress": row[0],
+                "stress_velocity": row[1] * 0.6,
+                "energy": row[2],
+                "entropy": row[3] * 0.3,
+                "toxicity": row[4],
+                "glycogen": row[5],
+                "predictive_error": row[6] * 0.2,
+                "dopamine": row[7],
+            },
+            "latent": {"crash_coherence": row[8] * 0.6},
+            "vitals": dict(zip(VITAL_KEYS, row[9:12])),
+        })
+    return states
+
+def drifting_states(ticks: int, seed: int = 0, sigma: float = 0.002) -> List[Dict[str, Any]]:
+    """
+    One market over `ticks` ticks in a calm regime: every organ, the latent
+    layer and the vitals drift as slow reflected walks (no bursts).
+    """
+    cols = reflected_walk(ticks, 12, seed, sigma=sigma, burst_rate=0.0).tolist()
+    return [
+        {
+            "system": {
+                "stress": row[0],
+                "stress_velocity": row[1] * 0.6,
+                "energy": row[2],
+                "entropy": row[3] * 0.3,
+                "toxicity": row[4],
+                "glycogen": row[5],
+                "predictive_error": row[6] * 0.2,
+                "dopamine": row[7],
+            },
+            "latent": {"crash_coherence": row[8] * 0.6},
+            "vitals": dict(zip(VITAL_KEYS, row[9:12])),
+        }
+        for row in cols
+    ]
+
+def pulses(streams: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Pulse dicts with a filled echo, as produced by the impulse stage."""
+    rng = np.random.default_rng(seed)
+    values = rng.random((streams, len(ECHO_KEYS)))
+    phases = rng.random(streams)
+    return [
+        {"echo": dict(zip(ECHO_KEYS, row)), "rhythm_phase": phase}
+        for row, phase in zip(values.tolist(), phases.tolist())
+    ]
+
+def bicameral_series(records: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    """logic_fear, shadow_fear, dopamine and reality series for backtests."""
+    rng = np.random.default_rng(seed)
+    logic = reflected_walk(records, 1, seed, sigma=0.05)[:, 0]
+    shadow = np.clip(logic + rng.normal(0.0, 0.15, records), 0.0, 1.0)
+    return {
+        "logic_fear": logic,
+        "shadow_fear": shadow,
+        "dopamine": rng.random(records),
+        "reality": np.clip(logic + rng.normal(0.0, 0.25, records), 0.0, 1.0),
+    }
+
+def law_history(records: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    """fear / threat-code / entropy / crash_coherence columns for law validation."""
+    rng = np.random.default_rng(seed)
+    fear = reflected_walk(records, 1, seed, sigma=0.06)[:, 0]
+    threat = np.digitize(fear, (0.40, 0.60, 0.80)).astype(np.int8)
+    return {
+        "fear": fear,
+        "threat": threat,
+        "entropy": rng.random(records) * 0.3,
+        "crash_coherence": rng.random(records) * 0.6,
+    }
+
+def law_pairs(count: int, seed: int = 0) -> List[tuple]:
+    """(prev, curr) state-dict pairs for assert_prana_laws."""
+    h = law_history(count + 1, seed)
+    states = [
+        {
+            "fear_index": f,
+            "threat_state": THREAT_ORDER[t],
+            "system": {"entropy": e},
+            "latent": {"crash_coherence": c},
+        }
+        for f, t, e, c in zip(h["fear"].tolist(), h["threat"].tolist(),
+                              h["entropy"].tolist(), h["crash_coherence"].tolist())
+    ]
+    return list(zip(states[:-1], states[1:]))
@@ -8,20 +8,251 @@
 # 3. Features "The Humility Protocol" & "Enlightened Equilibrium".
 # =================================================================
 
-from typing import Dict, Any
+from enum import IntEnum
+from typing import Dict, Any, List, Optional
+import os
 import time
+import numpy as np
+
+from prana_cache import QuantizedCache
+from prana_records import Decision
 
 def clamp(x: float, a: float = 0.0, b: float = 1.0) -> float:
     """Clamps value within a specific range."""
     return max(a, min(b, x))
 
+# -----------------------------------------------------------
+# 0. LUCID REPLAY MEMORY (Columnar Decision Store)
+# -----------------------------------------------------------
+
+class Mode(IntEnum):
+    """Decision modes produced by resolve_conflict, as compact codes."""
+    UNKNOWN = 0
+    HARMONY = 1
+    ENLIGHTENED_BALANCE = 2
+    INTUITIVE_LEAP = 3
+    RATIONAL_DENIAL = 4
+    SKEPTICAL_LOGIC = 5
+    DEFAULT = 6
+
+class Verdict(IntEnum):
+    """Outcome of the Humility Protocol for one judged decision."""
+    VALIDATED = 0
+    SHAME = 1    # Paranoia error (INTUITIVE_LEAP, reality < 0.2)
+    TRAUMA = 2   # Blindness error (RATIONAL_DENIAL, reality > 0.6)
+    TRIUMPH = 3  # Intuition confirmed (INTUITIVE_LEAP, reality > 0.6)
+
+MODE_CODES = {m.name: int(m) for m in Mode}
+
+# On-disk record layout of the spill file (packed, 34 bytes per decision)
+DECISION_DTYPE = np.dtype([
+    ("mode", np.uint8),
+    ("verdict", np.uint8),
+    ("fear", np.float64),
+    ("conflict_level", np.float64),
+    ("reality", np.float64),
+    ("timestamp", np.float64),
+])
+
+class DecisionStore:
+    """
+    Bounded, columnar memory of judged decisions.
+    Keeps the last `window` decisions in preallocated NumPy columns (a ring) and
+    can optionally spill every decision to an append-only memory-mapped file.
+    Queries work on the arrays directly; no per-decision dicts are built.
+    """
+
+    COLUMNS = DECISION_DTYPE.names
+
+    def __init__(self, window: int = 4096, spill_path: Optional[str] = None, spill_chunk: int = 65536):
+        self.window = int(window)
+        self._cols = {name: np.zeros(self.window, dtype=DECISION_DTYPE[name]) for name in self.COLUMNS}
+        self._head = 0      # next slot to write
+        self._size = 0      # decisions currently in memory
+        self.total = 0      # decisions ever appended
+        self._spill = _SpillFile(spill_path, spill_chunk) if spill_path else None
+
+    def __len__(self):
+        return self._size
+
+    def append(self, mode: int, verdict: int, fear: float, conflict_level: float,
+               reality: float, timestamp: float):
+        i = self._head
+        cols = self._cols
+        cols["mode"][i] = mode
+        cols["verdict"][i] = verdict
+        cols["fear"][i] = fear
+        cols["conflict_level"][i] = conflict_level
+        cols["reality"][i] = reality
+        cols["timestamp"][i] = timestamp
+        self._head = (i + 1) % self.window
+        self._size = min(self._size + 1, self.window)
+        self.total += 1
+        if self._spill is not None:
+            self._spill.append((mode, verdict, fear, conflict_level, reality, timestamp))
+
+    # --- Slices ---
+
+    def column(self, name: str, last_n: Optional[int] = None) -> np.ndarray:
+        """Chronological copy of one column for the last `last_n` decisions in memory."""
+        n = self._size if last_n is None else min(int(last_n), self._size)
+        col = self._cols[name]
+        start = self._head - n
+        if start >= 0:
+            return col[start:self._head].copy()
+        return np.concatenate((col[start:], col[:self._head]))
+
+    def last(self, last_n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        return {name: self.column(name, last_n) for name in self.COLUMNS}
+
+    def records(self, last_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Dict view for API boundaries and debugging (allocates one dict per decision)."""
+        cols = self.last(last_n)
+        return [
+            {
+                "mode": Mode(int(m)).name,
+                "verdict": Verdict(int(v)).name,
+                "final_fear": float(f),
+                "conflict_level": float(c),
+                "reality": float(r),
+                "timestamp": float(t),
+            }
+            for m, v, f, c, r, t in zip(*(cols[name] for name in self.COLUMNS))
+        ]
+
+    # --- Aggregates ---
+
+    def mode_counts(self, last_n: Optional[int] = None) -> np.ndarray:
+        """Decisions per Mode code over the last N decisions."""
+        return np.bincount(self.column("mode", last_n), minlength=len(Mode))
+
+    def verdict_rate(self, verdicts, last_n: Optional[int] = None) -> np.ndarray:
+        """Per-mode fraction of decisions whose verdict is in `verdicts` (NaN for unseen modes)."""
+        modes = self.column("mode", last_n)
+        hits = np.isin(self.column("verdict", last_n), np.atleast_1d(verdicts))
+        counts = np.bincount(modes, minlength=len(Mode))
+        flagged = np.bincount(modes, weights=hits, minlength=len(Mode))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return flagged / counts
+
+    def shame_rate(self, last_n: Optional[int] = None) -> np.ndarray:
+        """Per-mode rate of error verdicts (SHAME or TRAUMA), indexed by Mode code."""
+        return self.verdict_rate((Verdict.SHAME, Verdict.TRAUMA), last_n)
+
+    # --- Snapshots ---
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Chronological copy of the in-memory window (the spill file persists itself)."""
+        state = {name: self.column(name) for name in self.COLUMNS}
+        state["total"] = np.array(self.total, dtype=np.int64)
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]):
+        """Refills the ring from a state_dict; keeps the newest `window` decisions."""
+        n = min(len(state["mode"]), self.window)
+        for name in self.COLUMNS:
+            self._cols[name][:n] = state[name][len(state[name]) - n:]
+            self._cols[name][n:] = 0
+        self._head = n % self.window
+        self._size = n
+        self.total = int(state["total"])
+
+    def flush(self):
+        if self._spill is not None:
+            self._spill.flush()
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+class _SpillFile:
+    """Append-only decision log, written through a memory map grown in chunks."""
+
+    def __init__(self, path: str, chunk: int):
+        self.path = path
+        self.chunk = max(1, int(chunk))
+        self.count = len(load_decisions(path)) if os.path.exists(path) else 0
+        self._map = None
+        self._capacity = 0
+        self._remap(max(self.count, 1))
+
+    def _remap(self, needed: int):
+        capacity = ((needed + self.chunk - 1) // self.chunk) * self.chunk
+        if self._map is not None:
+            self._map.flush()
+            self._map = None
+        with open(self.path, "ab") as fh:
+            fh.truncate(capacity * DECISION_DTYPE.itemsize)
+        self._map = np.memmap(self.path, dtype=DECISION_DTYPE, mode="r+", shape=(capacity,))
+        self._capacity = capacity
+
+    def append(self, row: tuple):
+        if self.count >= self._capacity:
+            self._remap(self.count + 1)
+        self._map[self.count] = row
+        self.count += 1
+
+    def flush(self):
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self):
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map = None
+        with open(self.path, "ab") as fh:
+            fh.truncate(self.count * DECISION_DTYPE.itemsize)
+
+def load_decisions(path: str) -> np.ndarray:
+    """
+    Read-only memory map of a spill file (structured DECISION_DTYPE records).
+    The unused zero tail of a live (or uncleanly closed) file's last chunk is excluded.
+    """
+    count = os.path.getsize(path) // DECISION_DTYPE.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=DECISION_DTYPE)
+    records = np.memmap(path, dtype=DECISION_DTYPE, mode="r", shape=(count,))
+    # Scan back block by block for the last written record (timestamp != 0)
+    end = count
+    while end > 0:
+        start = max(0, end - 65536)
+        written = np.flatnonzero(records["timestamp"][start:end] != 0.0)
+        if written.size:
+            return records[:start + int(written[-1]) + 1]
+        end = start
+    return records[:0]
+
 class BicameralMind:
-    def __init__(self):
+    def __init__(self, history_window: int = 4096, history_spill: Optional[str] = None,
+                 cache: Optional[QuantizedCache] = None):
         # Meta-cognitive bias tracking to prevent systemic errors
         self.arrogance_score = 0.0   # Tracks over-reliance on Intuition (Shadow)
         self.rigidity_score = 0.0    # Tracks over-reliance on Data (Logic)
         self.shame_multiplier = 1.0  # Scalar for error-correction weight
-        self.history = []            # Lucid replay memory for backtesting
+        # Lucid replay memory for backtesting (bounded, columnar)
+        self.history = DecisionStore(history_window, spill_path=history_spill)
+        # Opt-in memory of recent rulings, valid for one bias state
+        self.cache = cache
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Cognitive bias scores and the decision window, as NumPy arrays."""
+        state = {
+            "arrogance_score": np.array(self.arrogance_score),
+            "rigidity_score": np.array(self.rigidity_score),
+            "shame_multiplier": np.array(self.shame_multiplier),
+        }
+        state.update({"history." + k: v for k, v in self.history.state_dict().items()})
+        return state
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]):
+        self.arrogance_score = float(state["arrogance_score"])
+        self.rigidity_score = float(state["rigidity_score"])
+        self.shame_multiplier = float(state["shame_multiplier"])
+        history = {k[len("history."):]: v for k, v in state.items() if k.startswith("history.")}
+        if history:
+            self.history.load_state_dict(history)
 
     # -----------------------------------------------------------
     # 1. THE CONFLICT RESOLUTION (Decision Engine)
@@ -31,12 +262,25 @@ class BicameralMind:
         logic_fear: float,
         shadow_fear: float,
         dopamine: float
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         """
         Resolves the dissonance between logic-driven data and shadow-driven intuition.
         Uses a dynamic threshold based on past performance (Arrogance/Rigidity).
+        With a cache, the three inputs are snapped to its grid; cached rulings
+        are dropped whenever the bias scores move.
         """
-        
+        cache = self.cache
+        if cache is None:
+            return self._resolve(logic_fear, shadow_fear, dopamine)
+        cache.validate((self.arrogance_score, self.rigidity_score))
+        key, inputs = cache.snap((logic_fear, shadow_fear, dopamine))
+        decision = cache.get(key)
+        if decision is None:
+            decision = self._resolve(*inputs)
+            cache.put(key, decision)
+        return decision.copy()
+
+    def _resolve(self, logic_fear: float, shadow_fear: float, dopamine: float) -> Decision:
         # Calculate market-sensitive dissonance (The gap between Mind and Gut)
         market_tension = abs(logic_fear - shadow_fear)
         dissonance = market_tension ** 0.85
@@ -52,12 +296,12 @@ class BicameralMind:
 
         # Low conflict handling
         if dissonance < 0.15:
-            return {
-                "final_fear": max(logic_fear, shadow_fear),
-                "mode": mode,
-                "narrative": narrative,
-                "conflict_level": 0.0
-            }
+            return Decision(
+                final_fear=max(logic_fear, shadow_fear),
+                mode=mode,
+                narrative=narrative,
+                conflict_level=0.0
+            )
 
         # --- Adaptive intuition threshold ---
         # The threshold for trusting 'gut feeling' adjusts based on past arrogance
@@ -66,43 +310,43 @@ class BicameralMind:
         # Scenario A: Shadow (Intuition) is stronger
         if shadow_fear > logic_fear:
             if dopamine > intuition_threshold:
-                return {
-                    "final_fear": shadow_fear,
-                    "mode": "INTUITIVE_LEAP",
-                    "narrative": "Logic bypassed. Shadow signals high-probability risk.",
-                    "conflict_level": dissonance,
-                    "shadow_high": True
-                }
+                return Decision(
+                    final_fear=shadow_fear,
+                    mode="INTUITIVE_LEAP",
+                    narrative="Logic bypassed. Shadow signals high-probability risk.",
+                    conflict_level=dissonance,
+                    shadow_high=True
+                )
             else:
-                return {
-                    "final_fear": logic_fear,
-                    "mode": "RATIONAL_DENIAL",
-                    "narrative": "Intuition suppressed. Insufficient evidence for shadow action.",
-                    "conflict_level": dissonance,
-                    "shadow_high": True
-                }
+                return Decision(
+                    final_fear=logic_fear,
+                    mode="RATIONAL_DENIAL",
+                    narrative="Intuition suppressed. Insufficient evidence for shadow action.",
+                    conflict_level=dissonance,
+                    shadow_high=True
+                )
 
         # Scenario B: Logic (Data) is stronger
         if logic_fear > shadow_fear:
-            return {
-                "final_fear": logic_fear * 0.7 + shadow_fear * 0.3,
-                "mode": "SKEPTICAL_LOGIC",
-                "narrative": "Data suggests risk, but behavioral indicators remain calm.",
-                "conflict_level": dissonance
-            }
+            return Decision(
+                final_fear=logic_fear * 0.7 + shadow_fear * 0.3,
+                mode="SKEPTICAL_LOGIC",
+                narrative="Data suggests risk, but behavioral indicators remain calm.",
+                conflict_level=dissonance
+            )
 
-        return {
-            "final_fear": logic_fear,
-            "mode": "DEFAULT",
-            "narrative": "Systemic stasis."
-        }
+        return Decision(
+            final_fear=logic_fear,
+            mode="DEFAULT",
+            narrative="Systemic stasis."
+        )
 
     # -----------------------------------------------------------
     # 2. THE CONSCIENCE (Feedback & Self-Correction)
     # -----------------------------------------------------------
     def judge_past_self(
         self,
-        record: Dict[str, Any],
+        record: Decision,
         reality_outcome: float
     ) -> Dict[str, Any]:
         """
@@ -113,14 +357,14 @@ class BicameralMind:
         confession = "Decision validated by reality."
         dopamine_delta = 0.0
         energy_delta = 0.0
+        verdict = Verdict.VALIDATED
 
-        # Store for lucid replay and future evolution
         record["reality"] = reality_outcome
-        self.history.append(record)
 
         # 1. Paranoia error (The Shadow saw a ghost)
         if mode == "INTUITIVE_LEAP" and reality_outcome < 0.2:
             confession = "SHAME: Hallucinated danger. Over-reliance on Shadow bias."
+            verdict = Verdict.SHAME
             dopamine_delta = -0.15 * self.shame_multiplier
             energy_delta = -0.10 * self.shame_multiplier
             self.arrogance_score = clamp(self.arrogance_score + 0.15)
@@ -129,6 +373,7 @@ class BicameralMind:
         # 2. Blindness error (The Logic missed the truth)
         elif mode == "RATIONAL_DENIAL" and reality_outcome > 0.6:
             confession = "TRAUMA: Rational blindness. Suppressed valid Intuition."
+            verdict = Verdict.TRAUMA
             dopamine_delta = -0.30
             energy_delta = -0.20
             self.rigidity_score = clamp(self.rigidity_score + 0.15)
@@ -136,11 +381,22 @@ class BicameralMind:
         # 3. Triumph (Successful synthesis)
         elif mode == "INTUITIVE_LEAP" and reality_outcome > 0.6:
             confession = "TRIUMPH: Evolutionary leap confirmed. Intuition validated."
+            verdict = Verdict.TRIUMPH
             dopamine_delta = +0.10
             energy_delta = +0.05
             self.shame_multiplier = max(1.0, self.shame_multiplier - 0.5)
             self.arrogance_score = max(0.0, self.arrogance_score - 0.1)
 
+        # Store for lucid replay and future evolution
+        self.history.append(
+            MODE_CODES.get(mode, 0),
+            verdict,
+            record.get("final_fear", 0.0),
+            record.get("conflict_level", 0.0),
+            reality_outcome,
+            time.time()
+        )
+
         return {
             "confession": confession,
             "dopamine_delta": dopamine_delta,
@@ -162,3 +418,198 @@ class BicameralMind:
         self.shame_multiplier = max(1.0, self.shame_multiplier - 0.005)
         self.arrogance_score = max(0.0, self.arrogance_score - 0.002)
         self.rigidity_score = max(0.0, self.rigidity_score - 0.002)
+
+
+# -----------------------------------------------------------
+# 4. LUCID REPLAY (Vectorized Backtester)
+# -----------------------------------------------------------
+
+def _replay_kernel(tension, shadow_high, logic_high, dopamine, reality, logic_fear,
+                   shadow_fear, metabolism, arrogance, rigidity, shame,
+                   mode, final_fear, conflict, verdict, arr_out, rig_out, shame_out):
+    """
+    The state recurrence of resolve_conflict -> judge_past_self -> update_metabolism.
+    Mirrors the object API operation by operation (including Python's max/min
+    tie rules and `** 0.85` via libm), so results are bit-identical.
+    Runs compiled under numba when available, else on Python lists.
+    """
+    n = len(tension)
+    for i in range(n):
+        l = logic_fear[i]
+        s = shadow_fear[i]
+        dissonance = tension[i] ** 0.85
+
+        # --- resolve_conflict ---
+        m = 1 # HARMONY
+        if arrogance < 0.2 and rigidity < 0.2:
+            m = 2 # ENLIGHTENED_BALANCE
+        c = 0.0
+        if dissonance < 0.15:
+            f = s if s > l else l
+        elif shadow_high[i]:
+            c = dissonance
+            if dopamine[i] > 0.55 + (arrogance * 0.25):
+                m = 3 # INTUITIVE_LEAP
+                f = s
+            else:
+                m = 4 # RATIONAL_DENIAL
+                f = l
+        elif logic_high[i]:
+            m = 5 # SKEPTICAL_LOGIC
+            f = l * 0.7 + s * 0.3
+            c = dissonance
+        else:
+            m = 6 # DEFAULT
+            f = l
+
+        # --- judge_past_self ---
+        r = reality[i]
+        v = 0 # VALIDATED
+        if m == 3 and r < 0.2:
+            v = 1 # SHAME
+            x = arrogance + 0.15
+            x = x if x < 1.0 else 1.0
+            arrogance = x if x > 0.0 else 0.0
+            x = shame + 0.3
+            shame = x if x < 3.0 else 3.0
+        elif m == 4 and r > 0.6:
+            v = 2 # TRAUMA
+            x = rigidity + 0.15
+            x = x if x < 1.0 else 1.0
+            rigidity = x if x > 0.0 else 0.0
+        elif m == 3 and r > 0.6:
+            v = 3 # TRIUMPH
+            x = shame - 0.5
+            shame = x if x > 1.0 else 1.0
+            x = arrogance - 0.1
+            arrogance = x if x > 0.0 else 0.0
+
+        # --- update_metabolism ---
+        if metabolism:
+            x = shame - 0.005
+            shame = x if x > 1.0 else 1.0
+            x = arrogance - 0.002
+            arrogance = x if x > 0.0 else 0.0
+            x = rigidity - 0.002
+            rigidity = x if x > 0.0 else 0.0
+
+        mode[i] = m
+        final_fear[i] = f
+        conflict[i] = c
+        verdict[i] = v
+        arr_out[i] = arrogance
+        rig_out[i] = rigidity
+        shame_out[i] = shame
+
+_compiled_kernel = None
+
+def _kernel():
+    """numba-compiled replay kernel, or None when numba is not installed."""
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _compiled_kernel = False
+        else:
+            _compiled_kernel = numba.njit(cache=True, nogil=True)(_replay_kernel)
+    return _compiled_kernel or None
+
+def lucid_replay(
+    logic_fear,
+    shadow_fear,
+    dopamine,
+    reality,
+    mind: Optional["BicameralMind"] = None,
+    metabolism: bool = True,
+    update_mind: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Backtests the bicameral loop over historical series. Per record:
+    resolve_conflict(logic, shadow, dopamine) -> judge_past_self(decision, reality)
+    -> update_metabolism() (if metabolism). Bias state starts from `mind`
+    (or a fresh mind) and is written back when update_mind is set.
+
+    Returns arrays: mode (Mode codes), final_fear, conflict_level, verdict
+    (Verdict codes) and the arrogance / rigidity / shame_mult trajectories
+    after each record. Results are identical to driving the object API.
+    """
+    l = np.ascontiguousarray(logic_fear, dtype=np.float64)
+    s = np.ascontiguousarray(shadow_fear, dtype=np.float64)
+    d = np.ascontiguousarray(dopamine, dtype=np.float64)
+    r = np.ascontiguousarray(reality, dtype=np.float64)
+    n = l.shape[0]
+
+    # Stateless parts, vectorized
+    tension = np.abs(l - s)
+    shadow_high = s > l
+    logic_high = l > s
+
+    start = mind or BicameralMind(history_window=1)
+    state = (start.arrogance_score, start.rigidity_score, start.shame_multiplier)
+    out = {
+        "mode": np.empty(n, dtype=np.uint8),
+        "final_fear": np.empty(n),
+        "conflict_level": np.empty(n),
+        "verdict": np.empty(n, dtype=np.uint8),
+        "arrogance": np.empty(n),
+        "rigidity": np.empty(n),
+        "shame_mult": np.empty(n),
+    }
+
+    kernel = _kernel()
+    if kernel is not None:
+        kernel(tension, shadow_high, logic_high, d, r, l, s, metabolism, *state, *out.values())
+    else:
+        # Pure-Python scan over lists (no numpy scalar boxing in the loop)
+        cols = [[0] * n for _ in out]
+        _replay_kernel(tension.tolist(), shadow_high.tolist(), logic_high.tolist(),
+                       d.tolist(), r.tolist(), l.tolist(), s.tolist(), metabolism, *state, *cols)
+        for key, col in zip(out, cols):
+            out[key][:] = col
+
+    if mind is not None and update_mind and n:
+        mind.arrogance_score = float(out["arrogance"][-1])
+        mind.rigidity_score = float(out["rigidity"][-1])
+        mind.shame_multiplier = float(out["shame_mult"][-1])
+    return out
+
+# -----------------------------------------------------------
+# 5. CROSS-MARKET CONFLICT RESOLUTION (One Tick, Many Minds)
+# -----------------------------------------------------------
+
+def resolve_conflict_many(logic_fear, shadow_fear, dopamine, arrogance=0.0, rigidity=0.0) -> Dict[str, np.ndarray]:
+    """
+    resolve_conflict for N independent markets in one pass; arrogance and
+    rigidity are each market's bias scores (scalars broadcast).
+    Inputs of any shape broadcast together; returns arrays of that shape:
+    mode (Mode codes), final_fear, conflict_level. Results are identical to
+    calling resolve_conflict per market (`** 0.85` via libm).
+    """
+    l, s, d, arrogance, rigidity = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (logic_fear, shadow_fear, dopamine, arrogance, rigidity))
+    )
+    shape = l.shape
+    l, s, d, arrogance, rigidity = (np.ravel(x) for x in (l, s, d, arrogance, rigidity))
+
+    tension = np.abs(l - s)
+    dissonance = np.array([t ** 0.85 for t in tension.tolist()], dtype=np.float64)
+    calm = dissonance < 0.15
+    shadow_high = ~calm & (s > l)
+    logic_high = ~calm & (l > s)
+    leap = shadow_high & (d > 0.55 + (arrogance * 0.25))
+
+    mode = np.where((arrogance < 0.2) & (rigidity < 0.2), Mode.ENLIGHTENED_BALANCE, Mode.HARMONY)
+    mode = np.select(
+        [calm, leap, shadow_high, logic_high],
+        [mode, Mode.INTUITIVE_LEAP, Mode.RATIONAL_DENIAL, Mode.SKEPTICAL_LOGIC],
+        Mode.DEFAULT
+    ).astype(np.uint8)
+    final_fear = np.select(
+        [calm, leap, logic_high],
+        [np.maximum(l, s), s, l * 0.7 + s * 0.3],
+        l
+    )
+    conflict_level = np.where(shadow_high | logic_high, dissonance, 0.0)
+    return {"mode": mode.reshape(shape), "final_fear": final_fear.reshape(shape),
+            "conflict_level": conflict_level.reshape(shape)}
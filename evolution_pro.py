@@ -4,61 +4,346 @@
 # INNOVATION: Monte Carlo Behavioral Simulation (MCBS)
 # =================================================================
 
-import statistics
-import random
-from typing import Dict
+import math
+import warnings
+import numpy as np
+from statistics import NormalDist
+from typing import Dict, Optional, Tuple
+
+from prana_cache import QuantizedCache
+from prana_records import ShadowResult, SystemState
+
+# Default number of simulated 'realities' per market state
+NUM_SIMULATIONS = 100
+# Upper bound on floats drawn per vectorized chunk (keeps memory flat at 10^5+ sims)
+CHUNK_ELEMENTS = 1 << 20
+# Shadow outcome above which a simulated crowd is considered in panic
+PANIC_THRESHOLD = 0.6
+# Uniform draw strategies: plain pseudo-random, antithetic pairs (u, 1-u),
+# scrambled Sobol (randomized quasi-Monte Carlo), one draw per equal stratum
+SAMPLERS = ("plain", "antithetic", "sobol", "stratified")
+# Independent randomized replicates per run; their spread is the confidence interval
+REPLICATES = 4
+# Ceiling on simulations per state when sampling to a tolerance
+MAX_SIMULATIONS = 10_000
 
 def clamp(x: float, a: float = 0.0, b: float = 1.0) -> float:
     """Clamps the value between a minimum and maximum range."""
     return max(a, min(b, x))
 
-def shadow_step(state: Dict) -> Dict:
+# -----------------------------------------------------------
+# 1. MCBS ENGINE (Vectorized Monte Carlo Core)
+# -----------------------------------------------------------
+
+class MonteCarloEngine:
+    """
+    Batched Monte Carlo Behavioral Simulation.
+    Scores N market states in one vectorized pass, drawing from a seeded
+    numpy.random.Generator so every run is reproducible.
+
+    Non-plain samplers split num_simulations into `replicates` replicates and
+    round each up to what the sampler needs (even for antithetic, a power of
+    two for sobol), so the fixed budget per state can grow: 100 becomes 104
+    antithetic or 128 sobol draws. `simulations` holds the effective budget
+    and a warning is raised when it differs from num_simulations.
+    """
+
+    def __init__(
+        self,
+        num_simulations: int = NUM_SIMULATIONS,
+        rng: Optional[np.random.Generator] = None,
+        seed: Optional[int] = None,
+        sampler: str = "plain",
+        replicates: int = REPLICATES,
+        confidence: float = 0.95,
+        max_simulations: int = MAX_SIMULATIONS
+    ):
+        if num_simulations < 2:
+            raise ValueError("MCBS requires at least 2 simulations per state")
+        if sampler not in SAMPLERS:
+            raise ValueError(f"unknown sampler {sampler!r} (expected one of {SAMPLERS})")
+        if replicates < 2:
+            raise ValueError("MCBS requires at least 2 replicates for a confidence interval")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("confidence must lie in (0, 1)")
+        self.num_simulations = int(num_simulations)
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.sampler = sampler
+        self.replicates = int(replicates)
+        self.confidence = float(confidence)
+        self.max_simulations = max(int(max_simulations), self.num_simulations)
+        self.replicate_size = _replicate_size(sampler, self.num_simulations // self.replicates)
+        self.simulations = (
+            self.num_simulations if sampler == "plain" else self.replicate_size * self.replicates
+        )
+        if self.simulations != self.num_simulations:
+            warnings.warn(
+                f"{sampler} sampler draws {self.simulations} simulations per state "
+                f"({self.replicates} x {self.replicate_size}), not num_simulations={self.num_simulations}",
+                stacklevel=2,
+            )
+
+    def simulate(self, stress, energy, tolerance: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Runs the simulations for a batch of states.
+        Returns float64 arrays: shadow_fear (mean outcome), panic_probability
+        (fraction of outcomes > PANIC_THRESHOLD, 0..1), uncertainty_index
+        (sample standard deviation of the outcomes), ci_low / ci_high (the
+        `confidence` interval on panic_probability) and samples (int64 draws
+        used per state).
+
+        With `tolerance`, each state keeps drawing replicates until the
+        interval's half-width is at most `tolerance` (or max_simulations is
+        reached), so calm states settle after a couple of replicates.
+        """
+        stress = np.atleast_1d(np.asarray(stress, dtype=np.float64))
+        energy = np.broadcast_to(np.asarray(energy, dtype=np.float64), stress.shape)
+        if tolerance is not None or self.sampler != "plain":
+            return self._simulate_replicates(stress, energy, tolerance)
+        n_states = stress.shape[0]
+        total = self.num_simulations
+
+        # Chan's parallel merge of chunk means / M2 keeps stdev stable at any N
+        mean = np.zeros(n_states)
+        m2 = np.zeros(n_states)
+        panic = np.zeros(n_states, dtype=np.int64)
+        seen = 0
+
+        chunk = max(2, min(total, CHUNK_ELEMENTS // max(1, n_states)))
+        stress_col = stress[:, None]
+        drag_col = (energy * 0.5)[:, None]
+        buf = np.empty(n_states * chunk)
+
+        while seen < total:
+            k = min(chunk, total - seen)
+            out = buf[:n_states * k].reshape(n_states, k)
+            # Placeholder for PRANA's proprietary 'Pain Threshold' logic:
+            # stress * U(0.8, 1.2) - energy * 0.5, built in place
+            self.rng.random(out=out)
+            np.multiply(out, 0.4, out=out)
+            np.add(out, 0.8, out=out)
+            np.multiply(out, stress_col, out=out)
+            np.subtract(out, drag_col, out=out)
+            np.clip(out, 0.0, 1.0, out=out)
+
+            panic += np.count_nonzero(out > PANIC_THRESHOLD, axis=1)
+            c_mean = out.mean(axis=1)
+            c_m2 = ((out - c_mean[:, None]) ** 2).sum(axis=1)
+
+            n_new = seen + k
+            delta = c_mean - mean
+            mean += delta * (k / n_new)
+            m2 += c_m2 + delta * delta * (seen * k / n_new)
+            seen = n_new
+
+        samples = np.full(n_states, total, dtype=np.int64)
+        ci_low, ci_high = _wilson(panic, samples, self.confidence)
+        return {
+            "shadow_fear": mean,
+            "panic_probability": panic / total,
+            "uncertainty_index": np.sqrt(m2 / (total - 1)),
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+            "samples": samples,
+        }
+
+    # --- Variance reduction & sequential stopping ---
+
+    def _uniforms(self, n_states: int, k: int) -> np.ndarray:
+        """One replicate: k uniforms per state, drawn with the engine's sampler."""
+        if self.sampler == "antithetic":
+            half = self.rng.random((n_states, k // 2))
+            return np.concatenate((half, 1.0 - half), axis=1)
+        if self.sampler == "stratified":
+            return (np.arange(k) + self.rng.random((n_states, k))) / k
+        if self.sampler == "sobol":
+            from scipy.stats import qmc
+            # One scrambled 1-D Sobol net per replicate, then an independent random
+            # digital shift per state (XOR keeps exactly one point per 1/k cell);
+            # a scrambled engine per state would cost milliseconds per thousand states.
+            # The scramble seed is drawn from rng (not rng itself, whose SeedSequence
+            # is not in bit_generator.state), so a restored state replays the net
+            scramble = int(self.rng.integers(1 << 63))
+            net = qmc.Sobol(d=1, scramble=True, seed=scramble).random_base2(int(math.log2(k)))
+            grid = (net.T * 2.0 ** 53).astype(np.uint64)
+            shift = self.rng.integers(0, 1 << 53, size=(n_states, 1), dtype=np.uint64)
+            return (grid ^ shift) * 2.0 ** -53
+        return self.rng.random((n_states, k))
+
+    def _simulate_replicates(self, stress, energy, tolerance: Optional[float]) -> Dict[str, np.ndarray]:
+        n_states = stress.shape[0]
+        k = self.replicate_size
+        resolved = self.sampler in ("sobol", "stratified")
+        if tolerance is not None and resolved:
+            # Large enough that two agreeing replicates can meet the tolerance
+            z = NormalDist().inv_cdf(0.5 + self.confidence / 2.0)
+            k = max(k, _replicate_size(self.sampler, math.ceil(z / (2.0 * math.sqrt(2.0) * tolerance))))
+        mean = np.zeros(n_states)
+        m2 = np.zeros(n_states)
+        panic = np.zeros(n_states, dtype=np.int64)
+        rep_sum = np.zeros(n_states)
+        rep_sq = np.zeros(n_states)
+        reps = np.zeros(n_states, dtype=np.int64)
+        ci_low = np.zeros(n_states)
+        ci_high = np.ones(n_states)
+        active = np.arange(n_states)
+
+        while active.size:
+            out = self._uniforms(active.size, k)
+            np.multiply(out, 0.4, out=out)
+            np.add(out, 0.8, out=out)
+            np.multiply(out, stress[active, None], out=out)
+            np.subtract(out, (energy[active] * 0.5)[:, None], out=out)
+            np.clip(out, 0.0, 1.0, out=out)
+
+            hits = np.count_nonzero(out > PANIC_THRESHOLD, axis=1)
+            panic[active] += hits
+            rep_sum[active] += hits / k
+            rep_sq[active] += (hits / k) ** 2
+            c_mean = out.mean(axis=1)
+            c_m2 = ((out - c_mean[:, None]) ** 2).sum(axis=1)
+            seen = reps[active] * k
+            n_new = seen + k
+            delta = c_mean - mean[active]
+            mean[active] += delta * (k / n_new)
+            m2[active] += c_m2 + delta * delta * (seen * k / n_new)
+            reps[active] += 1
+
+            r = reps[active]
+            if self.sampler == "plain":
+                low, high = _wilson(panic[active], r * k, self.confidence)
+            else:
+                low, high = _replicate_interval(
+                    rep_sum[active], rep_sq[active], r, self.confidence, k if resolved else None
+                )
+            ci_low[active], ci_high[active] = low, high
+            if tolerance is None:
+                done = r >= self.replicates
+            else:
+                # A t-interval from two agreeing antithetic replicates is overconfident
+                done = (r >= (2 if resolved else self.replicates)) & ((high - low) * 0.5 <= tolerance)
+                done |= (r + 1) * k > self.max_simulations
+            active = active[~done]
+
+        samples = reps * k
+        return {
+            "shadow_fear": mean,
+            "panic_probability": panic / samples,
+            "uncertainty_index": np.sqrt(m2 / (samples - 1)),
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+            "samples": samples,
+        }
+
+def _replicate_size(sampler: str, k: int) -> int:
+    """Draws per replicate: even for antithetic pairs, a power of two for Sobol balance."""
+    k = max(2, k)
+    if sampler == "antithetic":
+        return k + (k & 1)
+    if sampler == "sobol":
+        return 1 << (k - 1).bit_length()
+    return k
+
+def _wilson(hits: np.ndarray, n: np.ndarray, confidence: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilson score interval for a binomial proportion (stays honest at 0 and 1)."""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    n = np.asarray(n, dtype=np.float64)
+    p = hits / n
+    denom = 1.0 + z * z / n
+    centre = (p + z * z / (2.0 * n)) / denom
+    half = z * np.sqrt(p * (1.0 - p) / n + z * z / (4.0 * n * n)) / denom
+    return np.maximum(centre - half, 0.0), np.minimum(centre + half, 1.0)
+
+def _replicate_interval(total, total_sq, reps, confidence: float,
+                        cells: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Student-t interval over independent replicate estimates (randomized QMC style).
+    Stratified and Sobol replicates only resolve the panic fraction to 1/cells,
+    so a few agreeing replicates prove little: the interval keeps a floor of one
+    straddling cell's variance, 1 / (4 cells^2) per replicate.
+    """
+    from scipy.stats import t as student_t
+    reps = np.asarray(reps, dtype=np.float64)
+    p = total / reps
+    low, high = np.zeros_like(p), np.ones_like(p)
+    ok = reps >= 2
+    if not ok.any():
+        return low, high
+    r, p_ok = reps[ok], p[ok]
+    var = np.maximum(total_sq[ok] - r * p_ok * p_ok, 0.0) / (r - 1.0)
+    half_sq = student_t.ppf(0.5 + confidence / 2.0, r - 1.0) ** 2 * var / r
+    if cells is not None:
+        z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+        half_sq += z * z / (4.0 * cells * cells * r)
+    half = np.sqrt(half_sq)
+    low[ok], high[ok] = np.maximum(p_ok - half, 0.0), np.minimum(p_ok + half, 1.0)
+    return low, high
+
+_engine = None
+
+def _default_engine() -> MonteCarloEngine:
+    global _engine
+    if _engine is None:
+        _engine = MonteCarloEngine(NUM_SIMULATIONS)
+    return _engine
+
+# -----------------------------------------------------------
+# 2. NARRATIVE LAYER (The Voice of the Shadow)
+# -----------------------------------------------------------
+
+def interpret_shadow(panic_probability: float, velocity: float) -> str:
+    """Maps the simulated panic risk and stress velocity onto a narrative."""
+    if panic_probability > 0.7:
+        return "CRITICAL HYSTERIA DETECTED"
+    if velocity > 0.4:
+        return "FOMO ACCELERATION"
+    return "STABLE BEHAVIORAL DRIFT"
+
+def shadow_step(state: Dict, engine: Optional[MonteCarloEngine] = None,
+                tolerance: Optional[float] = None, cache: Optional[QuantizedCache] = None) -> ShadowResult:
     """
     Shadow v2.5: Executes multi-layer Monte Carlo simulations to predict 
     the transition from market denial to mass hysteria.
+    With `tolerance` (half-width of the panic interval, as a 0..1 fraction)
+    the shadow simulates only until it is that sure of itself.
+    With a `cache`, (stress, stress_velocity, energy) are snapped to its grid
+    and a grid point is simulated once (keep one cache per engine).
+    Returns a ShadowResult record (reads like the old dict; as_dict() for JSON).
     
     NOTE: Specific mathematical weights and simulation coefficients 
     have been abstracted in this public repository for IP protection.
     """
-    system = state.get("system", {}) or {}
-    stress = float(system.get("stress", 0.0))
-    velocity = float(system.get("stress_velocity", 0.0))
-    energy = float(system.get("energy", 1.0))
+    # `state` is a PRANA state dict, or already its SystemState
+    system = state if type(state) is SystemState else (state.get("system", {}) or {})
+    if type(system) is SystemState:
+        stress, velocity, energy = system.stress, system.stress_velocity, system.energy
+    else:
+        stress = float(system.get("stress", 0.0))
+        velocity = float(system.get("stress_velocity", 0.0))
+        energy = float(system.get("energy", 1.0))
+
+    if cache is not None:
+        grid, (stress, velocity, energy) = cache.snap((stress, velocity, energy))
+        key = grid + (tolerance,)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit.copy()
 
     # --- MONTE CARLO BEHAVIORAL SIMULATION (MCBS) ---
-    # Simulating 100 possible market 'realities' based on crowd psychology
-    num_simulations = 100
-    shadow_outcomes = []
-    
-    # We simulate crowd behavior through variable reaction thresholds
-    for _ in range(num_simulations):
-        # Stochastic methods are used to determine psychological resilience.
-        # This logic simulates the lag between market shocks and mass panic.
-        
-        # Placeholder for PRANA's proprietary 'Pain Threshold' logic
-        # Real-world parameters are injected during private deployment
-        sim_outcome = (stress * random.uniform(0.8, 1.2)) - (energy * 0.5)
-        shadow_outcomes.append(clamp(sim_outcome))
-
-    # Statistical analysis of the simulated outcomes
-    mean_shadow = statistics.mean(shadow_outcomes)
-    std_dev = statistics.stdev(shadow_outcomes)
-    
-    # Calculating the probability of systemic collapse (Hysteria Risk)
-    panic_probability = len([x for x in shadow_outcomes if x > 0.6]) / num_simulations
+    # Simulating possible market 'realities' based on crowd psychology
+    result = (engine or _default_engine()).simulate(stress, energy, tolerance=tolerance)
+    panic_probability = float(result["panic_probability"][0])
 
-    # Narrative Interpretation (The Voice of the Shadow)
-    if panic_probability > 0.7:
-        interpretation = "CRITICAL HYSTERIA DETECTED"
-    elif velocity > 0.4:
-        interpretation = "FOMO ACCELERATION"
-    else:
-        interpretation = "STABLE BEHAVIORAL DRIFT"
-
-    return {
-        "shadow_fear": round(mean_shadow, 3),
-        "panic_probability": round(panic_probability * 100, 1),
-        "uncertainty_index": round(std_dev, 4),
-        "interpretation": interpretation,
-        "status": "MCBS_ENCRYPTED_LOGIC"
-    }
+    shadow = ShadowResult(
+        shadow_fear=round(float(result["shadow_fear"][0]), 3),
+        panic_probability=round(panic_probability * 100, 1),
+        panic_interval=[round(float(result["ci_low"][0]) * 100, 1), round(float(result["ci_high"][0]) * 100, 1)],
+        samples=int(result["samples"][0]),
+        uncertainty_index=round(float(result["uncertainty_index"][0]), 4),
+        interpretation=interpret_shadow(panic_probability, velocity),
+        status="MCBS_ENCRYPTED_LOGIC"
+    )
+    if cache is not None:
+        cache.put(key, shadow)
+        return shadow.copy()
+    return shadow
@@ -0,0 +1,540 @@
+# =================================================================
+# prana_api.py — PRANA VOICE (Read-Only HTTP Snapshot API)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Zero-Compute Readers over an Atomically Swapped Snapshot
+# =================================================================
+
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+import zlib
+import numpy as np
+from typing import Any, Dict, Iterator, Optional
+
+from prana_records import Record
+from prana_threads import lower_thread_priority
+
+# Organs published per tick, each also served on its own route
+ORGANS = ("gravity", "shadow", "echo", "bicameral", "laws")
+# SSE comment sent to idle subscribers so proxies keep the stream open
+KEEPALIVE_SECONDS = 15.0
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Record):
+        return value.as_dict()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+# One element of an If-None-Match list: optional weak prefix, quoted opaque tag
+# (empty elements are allowed by the list syntax)
+_ENTITY_TAG = re.compile(r'[ \t]*(?:(?:W/)?("[^"]*"))?[ \t]*(?:,|$)')
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    RFC 9110 If-None-Match: `*` matches any current snapshot, otherwise the
+    comma-separated entity-tags are compared weakly (W/ prefixes ignored).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    pos, end = 0, len(if_none_match)
+    while pos < end:
+        m = _ENTITY_TAG.match(if_none_match, pos)
+        if m is None or m.end() == pos:
+            return False # Malformed list: never a match
+        if m.group(1) == opaque:
+            return True
+        pos = m.end()
+    return False
+
+def _view(value):
+    return value.as_dict() if isinstance(value, Record) else value
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+
+# -----------------------------------------------------------
+# 1. THE SNAPSHOT (Immutable, Pre-Serialized)
+# -----------------------------------------------------------
+
+class PublishedSnapshot:
+    """One tick's outputs, serialized once. Never mutated after construction."""
+
+    __slots__ = ("seq", "ts", "body", "etag", "organs", "event")
+
+    def __init__(self, seq: int, ts: float, payload: Dict[str, Any]):
+        self.seq = seq
+        self.ts = ts
+        self.body = _dumps(payload)
+        self.etag = f'"{seq}-{zlib.crc32(self.body):08x}"'
+        # Per-organ bodies share the snapshot's ETag: they change exactly when it does
+        self.organs = {name: _dumps(payload.get(name)) for name in ORGANS}
+        self.event = b"id: %d\nevent: tick\ndata: %s\n\n" % (seq, self.body)
+
+class SnapshotPublisher:
+    """
+    Holds the latest PublishedSnapshot. The tick thread serializes and swaps
+    the reference (atomic in CPython); readers only ever read `current`, so
+    a request can never trigger, block or observe a half-built computation.
+    """
+
+    def __init__(self):
+        self.current: Optional[PublishedSnapshot] = None
+        self._seq = 0
+        self._changed = threading.Condition()
+
+    def publish(self, payload: Dict[str, Any], ts: Optional[float] = None) -> PublishedSnapshot:
+        self._seq += 1
+        snapshot = PublishedSnapshot(self._seq, time.time() if ts is None else ts, payload)
+        self.current = snapshot
+        with self._changed:
+            self._changed.notify_all()
+        return snapshot
+
+    def publish_tick(self, ctx: Dict[str, Any]) -> PublishedSnapshot:
+        """Publishes a PranaPipeline tick context (usable as run(on_tick=...))."""
+        return self.publish(tick_payload(ctx), ts=ctx.get("pulse", {}).get("ts"))
+
+    def wait_newer(self, seq: int, timeout: Optional[float] = None) -> Optional[PublishedSnapshot]:
+        """Blocks until a snapshot newer than `seq` exists; None on timeout."""
+        snapshot = self.current
+        if snapshot is not None and snapshot.seq > seq:
+            return snapshot
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self.current is not None and self.current.seq > seq, timeout
+            )
+        snapshot = self.current
+        return snapshot if snapshot is not None and snapshot.seq > seq else None
+
+    def stream(self, last_seq: int = 0, keepalive: float = KEEPALIVE_SECONDS) -> Iterator[bytes]:
+        """SSE frames for every snapshot after `last_seq`; slow readers skip to the latest."""
+        while True:
+            snapshot = self.wait_newer(last_seq, keepalive)
+            if snapshot is None:
+                yield b": keepalive\n\n"
+                continue
+            last_seq = snapshot.seq
+            yield snapshot.event
+
+def tick_payload(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """The published view of one PranaPipeline tick context (records flattened to dicts)."""
+    decision = ctx.get("decision") or {}
+    next_state = ctx.get("next_state") or {}
+    return {
+        "gravity": _view(ctx.get("gravity")),
+        "shadow": _view(ctx.get("shadow")),
+        "echo": _view(ctx.get("command")),
+        "bicameral": {
+            "mode": decision.get("mode"),
+            "final_fear": decision.get("final_fear"),
+            "conflict_level": decision.get("conflict_level", 0.0),
+            "narrative": decision.get("narrative"),
+        },
+        "laws": {
+            "fear_index": next_state.get("fear_index"),
+            "threat_state": next_state.get("threat_state"),
+            "violations": ctx.get("violations", 0),
+        },
+    }
+
+# -----------------------------------------------------------
+# 2. HTTP SURFACE (Flask)
+# -----------------------------------------------------------
+
+class SnapshotFastPath:
+    """
+    WSGI middleware answering GET /v1/snapshot and /v1/<organ> straight from
+    the published bytes (headers included), ahead of Flask's routing, CORS and
+    response objects. Everything else falls through to the wrapped app.
+    """
+
+    PREFIX = "/v1/"
+
+    def __init__(self, app, publisher: SnapshotPublisher):
+        self.app = app
+        self.publisher = publisher
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        snapshot = self.publisher.current
+        if snapshot is None or environ.get("REQUEST_METHOD") != "GET" or not path.startswith(self.PREFIX):
+            return self.app(environ, start_response)
+        name = path[len(self.PREFIX):]
+        body = snapshot.body if name == "snapshot" else snapshot.organs.get(name)
+        if body is None:
+            return self.app(environ, start_response)
+
+        headers = [
+            ("ETag", snapshot.etag),
+            ("Cache-Control", "no-cache"),
+            ("X-Prana-Seq", str(snapshot.seq)),
+            ("Access-Control-Allow-Origin", "*"),
+            ("Access-Control-Expose-Headers", "ETag, X-Prana-Seq"),
+        ]
+        if etag_matches(environ.get("HTTP_IF_NONE_MATCH", ""), snapshot.etag):
+            start_response("304 NOT MODIFIED", headers)
+            return [b""]
+        headers += [("Content-Type", "application/json"), ("Content-Length", str(len(body)))]
+        start_response("200 OK", headers)
+        return [body]
+
+def create_app(publisher: SnapshotPublisher):
+    """
+    Read-only Flask app over `publisher`:
+      GET /v1/snapshot        latest tick, all organs
+      GET /v1/<organ>         one organ (gravity, shadow, echo, bicameral, laws)
+      GET /v1/stream          server-sent events, one `tick` event per publish
+      GET /health             sequence number and snapshot age
+    JSON routes honour If-None-Match with 304 Not Modified. Snapshot and organ
+    reads are served by SnapshotFastPath; the Flask routes below define the same
+    contract and answer while nothing is published yet (503) or for unknown organs.
+    """
+    from flask import Flask, Response, abort, request, stream_with_context
+    from flask_cors import CORS
+
+    app = Flask(__name__)
+    CORS(app, expose_headers=["ETag", "X-Prana-Seq"])
+
+    def _latest() -> PublishedSnapshot:
+        snapshot = publisher.current
+        if snapshot is None:
+            abort(503, description="no tick published yet")
+        return snapshot
+
+    def _respond(snapshot: PublishedSnapshot, body: bytes) -> Response:
+        headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache", "X-Prana-Seq": str(snapshot.seq)}
+        if etag_matches(request.headers.get("If-None-Match", ""), snapshot.etag):
+            return Response(status=304, headers=headers)
+        return Response(body, mimetype="application/json", headers=headers)
+
+    @app.get("/v1/snapshot")
+    def snapshot():
+        latest = _latest()
+        return _respond(latest, latest.body)
+
+    @app.get("/v1/<organ>")
+    def organ(organ: str):
+        latest = _latest()
+        body = latest.organs.get(organ)
+        if body is None:
+            abort(404)
+        return _respond(latest, body)
+
+    @app.get("/v1/stream")
+    def stream():
+        last = request.headers.get("Last-Event-ID", "")
+        start = int(last) if last.isdigit() else 0
+        return Response(
+            stream_with_context(publisher.stream(start)),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/health")
+    def health():
+        latest = publisher.current
+        return {
+            "seq": 0 if latest is None else latest.seq,
+            "age_s": None if latest is None else round(time.time() - latest.ts, 3),
+        }
+
+    app.wsgi_app = SnapshotFastPath(app.wsgi_app, publisher)
+    return app
+
+def serve(publisher: SnapshotPublisher, host: str = "127.0.0.1", port: int = 8080,
+          nice: int = 10, switch_interval: Optional[float] = None):
+    """
+    Threaded werkzeug server for the full create_app() contract (the SSE
+    stream included). werkzeug closes the connection after every response,
+    so heavy polling belongs on SnapshotServer; any WSGI server can host
+    create_app() instead.
+
+    Connection threads run niced so the tick thread wins the CPU. With
+    `switch_interval` the GIL switch interval is shortened while the server
+    is open (it is process-wide) and restored by server_close().
+    """
+    from werkzeug.serving import ThreadedWSGIServer, WSGIRequestHandler
+
+    class NicedHandler(WSGIRequestHandler):
+        protocol_version = "HTTP/1.1" # Chunked SSE frames
+
+        def handle(self):
+            lower_thread_priority(nice)
+            super().handle()
+
+    class PranaWSGIServer(ThreadedWSGIServer):
+        saved_interval: Optional[float] = None
+
+        def server_close(self):
+            super().server_close()
+            if self.saved_interval is not None:
+                sys.setswitchinterval(self.saved_interval)
+                self.saved_interval = None
+
+    server = PranaWSGIServer(host, port, create_app(publisher), handler=NicedHandler)
+    if switch_interval is not None:
+        server.saved_interval = sys.getswitchinterval()
+        sys.setswitchinterval(switch_interval)
+    return server
+
+# -----------------------------------------------------------
+# 3. POLLING SERVER (asyncio, No WSGI)
+# -----------------------------------------------------------
+# Dashboards poll; they do not need routing, CORS preflight or a WSGI
+# environ per request. SnapshotServer answers the read routes on one event
+# loop thread from per-snapshot response bytes (built once per tick, on the
+# loop thread), so a poll costs a header scan and a socket write.
+
+_MAX_HEAD = 16 * 1024
+_REASONS = {200: b"OK", 304: b"Not Modified", 400: b"Bad Request", 404: b"Not Found",
+            405: b"Method Not Allowed", 431: b"Request Header Fields Too Large",
+            503: b"Service Unavailable"}
+
+class _PollProtocol(asyncio.Protocol):
+    """One keep-alive connection of a SnapshotServer."""
+
+    def __init__(self, server: "SnapshotServer"):
+        self.server = server
+        self.transport = None
+        self.buffer = b""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server._connections.add(self)
+
+    def connection_lost(self, exc):
+        self.transport = None
+        self.server._connections.discard(self)
+
+    def data_received(self, data: bytes):
+        buffer = self.buffer + data if self.buffer else data
+        while self.transport is not None:
+            end = buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(buffer) > _MAX_HEAD:
+                    self._reply(self.server.error(431), close=True)
+                    buffer = b""
+                break
+            head, buffer = buffer[:end], buffer[end + 4:]
+            self._handle(head)
+        self.buffer = buffer
+
+    def _handle(self, head: bytes):
+        lines = head.split(b"\r\n")
+        parts = lines[0].split()
+        if len(parts) != 3 or not parts[2].startswith(b"HTTP/1."):
+            self._reply(self.server.error(400), close=True)
+            return
+        method, target, version = parts
+        if_none_match, close = "", version == b"HTTP/1.0"
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"if-none-match":
+                if_none_match = value.strip().decode("latin-1")
+            elif name == b"connection":
+                token = value.strip().lower()
+                close = token == b"close" or (close and token != b"keep-alive")
+            elif name in (b"content-length", b"transfer-encoding") and value.strip() not in (b"0", b""):
+                self._reply(self.server.error(400), close=True) # GET polls carry no body
+                return
+        if method not in (b"GET", b"HEAD"):
+            self._reply(self.server.error(405), close=True)
+            return
+        response = self.server.respond(target.decode("latin-1"), if_none_match)
+        if method == b"HEAD":
+            response = response[:response.index(b"\r\n\r\n") + 4]
+        self._reply(response, close)
+
+    def _reply(self, response: bytes, close: bool = False):
+        if close:
+            response = response.replace(b"\r\n", b"\r\nConnection: close\r\n", 1)
+        self.transport.write(response)
+        if close:
+            self.transport.close()
+            self.transport = None
+
+class SnapshotServer:
+    """
+    Read-only HTTP/1.1 keep-alive server for polling dashboards:
+      GET|HEAD /v1/snapshot, /v1/<organ>, /health
+    with the same bodies, ETags and If-None-Match handling as create_app().
+    Runs its own event loop on a niced thread; the SSE stream and CORS
+    preflight stay with create_app() (this server answers them 404 / 405).
+    With `switch_interval` the process-wide GIL switch interval is shortened
+    while the server runs, so a tick waiting on the GIL is not parked behind
+    a busy loop for a full default slice; stop() restores it.
+    """
+
+    def __init__(self, publisher: SnapshotPublisher, host: str = "127.0.0.1", port: int = 8081,
+                 nice: int = 10, switch_interval: Optional[float] = None):
+        self.publisher = publisher
+        self.host = host
+        self.port = int(port)
+        self.nice = int(nice)
+        self.switch_interval = switch_interval
+        self._saved_interval: Optional[float] = None
+        self.server_port: Optional[int] = None
+        self._responses: Dict[str, tuple] = {}
+        self._connections = set()
+        self._seq = -1
+        self._loop = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    # --- Responses (event loop thread only) ---
+
+    @staticmethod
+    def _render(status: int, headers, body: bytes = b"") -> bytes:
+        lines = [b"HTTP/1.1 %d %s" % (status, _REASONS[status])]
+        lines += [b"%s: %s" % (k.encode(), v.encode()) for k, v in headers]
+        return b"\r\n".join(lines) + b"\r\n\r\n" + body
+
+    def error(self, status: int) -> bytes:
+        body = _dumps({"error": _REASONS[status].decode()})
+        return self._render(status, [("Content-Type", "application/json"),
+                                     ("Content-Length", str(len(body)))], body)
+
+    def _bodies(self, snapshot: PublishedSnapshot) -> Dict[str, tuple]:
+        if snapshot.seq != self._seq:
+            headers = [
+                ("ETag", snapshot.etag),
+                ("Cache-Control", "no-cache"),
+                ("X-Prana-Seq", str(snapshot.seq)),
+                ("Access-Control-Allow-Origin", "*"),
+                ("Access-Control-Expose-Headers", "ETag, X-Prana-Seq"),
+            ]
+            not_modified = self._render(304, headers)
+            self._responses = {
+                name: (self._render(200, headers + [("Content-Type", "application/json"),
+                                                    ("Content-Length", str(len(body)))], body), not_modified)
+                for name, body in [("snapshot", snapshot.body)] + list(snapshot.organs.items())
+            }
+            self._seq = snapshot.seq
+        return self._responses
+
+    def respond(self, target: str, if_none_match: str = "") -> bytes:
+        path = target.split("?", 1)[0]
+        snapshot = self.publisher.current
+        if path == "/health":
+            body = _dumps({
+                "seq": 0 if snapshot is None else snapshot.seq,
+                "age_s": None if snapshot is None else round(time.time() - snapshot.ts, 3),
+            })
+            return self._render(200, [("Content-Type", "application/json"), ("Cache-Control", "no-cache"),
+                                      ("Content-Length", str(len(body)))], body)
+        if not path.startswith(SnapshotFastPath.PREFIX):
+            return self.error(404)
+        name = path[len(SnapshotFastPath.PREFIX):]
+        if name != "snapshot" and name not in ORGANS:
+            return self.error(404)
+        if snapshot is None:
+            return self.error(503)
+        full, not_modified = self._bodies(snapshot)[name]
+        return not_modified if etag_matches(if_none_match, snapshot.etag) else full
+
+    # --- Lifecycle ---
+
+    def _run(self):
+        lower_thread_priority(self.nice)
+        loop = self._loop = asyncio.new_event_loop()
+        try:
+            self._server = loop.run_until_complete(
+                loop.create_server(lambda: _PollProtocol(self), self.host, self.port)
+            )
+        except BaseException as exc:
+            self._error = exc
+            self._ready.set()
+            loop.close()
+            return
+        self.server_port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            for conn in list(self._connections):
+                if conn.transport is not None:
+                    conn.transport.close()
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+
+    def start(self) -> "SnapshotServer":
+        if self._thread is None:
+            self._ready.clear()
+            self._error = None
+            self._thread = threading.Thread(target=self._run, name="prana-poll", daemon=True)
+            self._thread.start()
+            self._ready.wait()
+            if self._error is not None:
+                self._thread = None
+                raise self._error
+            if self.switch_interval is not None:
+                self._saved_interval = sys.getswitchinterval()
+                sys.setswitchinterval(self.switch_interval)
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+        if self._saved_interval is not None:
+            sys.setswitchinterval(self._saved_interval)
+            self._saved_interval = None
+
+    def __enter__(self) -> "SnapshotServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+# -----------------------------------------------------------
+# 4. STANDALONE SERVICE (Pipeline Thread + HTTP)
+# -----------------------------------------------------------
+
+def run_pipeline(publisher: SnapshotPublisher, interval: float = 1.0, pipeline=None,
+                 state_source=None, stop: Optional[threading.Event] = None):
+    """Ticks a PranaPipeline every `interval` seconds and publishes each tick."""
+    from prana_pipeline import PranaPipeline
+
+    pipeline = pipeline or PranaPipeline()
+    stop = stop or threading.Event()
+    state_source = state_source or (lambda: {"system": {}})
+    while not stop.is_set():
+        started = time.perf_counter()
+        publisher.publish_tick(pipeline.tick(state_source()))
+        stop.wait(max(0.0, interval - (time.perf_counter() - started)))
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PRANA read API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--poll-port", type=int, default=None,
+                        help="also serve the polling routes from a SnapshotServer on this port")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between ticks")
+    args = parser.parse_args()
+
+    print("--- PRANA VOICE: READ API ONLINE ---")
+    voice = SnapshotPublisher()
+    threading.Thread(target=run_pipeline, args=(voice, args.interval), name="prana-tick", daemon=True).start()
+    if args.poll_port is not None:
+        SnapshotServer(voice, args.host, args.poll_port).start()
+    server = serve(voice, args.host, args.port)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
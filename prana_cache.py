@@ -0,0 +1,108 @@
+# =================================================================
+# prana_cache.py — PRANA HABITS (Quantized-Input Memoization)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: The Organism Stops Re-Deliberating What It Has Just Felt
+# =================================================================
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+# In calm regimes the Shadow and the Bicameral Mind are asked the same
+# question thousands of times with inputs that differ in the fourth decimal.
+# A QuantizedCache snaps those inputs to a grid of `resolution` and remembers
+# the answer for the grid point: the organ is evaluated AT the snapped inputs,
+# so a cached answer is exactly what a fresh evaluation of that grid point
+# would return, and the accuracy cost is the snapping alone (tune it with
+# stats()). Opt-in: nothing is cached unless a cache is handed to the organ.
+# The Shadow's Monte Carlo is where this pays; a bicameral ruling costs about
+# as much as the lookup itself (benchmarks/bench_cache.py has both).
+
+DEFAULT_RESOLUTION = 0.01
+DEFAULT_MAXSIZE = 4096
+
+class QuantizedCache:
+    """
+    Bounded LRU keyed on inputs snapped to a grid of `resolution`.
+    Entries are evicted least-recently-used past `maxsize`, and expire
+    `ttl` seconds (on `clock`) after they were stored when ttl is set.
+    validate(generation) drops everything when the owner's state moved on.
+    """
+
+    def __init__(self, resolution: float = DEFAULT_RESOLUTION, maxsize: int = DEFAULT_MAXSIZE,
+                 ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.resolution = float(resolution)
+        self.maxsize = int(maxsize)
+        self.ttl = None if ttl is None else float(ttl)
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation: Any = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def snap(self, values: Sequence[float]) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+        """(grid key, snapped values) of raw inputs."""
+        res = self.resolution
+        key = tuple(map(round, map(res.__rtruediv__, values))) # round(v / res)
+        return key, tuple(map(res.__mul__, key))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, value = entry
+        if self.ttl is not None and self.clock() >= expires:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        expires = self.clock() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def validate(self, generation: Any):
+        """Clears the cache when `generation` differs from the one it was filled under."""
+        if generation != self._generation:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self._generation = generation
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "resolution": self.resolution,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
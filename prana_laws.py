@@ -1,12 +1,57 @@
 # prana_laws.py — PRANA LAW ENFORCER
 # © 2025 Антоний Илиев Велков
 
+import numpy as np
+
+from prana_records import TickState
+
 def clamp(x, a=0.0, b=1.0):
     return max(a, min(b, float(x)))
 
 class PranaLawViolation(Exception):
     pass
 
+# ────────────────────────────────
+# THREAT ORDER & LAW BITS
+# ────────────────────────────────
+THREAT_ORDER = ("NORMAL", "WARNING", "PANIC", "CRASH_IMMINENT")
+THREAT_CODES = {name: code for code, name in enumerate(THREAT_ORDER)}
+UNKNOWN_THREAT = -1
+NORMAL, WARNING, PANIC, CRASH_IMMINENT = range(4)
+
+LAW_I = 1    # FEAR JUMP LIMIT
+LAW_II = 2   # NO RED WITHOUT WARNING
+LAW_III = 4  # ENTROPY GATE
+LAW_IV = 8   # COLOR ORDER
+LAW_NAMES = {LAW_I: "LAW I", LAW_II: "LAW II", LAW_III: "LAW III", LAW_IV: "LAW IV"}
+
+def encode_threats(threats) -> np.ndarray:
+    """Threat-state names -> int8 codes (UNKNOWN_THREAT for names outside THREAT_ORDER)."""
+    return np.fromiter(
+        (THREAT_CODES.get(t, UNKNOWN_THREAT) for t in threats), dtype=np.int8
+    )
+
+def describe_violations(mask: int) -> list:
+    return [name for bit, name in LAW_NAMES.items() if mask & bit]
+
+
+def _transition(prev, curr) -> tuple:
+    """(p_fear, c_fear, p_threat, c_threat, entropy, crash) of two TickStates or state dicts."""
+    if type(prev) is TickState and type(curr) is TickState:
+        return (
+            prev.fear_index, curr.fear_index, prev.threat_state, curr.threat_state,
+            curr.system.entropy, float(curr.latent.get("crash_coherence", 0.0)),
+        )
+    c_sys = curr.get("system") or {}
+    c_lat = curr.get("latent") or {}
+    return (
+        float(prev.get("fear_index", 0.0)),
+        float(curr.get("fear_index", 0.0)),
+        prev.get("threat_state", "NORMAL"),
+        curr.get("threat_state", "NORMAL"),
+        float(c_sys.get("entropy", 0.0)),
+        float(c_lat.get("crash_coherence", 0.0)),
+    )
 
 def assert_prana_laws(prev: dict, curr: dict):
     """
@@ -15,19 +60,7 @@ def assert_prana_laws(prev: dict, curr: dict):
     """
 
     # --- Извличане ---
-    p_sys = prev.get("system", {})
-    c_sys = curr.get("system", {})
-    p_lat = prev.get("latent", {})
-    c_lat = curr.get("latent", {})
-
-    p_fear = float(prev.get("fear_index", 0.0))
-    c_fear = float(curr.get("fear_index", 0.0))
-
-    p_threat = prev.get("threat_state", "NORMAL")
-    c_threat = curr.get("threat_state", "NORMAL")
-
-    entropy = float(c_sys.get("entropy", 0.0))
-    crash = float(c_lat.get("crash_coherence", 0.0))
+    p_fear, c_fear, p_threat, c_threat, entropy, crash = _transition(prev, curr)
 
     # ────────────────────────────────
     # LAW I: FEAR JUMP LIMIT
@@ -58,11 +91,136 @@ def assert_prana_laws(prev: dict, curr: dict):
     # ────────────────────────────────
     # LAW IV: COLOR ORDER
     # ────────────────────────────────
-    order = ["NORMAL", "WARNING", "PANIC", "CRASH_IMMINENT"]
-    if p_threat in order and c_threat in order:
-        if order.index(c_threat) - order.index(p_threat) > 1:
+    p_code = THREAT_CODES.get(p_threat)
+    c_code = THREAT_CODES.get(c_threat)
+    if p_code is not None and c_code is not None:
+        if c_code - p_code > 1:
             raise PranaLawViolation(
                 f"Threat jump illegal: {p_threat} → {c_threat}"
             )
 
     return True
+
+
+# ────────────────────────────────
+# STREAM MODE (Columnar & Live)
+# ────────────────────────────────
+
+def validate_prana_laws(fear, threat, entropy, crash_coherence) -> np.ndarray:
+    """
+    Колонна проверка на цяла история.
+    Checks every consecutive pair (t-1 → t) of a recorded history in one
+    vectorized pass. `threat` holds THREAT_CODES (see encode_threats);
+    entropy and crash_coherence are the current-state values.
+    Returns a uint8 bitmask per step (LAW_I | LAW_II | LAW_III | LAW_IV);
+    step 0 has no predecessor and is always 0.
+    """
+    fear = np.asarray(fear, dtype=np.float64)
+    threat = np.asarray(threat)
+    entropy = np.asarray(entropy, dtype=np.float64)
+    crash = np.asarray(crash_coherence, dtype=np.float64)
+
+    mask = np.zeros(fear.shape[0], dtype=np.uint8)
+    if fear.shape[0] < 2:
+        return mask
+
+    transition_masks(fear[:-1], fear[1:], threat[:-1], threat[1:], entropy[1:], crash[1:], out=mask[1:])
+    return mask
+
+def transition_masks(p_fear, c_fear, p_threat, c_threat, entropy, crash_coherence,
+                     out: np.ndarray = None) -> np.ndarray:
+    """
+    Elementwise law bitmask of independent transitions prev[i] → curr[i]
+    (e.g. one tick across many markets). Same rules as law_mask.
+    Bits are OR-ed into `out` (a zeroed uint8 array) when given.
+    """
+    p_fear = np.asarray(p_fear, dtype=np.float64)
+    c_fear = np.asarray(c_fear, dtype=np.float64)
+    p_threat = np.asarray(p_threat).astype(np.int16)
+    c_threat = np.asarray(c_threat).astype(np.int16)
+    entropy = np.asarray(entropy, dtype=np.float64)
+    crash_coherence = np.asarray(crash_coherence, dtype=np.float64)
+    c_red = (c_threat == PANIC) | (c_threat == CRASH_IMMINENT)
+    c_panic = c_threat == PANIC
+    known = (p_threat >= 0) & (c_threat >= 0)
+
+    step = np.zeros(c_fear.shape, dtype=np.uint8) if out is None else out
+    step |= ((c_fear - p_fear) > 0.20) * np.uint8(LAW_I)
+    step |= (c_red & (p_threat == NORMAL) & (c_fear < 0.40)) * np.uint8(LAW_II)
+    step |= (c_panic & (entropy < 0.10) & (crash_coherence < 0.35)) * np.uint8(LAW_III)
+    step |= (known & ((c_threat - p_threat) > 1)) * np.uint8(LAW_IV)
+    return step
+
+def law_mask(p_fear: float, c_fear: float, p_code: int, c_code: int,
+             entropy: float, crash: float) -> int:
+    """Scalar bitmask of the laws broken by one transition (codes from THREAT_CODES)."""
+    mask = 0
+    if (c_fear - p_fear) > 0.20:
+        mask |= LAW_I
+    if (c_code == PANIC or c_code == CRASH_IMMINENT) and p_code == NORMAL and c_fear < 0.40:
+        mask |= LAW_II
+    if c_code == PANIC and entropy < 0.10 and crash < 0.35:
+        mask |= LAW_III
+    if p_code >= 0 and c_code >= 0 and c_code - p_code > 1:
+        mask |= LAW_IV
+    return mask
+
+class PranaLawMonitor:
+    """
+    Non-raising law enforcer for the live loop.
+    Every transition is checked; violations are written into preallocated
+    ring arrays (step, mask), where step is the 0-based index of the observed
+    transition. A clean transition between two TickStates creates no
+    containers, strings or exceptions — it only bumps the step counter
+    (state dicts are unpacked through a tuple first).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = int(capacity)
+        self.steps = np.zeros(self.capacity, dtype=np.int64)
+        self.masks = np.zeros(self.capacity, dtype=np.uint8)
+        self.law_counts = np.zeros(9, dtype=np.int64) # indexed by law bit
+        self.step = 0
+        self.violations = 0
+
+    def observe_values(self, p_fear: float, c_fear: float, p_code: int, c_code: int,
+                       entropy: float, crash: float) -> int:
+        mask = law_mask(p_fear, c_fear, p_code, c_code, entropy, crash)
+        if mask:
+            self._record(mask)
+        self.step += 1
+        return mask
+
+    def observe(self, prev: dict, curr: dict) -> int:
+        """Same inputs as assert_prana_laws; returns the violation bitmask instead of raising."""
+        if type(prev) is TickState and type(curr) is TickState:
+            # Read in place: no _transition tuple on the live path
+            return self.observe_values(
+                prev.fear_index, curr.fear_index,
+                THREAT_CODES.get(prev.threat_state, UNKNOWN_THREAT),
+                THREAT_CODES.get(curr.threat_state, UNKNOWN_THREAT),
+                curr.system.entropy, float(curr.latent.get("crash_coherence", 0.0)),
+            )
+        p_fear, c_fear, p_threat, c_threat, entropy, crash = _transition(prev, curr)
+        return self.observe_values(
+            p_fear, c_fear,
+            THREAT_CODES.get(p_threat, UNKNOWN_THREAT),
+            THREAT_CODES.get(c_threat, UNKNOWN_THREAT),
+            entropy, crash,
+        )
+
+    def _record(self, mask: int):
+        slot = self.violations % self.capacity
+        self.steps[slot] = self.step
+        self.masks[slot] = mask
+        for bit in (LAW_I, LAW_II, LAW_III, LAW_IV):
+            if mask & bit:
+                self.law_counts[bit] += 1
+        self.violations += 1
+
+    def recorded(self):
+        """(steps, masks) of the retained violations, oldest first."""
+        n = min(self.violations, self.capacity)
+        start = self.violations - n
+        order = (np.arange(start, self.violations)) % self.capacity
+        return self.steps[order], self.masks[order]
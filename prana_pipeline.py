@@ -0,0 +1,231 @@
+# =================================================================
+# prana_pipeline.py — PRANA TICK PIPELINE (Central Nervous Loop)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Per-Organ Latency Proprioception
+# =================================================================
+
+import time
+import numpy as np
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from bicameral_mind import BicameralMind
+from evolution_pro import MonteCarloEngine, shadow_step
+from prana_cache import QuantizedCache
+from prana_laws import THREAT_CODES, THREAT_ORDER, PranaLawMonitor, assert_prana_laws
+from prana_records import Pulse, SystemState, TickState
+from sensory_onchain_ingestor import GravityWellEngine, fetch_network_vitals
+from thalamic_junction import generate_impulse, process_echo
+
+STAGES = ("impulse", "echo", "gravity", "shadow", "bicameral", "laws")
+
+# Fear thresholds for each threat colour (NORMAL below the first)
+THREAT_THRESHOLDS = (0.40, 0.60, 0.80)
+
+def threat_from_fear(fear: float, prev_threat: str = "NORMAL") -> str:
+    """
+    Maps fear onto THREAT_ORDER. Escalation climbs at most one colour per tick
+    (the Mandatory Sequence); de-escalation is immediate.
+    """
+    target = 0
+    for threshold in THREAT_THRESHOLDS:
+        if fear >= threshold:
+            target += 1
+    prev = THREAT_CODES.get(prev_threat, 0)
+    return THREAT_ORDER[min(target, prev + 1)]
+
+def threat_codes_from_fear(fear, prev_codes) -> np.ndarray:
+    """threat_from_fear across many markets, on THREAT_CODES (int8)."""
+    target = np.zeros(np.shape(fear), dtype=np.int8)
+    for threshold in THREAT_THRESHOLDS:
+        target += np.asarray(fear) >= threshold
+    return np.minimum(target, np.asarray(prev_codes, dtype=np.int8) + 1)
+
+# -----------------------------------------------------------
+# 1. LATENCY HISTOGRAMS (Rolling Proprioception)
+# -----------------------------------------------------------
+
+class LatencyHistogram:
+    """Rolling window of the last `window` latencies (ns); percentiles on demand."""
+
+    def __init__(self, window: int = 4096):
+        self.window = int(window)
+        self._samples = [0] * self.window
+        self._cursor = 0
+        self.count = 0
+
+    def record(self, ns: int):
+        self._samples[self._cursor] = ns
+        self._cursor = (self._cursor + 1) % self.window
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        n = min(self.count, self.window)
+        if n == 0:
+            return {"count": 0, "p50_us": 0.0, "p95_us": 0.0, "p99_us": 0.0, "max_us": 0.0, "mean_us": 0.0}
+        window = np.asarray(self._samples[:n] if n < self.window else self._samples, dtype=np.float64) / 1000.0
+        p50, p95, p99 = np.percentile(window, (50, 95, 99))
+        return {
+            "count": self.count,
+            "p50_us": float(p50),
+            "p95_us": float(p95),
+            "p99_us": float(p99),
+            "max_us": float(window.max()),
+            "mean_us": float(window.mean()),
+        }
+
+    def reset(self):
+        self._cursor = 0
+        self.count = 0
+
+# -----------------------------------------------------------
+# 2. THE PIPELINE (One Heartbeat)
+# -----------------------------------------------------------
+
+class PranaPipeline:
+    """
+    Owns the tick loop:
+    generate_impulse -> process_echo -> gravity well -> shadow_step
+    -> BicameralMind.resolve_conflict -> Prana laws.
+
+    With instrumentation on, every stage is wrapped in perf_counter_ns timers
+    feeding a rolling LatencyHistogram. Switching it off rebinds tick() to
+    an untimed loop, so disabled instrumentation costs nothing.
+    Laws are enforced by a non-raising PranaLawMonitor unless strict=True,
+    in which case assert_prana_laws raises on the first violation.
+    Shadow and Bicameral evaluations are memoized only when given a
+    QuantizedCache (shadow_cache here, BicameralMind(cache=...) for the mind).
+    """
+
+    def __init__(
+        self,
+        engine: Optional[GravityWellEngine] = None,
+        mind: Optional[BicameralMind] = None,
+        shadow_engine: Optional[MonteCarloEngine] = None,
+        vitals_source: Callable[[], Dict[str, float]] = fetch_network_vitals,
+        instrument: bool = True,
+        window: int = 4096,
+        strict: bool = False,
+        *,
+        shadow_tolerance: Optional[float] = None,
+        shadow_cache: Optional[QuantizedCache] = None
+    ):
+        self.engine = engine or GravityWellEngine()
+        self.mind = mind or BicameralMind()
+        self.shadow_engine = shadow_engine
+        self.shadow_tolerance = shadow_tolerance
+        self.shadow_cache = shadow_cache
+        self.vitals_source = vitals_source
+        self.strict = strict
+        self.monitor = PranaLawMonitor()
+        self.histograms = {name: LatencyHistogram(window) for name in STAGES + ("tick",)}
+        self.ticks = 0
+        self._last_pulse: Optional[Pulse] = None
+        self._prev_state: Optional[TickState] = None
+        self._stages = [getattr(self, "_stage_" + name) for name in STAGES]
+        self._timed = [(fn, self.histograms[name]) for name, fn in zip(STAGES, self._stages)]
+        self.set_instrumentation(instrument)
+
+    def set_instrumentation(self, enabled: bool):
+        self.instrumented = bool(enabled)
+        self.tick = self._tick_timed if enabled else self._tick_plain
+
+    # --- Stages (each reads / writes the tick context) ---
+
+    def _stage_impulse(self, ctx: Dict[str, Any]):
+        pulse = generate_impulse(ctx["state"])
+        pulse.echo = ctx["system"].echo()
+        ctx["pulse"] = pulse
+
+    def _stage_echo(self, ctx: Dict[str, Any]):
+        ctx["command"] = process_echo(ctx["pulse"], self._last_pulse)
+        self._last_pulse = ctx["pulse"]
+
+    def _stage_gravity(self, ctx: Dict[str, Any]):
+        vitals = ctx["state"].get("vitals") or self.vitals_source()
+        ctx["vitals"] = vitals
+        ctx["gravity"] = self.engine.update(vitals)
+
+    def _stage_shadow(self, ctx: Dict[str, Any]):
+        ctx["shadow"] = shadow_step(
+            ctx["system"], engine=self.shadow_engine, tolerance=self.shadow_tolerance, cache=self.shadow_cache
+        )
+
+    def _stage_bicameral(self, ctx: Dict[str, Any]):
+        ctx["decision"] = self.mind.resolve_conflict(
+            logic_fear=ctx["gravity"].gravity_index,
+            shadow_fear=ctx["shadow"].shadow_fear,
+            dopamine=ctx["system"].dopamine
+        )
+
+    def _stage_laws(self, ctx: Dict[str, Any]):
+        state = ctx["state"]
+        prev = self._prev_state
+        fear = ctx["decision"].final_fear
+        curr = TickState(
+            ctx["system"],
+            state.get("latent") or {},
+            fear,
+            threat_from_fear(fear, prev.threat_state if prev else "NORMAL"),
+        )
+        if prev is not None:
+            if self.strict:
+                assert_prana_laws(prev, curr)
+                ctx["violations"] = 0
+            else:
+                ctx["violations"] = self.monitor.observe(prev, curr)
+        else:
+            ctx["violations"] = 0
+        ctx["next_state"] = curr
+        self._prev_state = curr
+
+    # --- Tick loops ---
+
+    def _context(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return {"state": state, "system": SystemState.from_dict(state.get("system") or {})}
+
+    def _tick_plain(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        ctx = self._context(state)
+        for stage in self._stages:
+            stage(ctx)
+        self.ticks += 1
+        return ctx
+
+    def _tick_timed(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        clock = time.perf_counter_ns
+        ctx = self._context(state)
+        start = t0 = clock()
+        for stage, histogram in self._timed:
+            stage(ctx)
+            t1 = clock()
+            histogram.record(t1 - t0)
+            t0 = t1
+        self.histograms["tick"].record(t0 - start)
+        self.ticks += 1
+        return ctx
+
+    def run(self, states: Iterable[Dict[str, Any]], on_tick: Optional[Callable[[Dict[str, Any]], None]] = None) -> int:
+        """Drives tick() over a stream of states; returns the number of ticks."""
+        n = 0
+        for state in states:
+            ctx = self.tick(state)
+            if on_tick is not None:
+                on_tick(ctx)
+            n += 1
+        return n
+
+    # --- Introspection ---
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Rolling p50/p95/p99 per stage (and the whole tick), in microseconds."""
+        return {name: h.snapshot() for name, h in self.histograms.items()}
+
+    def reset_histograms(self):
+        for h in self.histograms.values():
+            h.reset()
+
+    def cache_stats(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Hit/miss counters of the shadow and bicameral caches (None when uncached)."""
+        return {
+            "shadow": self.shadow_cache.stats() if self.shadow_cache is not None else None,
+            "bicameral": self.mind.cache.stats() if self.mind.cache is not None else None,
+        }
@@ -0,0 +1,260 @@
+# =================================================================
+# prana_records.py — PRANA CELLS (Slotted Per-Tick Records)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Fixed-Form Cells Instead of Free-Floating Dict Plasma
+# =================================================================
+
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Every organ used to hand the next one a fresh string-keyed dict (two for a
+# pulse, with its nested echo). These records carry the same fields in
+# __slots__: no per-instance __dict__, no key hashing on construction and
+# plain attribute reads on the hot path. For older callers they still read
+# (and write) like the dicts they replace: record["key"], record.get(key, default),
+# `key in record`, keys()/items(), and == against a dict (a field the dict leaves
+# out must still hold its default, so a calm-tick ruling equals the 4-key dict
+# resolve_conflict used to return, but not an empty one). They are not
+# dicts, though: json.dumps(record) raises TypeError, so serialize as_dict(),
+# the plain JSON-ready view used at the API boundary.
+
+def _plain(value):
+    if isinstance(value, Record):
+        return value.as_dict()
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value
+
+def _same(value, other) -> bool:
+    if isinstance(value, Record):
+        return value == other # nested records compare on the other side's keys too
+    return _plain(value) == _plain(other)
+
+class Record:
+    """
+    Base of the slotted records; subclasses list their fields in __slots__
+    and take them in that order as __init__ arguments.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    # field -> Record class, for nested records rebuilt by from_dict
+    NESTED: Dict[str, type] = {}
+    # fields holding records or containers, copied one level down by copy()
+    MUTABLE: Tuple[str, ...] = ()
+    __hash__ = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = tuple(cls.__slots__)
+        cls._KEYS = frozenset(cls.FIELDS)
+        cls._values = attrgetter(*cls.FIELDS)
+        cls._DEFAULT = cls() # What a field the older dict form left out reads as
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Builds a record from a dict view (missing keys take the field defaults)."""
+        if isinstance(data, cls):
+            return data
+        kwargs = {k: data[k] for k in cls.FIELDS if k in data}
+        for key, nested in cls.NESTED.items():
+            if key in kwargs:
+                kwargs[key] = nested.from_dict(kwargs[key] or {})
+        return cls(**kwargs)
+
+    def copy(self):
+        """A record that shares nothing mutable with this one (see MUTABLE)."""
+        clone = type(self)(*self._values(self))
+        for k in self.MUTABLE:
+            setattr(clone, k, getattr(self, k).copy())
+        return clone
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: _plain(getattr(self, k)) for k in self.FIELDS}
+
+    # --- dict compatibility ---
+
+    def __getitem__(self, key: str):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self._KEYS:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}")
+        setattr(self, key, value)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._KEYS else default
+
+    def __contains__(self, key) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.FIELDS
+
+    def values(self) -> List[Any]:
+        return [getattr(self, k) for k in self.FIELDS]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(k, getattr(self, k)) for k in self.FIELDS]
+
+    def __eq__(self, other) -> bool:
+        if type(other) is type(self):
+            return self.values() == other.values()
+        if isinstance(other, dict):
+            if not self._KEYS.issuperset(other):
+                return False
+            default = self._DEFAULT
+            return all(
+                _same(getattr(self, k), other[k] if k in other else getattr(default, k))
+                for k in self.FIELDS
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+# -----------------------------------------------------------
+# 1. SENSORY RECORDS (Pulse, Echo, System State)
+# -----------------------------------------------------------
+
+class Echo(Record):
+    """Organ readings carried by a pulse (the 5 ECHO_KEYS, input-vector order)."""
+
+    __slots__ = ("stress", "entropy", "toxicity", "glycogen", "predictive_error")
+
+    def __init__(self, stress: float = 0.0, entropy: float = 0.0, toxicity: float = 0.0,
+                 glycogen: float = 0.0, predictive_error: float = 0.0):
+        self.stress = stress
+        self.entropy = entropy
+        self.toxicity = toxicity
+        self.glycogen = glycogen
+        self.predictive_error = predictive_error
+
+class Pulse(Record):
+    """generate_impulse's scanning pulse."""
+
+    __slots__ = ("voltage", "echo", "rhythm_phase", "ts")
+    NESTED = {"echo": Echo}
+    MUTABLE = ("echo",)
+
+    def __init__(self, voltage: float = 0.0, echo: Optional[Echo] = None,
+                 rhythm_phase: float = 0.5, ts: float = 0.0):
+        self.voltage = voltage
+        self.echo = Echo() if echo is None else echo
+        self.rhythm_phase = rhythm_phase
+        self.ts = ts
+
+class SystemState(Record):
+    """
+    The organism's `system` organs, floated once per tick.
+    Defaults are the ones the organs assumed for a missing key
+    (full energy, neutral dopamine, everything else at rest).
+    """
+
+    __slots__ = ("stress", "stress_velocity", "energy", "entropy", "toxicity",
+                 "glycogen", "predictive_error", "dopamine")
+
+    def __init__(self, stress: float = 0.0, stress_velocity: float = 0.0, energy: float = 1.0,
+                 entropy: float = 0.0, toxicity: float = 0.0, glycogen: float = 0.0,
+                 predictive_error: float = 0.0, dopamine: float = 0.5):
+        self.stress = float(stress)
+        self.stress_velocity = float(stress_velocity)
+        self.energy = float(energy)
+        self.entropy = float(entropy)
+        self.toxicity = float(toxicity)
+        self.glycogen = float(glycogen)
+        self.predictive_error = float(predictive_error)
+        self.dopamine = float(dopamine)
+
+    def echo(self) -> Echo:
+        return Echo(self.stress, self.entropy, self.toxicity, self.glycogen, self.predictive_error)
+
+# -----------------------------------------------------------
+# 2. ORGAN OUTPUTS (Command, Gravity, Shadow, Decision)
+# -----------------------------------------------------------
+
+class Command(Record):
+    """process_echo's biological commands."""
+
+    __slots__ = ("action_potential", "sensory_gain", "energy_gate", "mood_tone", "nervous_tension")
+
+    def __init__(self, action_potential: float = 0.0, sensory_gain: float = 0.0, energy_gate: float = 0.0,
+                 mood_tone: float = 0.0, nervous_tension: float = 0.0):
+        self.action_potential = action_potential
+        self.sensory_gain = sensory_gain
+        self.energy_gate = energy_gate
+        self.mood_tone = mood_tone
+        self.nervous_tension = nervous_tension
+
+class GravityReading(Record):
+    """One tick of the Event Horizon engine for one chain."""
+
+    __slots__ = ("gravity_index", "chaos_attractor", "event_horizon", "dynamic_sleep", "status")
+
+    def __init__(self, gravity_index: float = 0.0, chaos_attractor: float = 0.0, event_horizon: bool = False,
+                 dynamic_sleep: int = 60, status: str = "OPERATIONAL"):
+        self.gravity_index = gravity_index
+        self.chaos_attractor = chaos_attractor
+        self.event_horizon = event_horizon
+        self.dynamic_sleep = dynamic_sleep
+        self.status = status
+
+class ShadowResult(Record):
+    """shadow_step's verdict (panic figures in percent, as published)."""
+
+    __slots__ = ("shadow_fear", "panic_probability", "panic_interval", "samples",
+                 "uncertainty_index", "interpretation", "status")
+    MUTABLE = ("panic_interval",)
+
+    def __init__(self, shadow_fear: float = 0.0, panic_probability: float = 0.0,
+                 panic_interval: Optional[List[float]] = None, samples: int = 0,
+                 uncertainty_index: float = 0.0, interpretation: str = "",
+                 status: str = "MCBS_ENCRYPTED_LOGIC"):
+        self.shadow_fear = shadow_fear
+        self.panic_probability = panic_probability
+        self.panic_interval = [0.0, 100.0] if panic_interval is None else panic_interval
+        self.samples = samples
+        self.uncertainty_index = uncertainty_index
+        self.interpretation = interpretation
+        self.status = status
+
+class Decision(Record):
+    """resolve_conflict's ruling; judge_past_self fills in `reality`."""
+
+    __slots__ = ("final_fear", "mode", "narrative", "conflict_level", "shadow_high", "reality")
+
+    def __init__(self, final_fear: float = 0.0, mode: str = "DEFAULT", narrative: str = "",
+                 conflict_level: float = 0.0, shadow_high: bool = False, reality: Optional[float] = None):
+        self.final_fear = final_fear
+        self.mode = mode
+        self.narrative = narrative
+        self.conflict_level = conflict_level
+        self.shadow_high = shadow_high
+        self.reality = reality
+
+# -----------------------------------------------------------
+# 3. LAW STATE (What the Law Enforcer Compares)
+# -----------------------------------------------------------
+
+class TickState(Record):
+    """One side of a law transition: organs, latent layer, fear and threat colour."""
+
+    __slots__ = ("system", "latent", "fear_index", "threat_state")
+    NESTED = {"system": SystemState}
+    MUTABLE = ("system", "latent")
+
+    def __init__(self, system: Optional[SystemState] = None, latent: Optional[Dict[str, Any]] = None,
+                 fear_index: float = 0.0, threat_state: str = "NORMAL"):
+        self.system = system if type(system) is SystemState else SystemState.from_dict(system or {})
+        self.latent = {} if latent is None else latent
+        self.fear_index = fear_index
+        self.threat_state = threat_state
@@ -0,0 +1,359 @@
+# =================================================================
+# prana_scheduler.py — PRANA BREATH (Adaptive Sensor Cadence)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Fear-Modulated Respiration with Coalesced Inhalations
+# =================================================================
+
+import asyncio
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Default cadence bounds (seconds); calculate_gravity_well's dynamic_sleep used a fixed 10 / 60
+HORIZON_INTERVAL = 5.0
+CALM_INTERVAL = 120.0
+# Signal levels that count as full urgency on their own axis
+GRAVITY_HORIZON = 0.78   # gravity_index at the event horizon
+CHAOS_HORIZON = 0.5      # chaos_attractor at the event horizon
+TENSION_FULL = 1.0       # summed |delta| of the five organ echoes
+# (gravity, chaos, tension) weights: horizon-level gravity + chaos = urgency 1.0
+DEFAULT_WEIGHTS = (0.5, 0.5, 0.5)
+# Urgency a resting market sits below; it breathes at the calm interval
+REST_URGENCY = 0.2
+
+def clamp(x: float, a: float = 0.0, b: float = 1.0) -> float:
+    return max(a, min(b, x))
+
+def urgency(gravity_index: float, chaos_attractor: float, nervous_tension: float,
+            weights: Tuple[float, float, float] = DEFAULT_WEIGHTS) -> float:
+    """0 (at rest) .. 1 (event horizon) from the three nervous signals."""
+    wg, wc, wt = weights
+    raw = (
+        wg * gravity_index / GRAVITY_HORIZON
+        + wc * chaos_attractor / CHAOS_HORIZON
+        + wt * nervous_tension / TENSION_FULL
+    )
+    return clamp((raw - REST_URGENCY) / (1.0 - REST_URGENCY))
+
+def polling_interval(u: float, min_interval: float, max_interval: float) -> float:
+    """Geometric interpolation: each step of urgency shortens the breath by the same ratio."""
+    return max_interval * (min_interval / max_interval) ** clamp(u)
+
+# -----------------------------------------------------------
+# 1. CLOCKS (Real and Simulated Time)
+# -----------------------------------------------------------
+
+class MonotonicClock:
+    """Wall scheduling on time.monotonic(); waits end early when `wake` is set."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def wait(self, timeout: float, wake: threading.Event) -> bool:
+        return wake.wait(max(0.0, timeout))
+
+class SimulatedClock:
+    """
+    Deterministic clock for tests and replays: waiting advances time instantly.
+    A wake raised by the caller between polls is honoured like the real clock.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.t = float(start)
+
+    def now(self) -> float:
+        return self.t
+
+    def advance(self, seconds: float):
+        self.t += max(0.0, seconds)
+
+    def wait(self, timeout: float, wake: threading.Event) -> bool:
+        if wake.is_set():
+            return True
+        self.advance(timeout)
+        return False
+
+# -----------------------------------------------------------
+# 2. SENSORS (Individual Breathing Rhythms)
+# -----------------------------------------------------------
+
+class Sensor:
+    """
+    One polled input with its own cadence bounds and signal weights, e.g. an
+    on-chain endpoint that tracks gravity and chaos, or an organ feed that
+    tracks nervous tension. `relax` caps how fast the interval may grow per
+    poll, so a single calm reading cannot drop a sensor back to CALM_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_interval: float = HORIZON_INTERVAL,
+        max_interval: float = CALM_INTERVAL,
+        weights: Tuple[float, float, float] = DEFAULT_WEIGHTS,
+        relax: float = 2.0,
+    ):
+        self.name = name
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.weights = weights
+        self.relax = float(relax)
+        self.interval = self.max_interval
+        self.target = self.max_interval
+        self.deadline = 0.0        # first poll is due immediately
+        self.last_poll: Optional[float] = None
+        self.polls = 0
+        self.misses = 0            # batches whose fetch raised
+        self._version = 0          # invalidates superseded heap entries
+
+    def retarget(self, u: float) -> float:
+        self.target = polling_interval(u, self.min_interval, self.max_interval)
+        # Tighten at once, loosen gradually (applied at the next poll)
+        if self.target < self.interval:
+            self.interval = self.target
+        return self.interval
+
+    def relaxed(self) -> float:
+        if self.target > self.interval:
+            self.interval = min(self.target, self.interval * self.relax)
+        return self.interval
+
+# -----------------------------------------------------------
+# 3. THE SCHEDULER (Deadline Heap)
+# -----------------------------------------------------------
+
+class AdaptiveScheduler:
+    """
+    Polls sensors on per-sensor deadlines instead of a fixed sleep.
+
+    * observe() feeds gravity_index / chaos_attractor / nervous_tension; every
+      sensor's interval is recomputed and deadlines that should now be earlier
+      are pulled in (waking a pending wait).
+    * Sensors due within `coalesce` seconds of each other are fetched together
+      through one fetch_batch(names) call, returning {name: reading}.
+    * A fetch_batch that raises counts as a miss for every sensor in the batch
+      (kept in last_error); the sensors are retried one interval later.
+    * All time comes from `clock`; with SimulatedClock a run is fully deterministic.
+    """
+
+    def __init__(
+        self,
+        sensors: Iterable[Sensor],
+        fetch_batch: Callable[[List[str]], Dict[str, Any]],
+        clock=None,
+        coalesce: float = 0.5,
+    ):
+        self.sensors: Dict[str, Sensor] = {s.name: s for s in sensors}
+        self.fetch_batch = fetch_batch
+        self.clock = clock or MonotonicClock()
+        self.coalesce = float(coalesce)
+        self.signals = {"gravity_index": 0.0, "chaos_attractor": 0.0, "nervous_tension": 0.0}
+        self.batches = 0
+        self.last_error: Optional[BaseException] = None
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        start = self.clock.now()
+        for sensor in self.sensors.values():
+            self._schedule(sensor, start)
+
+    # --- Heap ---
+
+    def _schedule(self, sensor: Sensor, deadline: float):
+        sensor.deadline = deadline
+        sensor._version += 1
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, sensor.name, sensor._version))
+
+    def _peek(self) -> Optional[Tuple[float, Sensor]]:
+        while self._heap:
+            deadline, _, name, version = self._heap[0]
+            sensor = self.sensors[name]
+            if version == sensor._version:
+                return deadline, sensor
+            heapq.heappop(self._heap) # superseded by a reschedule
+        return None
+
+    def next_deadline(self) -> Optional[float]:
+        with self._lock:
+            top = self._peek()
+        return None if top is None else top[0]
+
+    # --- Signals ---
+
+    def observe(self, gravity_index: Optional[float] = None, chaos_attractor: Optional[float] = None,
+                nervous_tension: Optional[float] = None):
+        """Updates the nervous signals (None keeps the last value) and retargets every sensor."""
+        for key, value in (("gravity_index", gravity_index), ("chaos_attractor", chaos_attractor),
+                           ("nervous_tension", nervous_tension)):
+            if value is not None:
+                self.signals[key] = float(value)
+        g, c, t = self.signals["gravity_index"], self.signals["chaos_attractor"], self.signals["nervous_tension"]
+        now = self.clock.now()
+        pulled = False
+        with self._lock:
+            for sensor in self.sensors.values():
+                sensor.retarget(urgency(g, c, t, sensor.weights))
+                if sensor.last_poll is None:
+                    continue
+                deadline = max(now, sensor.last_poll + sensor.interval)
+                if deadline < sensor.deadline:
+                    self._schedule(sensor, deadline)
+                    pulled = True
+        if pulled:
+            self._wake.set()
+
+    def observe_gravity(self, result: Dict[str, Any]):
+        """Feeds a calculate_gravity_well / GravityWellEngine.update result."""
+        self.observe(gravity_index=result["gravity_index"], chaos_attractor=result["chaos_attractor"])
+
+    def observe_echo(self, command: Dict[str, Any]):
+        """Feeds a process_echo command."""
+        self.observe(nervous_tension=command["nervous_tension"])
+
+    # --- Polling ---
+
+    def due(self, now: Optional[float] = None) -> List[Sensor]:
+        """Pops every sensor due by now + coalesce (one batch)."""
+        now = self.clock.now() if now is None else now
+        batch = []
+        with self._lock:
+            while True:
+                top = self._peek()
+                if top is None or top[0] > now + self.coalesce:
+                    break
+                heapq.heappop(self._heap)
+                top[1]._version += 1
+                batch.append(top[1])
+        return batch
+
+    def poll_once(self) -> Dict[str, Any]:
+        """Waits for the next deadline (waking early if observe() pulls one in), then fetches one batch."""
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or self._stopped.is_set():
+                return {}
+            self._wake.clear()
+            delay = deadline - self.clock.now()
+            if delay <= 0 or not self.clock.wait(delay, self._wake):
+                break
+        if self._stopped.is_set():
+            return {}
+        batch = self.due()
+        if not batch:
+            return {}
+        readings: Dict[str, Any] = {}
+        failed = True
+        try:
+            readings = self.fetch_batch([s.name for s in batch])
+            failed = False
+        except Exception as exc: # A failing source must not drop its sensors from the heap
+            self.last_error = exc
+        finally:
+            now = self.clock.now()
+            with self._lock:
+                for sensor in batch:
+                    if failed:
+                        sensor.misses += 1
+                        self._schedule(sensor, now + sensor.interval)
+                    else:
+                        sensor.last_poll = now
+                        sensor.polls += 1
+                        self._schedule(sensor, now + sensor.relaxed())
+        self.batches += 1
+        return readings
+
+    def run(self, polls: Optional[int] = None, until: Optional[float] = None,
+            on_batch: Optional[Callable[[Dict[str, Any]], None]] = None) -> int:
+        """Polls until `polls` batches, clock time `until`, or stop(); returns the batch count."""
+        self._stopped.clear()
+        done = 0
+        while (polls is None or done < polls) and not self._stopped.is_set():
+            deadline = self.next_deadline()
+            if deadline is None or (until is not None and deadline > until):
+                break
+            readings = self.poll_once()
+            if self._stopped.is_set():
+                break
+            if on_batch is not None:
+                on_batch(readings)
+            done += 1
+        return done
+
+    def stop(self):
+        """Ends run() promptly, even mid-wait on a long calm interval."""
+        self._stopped.set()
+        self._wake.set()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {"interval": s.interval, "target": s.target, "deadline": s.deadline, "polls": s.polls,
+                   "misses": s.misses}
+            for name, s in self.sensors.items()
+        }
+
+# -----------------------------------------------------------
+# 4. GATEWAY BINDING (On-Chain Vitals)
+# -----------------------------------------------------------
+
+def gateway_sensors(gateway, **kwargs) -> List[Sensor]:
+    """One Sensor per VitalSource of a VitalsGateway (named after the source)."""
+    return [Sensor(source.name, **kwargs) for source in gateway.sources]
+
+async def gateway_fetch(gateway, names: Sequence[str]) -> Dict[str, Any]:
+    """Polls only the named sources, concurrently, in one sweep (for callers already on a loop)."""
+    by_name = {source.name: source for source in gateway.sources}
+    readings = await asyncio.gather(*(gateway.fetch_source(by_name[n]) for n in names))
+    return dict(zip(names, readings))
+
+class GatewayBatchFetch:
+    """
+    Synchronous fetch_batch for AdaptiveScheduler over a VitalsGateway.
+    Sweeps run on `loop` (e.g. the loop already driving gateway.produce) via
+    run_coroutine_threadsafe; without one, a single private loop thread is
+    started on first use and reused for every batch, never one loop per batch.
+    """
+
+    def __init__(self, gateway, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.gateway = gateway
+        self.loop = loop
+        self._owned: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _target(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._owned = threading.Thread(
+                    target=self.loop.run_forever, name="prana-breath-loop", daemon=True
+                )
+                self._owned.start()
+            return self.loop
+
+    def __call__(self, names: Sequence[str]) -> Dict[str, Any]:
+        loop = self._target()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("fetch_batch would block its own event loop; await gateway_fetch() instead")
+        return asyncio.run_coroutine_threadsafe(gateway_fetch(self.gateway, names), loop).result()
+
+    def close(self):
+        """Stops the private loop thread (a loop passed in is left running)."""
+        with self._lock:
+            thread, self._owned = self._owned, None
+            if thread is None:
+                return
+            loop, self.loop = self.loop, None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+def gateway_fetch_batch(gateway, loop: Optional[asyncio.AbstractEventLoop] = None) -> GatewayBatchFetch:
+    """fetch_batch that polls only the due sources, concurrently, in one gateway sweep."""
+    return GatewayBatchFetch(gateway, loop)
@@ -0,0 +1,394 @@
+# =================================================================
+# prana_sharding.py — PRANA COLONY (Multi-Market Shard Executor)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: One Nervous System per Core, One Shared Memory per Colony
+# =================================================================
+
+import multiprocessing as mp
+import os
+import time
+import traceback
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bicameral_mind import resolve_conflict_many
+from evolution_pro import MonteCarloEngine
+from prana_laws import transition_masks
+from prana_pipeline import threat_codes_from_fear
+from sensory_onchain_ingestor import HISTORY_MAX, VITAL_KEYS, GravityWellEngine
+import thalamic_junction
+
+# Per-market system readings, in column order of the `system` input
+SYSTEM_KEYS = thalamic_junction.ECHO_KEYS + ("energy", "dopamine")
+
+# Columnar tick output, one entry per market
+OUTPUT_COLUMNS = (
+    "action_potential", "sensory_gain", "energy_gate", "mood_tone", "nervous_tension",
+    "gravity_index", "chaos_attractor", "event_horizon",
+    "shadow_fear", "panic_probability",
+    "mode", "final_fear", "conflict_level",
+    "threat", "violations",
+)
+
+def colony_layout(n_markets: int, history_max: int = HISTORY_MAX) -> Dict[str, Tuple[Tuple[int, ...], str]]:
+    """name -> (shape, dtype) of every shared array; market is always axis 0."""
+    m = int(n_markets)
+    echo = len(thalamic_junction.ECHO_KEYS)
+    return {
+        # Inputs, written by the parent before each tick
+        "in.vitals": ((m, len(VITAL_KEYS)), "f8"),
+        "in.system": ((m, len(SYSTEM_KEYS)), "f8"),
+        "in.crash_coherence": ((m,), "f8"),
+        # Organism state, owned by the shard that holds the market
+        "gravity.history": ((m, len(VITAL_KEYS), int(history_max)), "f8"),
+        "gravity.head": ((m,), "i8"),
+        "gravity.count": ((m,), "i8"),
+        "gravity.previous_fear": ((m,), "f8"),
+        "echo.last": ((m, echo), "f8"),
+        "echo.has_last": ((m,), "?"),
+        "laws.fear": ((m,), "f8"),
+        "laws.threat": ((m,), "i1"),
+        "laws.has_prev": ((m,), "?"),
+        # Outputs
+        **{f"out.{name}": ((m,), "u1" if name in ("event_horizon", "mode", "violations")
+                           else "i1" if name == "threat" else "f8")
+           for name in OUTPUT_COLUMNS},
+    }
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    # Python's round() per market, as the single-market organs report it
+    # (np.round scales first and rounds some halves the other way)
+    return np.array([round(x, digits) for x in values.tolist()], dtype=np.float64)
+
+# -----------------------------------------------------------
+# 1. SHARED MEMORY (One Segment, Many Views)
+# -----------------------------------------------------------
+
+class SharedColony:
+    """
+    Every array of colony_layout() packed into one SharedMemory segment.
+    The creator owns (and unlinks) the segment; workers attach by name and
+    never pickle the arrays themselves.
+    """
+
+    ALIGN = 64
+
+    def __init__(self, layout: Dict[str, Tuple[Tuple[int, ...], str]], name: Optional[str] = None):
+        self.layout = layout
+        offsets, size = {}, 0
+        for key, (shape, dtype) in layout.items():
+            offsets[key] = size
+            nbytes = int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+            size += -(-nbytes // self.ALIGN) * self.ALIGN
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=max(size, 1))
+        self.arrays = {
+            key: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offsets[key])
+            for key, (shape, dtype) in layout.items()
+        }
+        if self.owner:
+            for arr in self.arrays.values():
+                arr.fill(0)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def shard(self, lo: int, hi: int) -> Dict[str, np.ndarray]:
+        """Views of markets lo:hi (writes land in shared memory)."""
+        return {key: arr[lo:hi] for key, arr in self.arrays.items()}
+
+    def close(self):
+        self.arrays = {}
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+# -----------------------------------------------------------
+# 2. SHARD KERNEL (Columnar Pipeline over a Slice of Markets)
+# -----------------------------------------------------------
+
+class ShardKernel:
+    """
+    The PranaPipeline stages for a contiguous block of markets, vectorized:
+    echo -> gravity -> shadow -> bicameral -> laws, reading and writing the
+    colony views. Runs inside a worker process, or inline for a single shard.
+    """
+
+    def __init__(self, views: Dict[str, np.ndarray], seed: Optional[int] = None):
+        self.v = views
+        n, _, history_max = views["gravity.history"].shape
+        self.engine = GravityWellEngine(n, history_max, buffers={
+            key: views["gravity." + key] for key in ("history", "head", "count", "previous_fear")
+        })
+        self.shadow = MonteCarloEngine(seed=seed)
+
+    def tick(self, now: float):
+        v = self.v
+        if not len(v["in.system"]):
+            return
+        system = v["in.system"]
+        n_echo = len(thalamic_junction.ECHO_KEYS)
+
+        # impulse + echo: one forward pass for the shard
+        current = system[:, :n_echo]
+        rhythm = round(thalamic_junction.circadian_phase(now), 3)
+        command = thalamic_junction.process_echo_arrays(current, rhythm, v["echo.last"], v["echo.has_last"])
+        v["echo.last"][...] = current
+        v["echo.has_last"][...] = True
+
+        # gravity
+        gravity = self.engine.update_many(v["in.vitals"])
+
+        # shadow
+        stress = system[:, SYSTEM_KEYS.index("stress")]
+        energy = system[:, SYSTEM_KEYS.index("energy")]
+        shadow = self.shadow.simulate(stress, energy)
+        shadow_fear = _round(shadow["shadow_fear"], 3)
+
+        # bicameral: the rounded readings the pipeline hands its mind; nothing
+        # in a tick evolves the biases, so every market runs at a fresh mind's
+        decision = resolve_conflict_many(
+            _round(gravity["gravity_index"], 3), shadow_fear, system[:, SYSTEM_KEYS.index("dopamine")]
+        )
+
+        # laws: prev -> curr per market (first tick of a market has no predecessor)
+        fear = decision["final_fear"]
+        threat = threat_codes_from_fear(fear, v["laws.threat"])
+        entropy = system[:, SYSTEM_KEYS.index("entropy")]
+        masks = transition_masks(v["laws.fear"], fear, v["laws.threat"], threat,
+                                 entropy, v["in.crash_coherence"])
+        masks[~v["laws.has_prev"]] = 0
+        v["laws.fear"][...] = fear
+        v["laws.threat"][...] = threat
+        v["laws.has_prev"][...] = True
+
+        out = {
+            **command,
+            "gravity_index": gravity["gravity_index"],
+            "chaos_attractor": gravity["chaos_attractor"],
+            "event_horizon": gravity["event_horizon"],
+            "shadow_fear": shadow_fear,
+            "panic_probability": shadow["panic_probability"],
+            **decision,
+            "threat": threat,
+            "violations": masks,
+        }
+        for name in OUTPUT_COLUMNS:
+            v["out." + name][...] = out[name]
+
+def usable_cpus() -> int:
+    """CPUs this process may run on (affinity-aware where the OS supports it)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _pin_worker(index: int, torch_threads: int, pin_cpus: bool):
+    # Before torch's first import: one small intra-op pool per worker process
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(torch_threads)
+    if pin_cpus and hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+    thalamic_junction.set_inference_threads(torch_threads, 1)
+
+def _worker_main(conn, colony_name: str, layout, lo: int, hi: int, index: int,
+                 torch_threads: int, pin_cpus: bool, seed: Optional[int], brain_state):
+    colony = None
+    try:
+        _pin_worker(index, torch_threads, pin_cpus)
+        _load_brain(brain_state, seed)
+        colony = SharedColony(layout, name=colony_name)
+        kernel = ShardKernel(colony.shard(lo, hi), seed=None if seed is None else seed + index)
+        conn.send(("ready", None))
+        while True:
+            msg, arg = conn.recv()
+            if msg == "tick":
+                t0 = time.perf_counter()
+                kernel.tick(arg)
+                conn.send(("done", time.perf_counter() - t0))
+            elif msg == "brain":
+                thalamic_junction.load_brain_state(arg)
+                conn.send(("done", 0.0))
+            else:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        if colony is not None:
+            colony.close()
+        conn.close()
+
+def _load_brain(brain_state, seed: Optional[int]):
+    """Identical weights in every shard: the parent's, else a seeded initialisation."""
+    if brain_state is not None:
+        thalamic_junction.load_brain_state(brain_state)
+    else:
+        # Seeded inside a forked RNG: the inline executor must not reseed the caller's torch
+        import torch
+        with torch.random.fork_rng(devices=[]):
+            torch.manual_seed(0 if seed is None else seed)
+            thalamic_junction.get_brain()
+
+# -----------------------------------------------------------
+# 3. THE COLONY EXECUTOR
+# -----------------------------------------------------------
+
+class ShardedPranaExecutor:
+    """
+    Runs the PRANA pipeline over `n_markets` markets per tick, split into
+    contiguous shards across `workers` processes (0 = inline, no processes).
+
+    Market state (chaos histories, fear inertia, echo memory, threat
+    colour) lives in one shared-memory segment, so a tick only sends
+    a timestamp to each worker. Results are gathered as columnar arrays.
+    """
+
+    def __init__(
+        self,
+        n_markets: int,
+        workers: Optional[int] = None,
+        history_max: int = HISTORY_MAX,
+        torch_threads: int = 1,
+        pin_cpus: bool = True,
+        seed: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        self.n_markets = int(n_markets)
+        self.workers = usable_cpus() if workers is None else int(workers)
+        self.layout = colony_layout(self.n_markets, history_max)
+        self.colony = SharedColony(self.layout)
+        self.ticks = 0
+        self.shard_seconds = np.zeros(max(self.workers, 1))
+
+        n_shards = max(1, min(self.workers, self.n_markets))
+        bounds = np.linspace(0, self.n_markets, n_shards + 1).astype(int)
+        self.shards: List[Tuple[int, int]] = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+        self._kernel: Optional[ShardKernel] = None
+        self._procs, self._conns = [], []
+        if self.workers == 0:
+            _load_brain(thalamic_junction.brain_state(), seed)
+            self._kernel = ShardKernel(self.colony.shard(0, self.n_markets), seed=seed)
+            return
+
+        ctx = mp.get_context(start_method)
+        brain_state = thalamic_junction.brain_state()
+        try:
+            for index, (lo, hi) in enumerate(self.shards):
+                parent, child = ctx.Pipe()
+                proc = ctx.Process(
+                    target=_worker_main, name=f"prana-shard-{index}", daemon=True,
+                    args=(child, self.colony.name, self.layout, lo, hi, index,
+                          torch_threads, pin_cpus, seed, brain_state),
+                )
+                proc.start()
+                child.close()
+                self._procs.append(proc)
+                self._conns.append(parent)
+            self._gather()
+        except BaseException:
+            self.close()
+            raise
+
+    # --- Inputs ---
+
+    def write_inputs(self, vitals, system, crash_coherence=None):
+        """vitals: M x len(VITAL_KEYS); system: M x len(SYSTEM_KEYS); crash_coherence: M (0 if None)."""
+        self.colony["in.vitals"][...] = vitals
+        self.colony["in.system"][...] = system
+        self.colony["in.crash_coherence"][...] = 0.0 if crash_coherence is None else crash_coherence
+
+    def write_states(self, states: Sequence[Dict[str, Any]]):
+        """Dict-shaped market states, as PranaPipeline.tick takes them (state["vitals"] required)."""
+        vitals = [[s["vitals"][k] for k in VITAL_KEYS] for s in states]
+        system = [[(s.get("system") or {}).get(k, 1.0 if k == "energy" else 0.5 if k == "dopamine" else 0.0)
+                   for k in SYSTEM_KEYS] for s in states]
+        crash = [float((s.get("latent") or {}).get("crash_coherence", 0.0)) for s in states]
+        self.write_inputs(vitals, system, crash)
+
+    # --- Tick ---
+
+    def tick(self, vitals=None, system=None, crash_coherence=None, now: Optional[float] = None,
+             copy: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Advances every market one tick. Inputs may be written beforehand with
+        write_inputs / write_states. Returns the columnar output; with copy=False
+        the arrays are shared views, valid until the next tick.
+        """
+        if vitals is not None:
+            self.write_inputs(vitals, system, crash_coherence)
+        now = time.time() if now is None else now
+        if self._kernel is not None:
+            t0 = time.perf_counter()
+            self._kernel.tick(now)
+            self.shard_seconds[0] += time.perf_counter() - t0
+        else:
+            for conn in self._conns:
+                conn.send(("tick", now))
+            self.shard_seconds += self._gather()
+        self.ticks += 1
+        out = {name: self.colony["out." + name] for name in OUTPUT_COLUMNS}
+        return {k: v.copy() for k, v in out.items()} if copy else out
+
+    def _gather(self) -> np.ndarray:
+        seconds = np.zeros(len(self.shard_seconds))
+        errors = []
+        for i, conn in enumerate(self._conns):
+            msg, arg = conn.recv()
+            if msg == "error":
+                errors.append(arg)
+            elif msg == "done":
+                seconds[i] = arg
+        if errors:
+            raise RuntimeError("shard worker failed:\n" + errors[0])
+        return seconds
+
+    # --- State ---
+
+    def load_brain_state(self, state: Dict[str, np.ndarray]):
+        """Broadcasts new inference weights (e.g. from the subconscious trainer) to every shard."""
+        if self._kernel is not None:
+            thalamic_junction.load_brain_state(state)
+            return
+        for conn in self._conns:
+            conn.send(("brain", state))
+        self._gather()
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Copies of every non-I/O colony array (markets on axis 0)."""
+        return {k: v.copy() for k, v in self.colony.arrays.items() if not k.startswith(("in.", "out."))}
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]):
+        for key, value in state.items():
+            self.colony[key][...] = value
+
+    def close(self):
+        for conn in self._conns:
+            try:
+                conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._procs, self._conns = [], []
+        self._kernel = None
+        if self.colony is not None:
+            self.colony.close()
+            self.colony = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
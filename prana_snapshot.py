@@ -0,0 +1,241 @@
+# =================================================================
+# prana_snapshot.py — PRANA HIBERNATION (Snapshot & Warm Restart)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Lossless Organism Hibernation Between Heartbeats
+# =================================================================
+
+import json
+import os
+import struct
+import threading
+import time
+import numpy as np
+from typing import Dict, Optional
+
+from bicameral_mind import BicameralMind
+from prana_threads import lower_thread_priority
+from sensory_onchain_ingestor import STATE_DIR, GravityWellEngine, default_engine
+import thalamic_junction
+
+SNAPSHOT_PATH = os.path.join(STATE_DIR, "prana_snapshot.bin")
+# Bumped whenever the key layout below changes incompatibly
+SNAPSHOT_FORMAT = 1
+
+# One flat namespace of arrays, keyed "<organ>/<name>":
+#   meta/format, meta/timestamp
+#   gravity/history, gravity/head, gravity/count, gravity/previous_fear
+#   mind/arrogance_score, ..., mind/history.<column>
+#   brain/<torch state_dict key>
+
+# -----------------------------------------------------------
+# 1. CAPTURE & RESTORE (Tick Thread)
+# -----------------------------------------------------------
+
+def _prefixed(prefix: str, state: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return {f"{prefix}/{k}": v for k, v in state.items()}
+
+def _section(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    head = prefix + "/"
+    return {k[len(head):]: v for k, v in arrays.items() if k.startswith(head)}
+
+def capture(
+    engine: Optional[GravityWellEngine] = None,
+    mind: Optional[BicameralMind] = None,
+    brain: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Copies the organism's state into plain NumPy arrays.
+    Cheap enough to call between ticks (tens of microseconds for one chain);
+    the arrays are owned by the snapshot, so writing can happen on another thread.
+    """
+    arrays = {
+        "meta/format": np.array(SNAPSHOT_FORMAT),
+        "meta/timestamp": np.array(time.time()),
+    }
+    if engine is not None:
+        arrays.update(_prefixed("gravity", engine.state_dict()))
+    if mind is not None:
+        arrays.update(_prefixed("mind", mind.state_dict()))
+    if brain:
+        weights = thalamic_junction.brain_state()
+        if weights is not None:
+            arrays.update(_prefixed("brain", weights))
+    return arrays
+
+def restore(
+    arrays: Dict[str, np.ndarray],
+    engine: Optional[GravityWellEngine] = None,
+    mind: Optional[BicameralMind] = None,
+    brain: bool = True,
+) -> Dict[str, bool]:
+    """Loads each organ present in the snapshot; returns which organs were restored."""
+    fmt = int(arrays.get("meta/format", -1))
+    if fmt != SNAPSHOT_FORMAT:
+        raise ValueError(f"unsupported snapshot format {fmt} (expected {SNAPSHOT_FORMAT})")
+
+    restored = {"gravity": False, "mind": False, "brain": False}
+    gravity = _section(arrays, "gravity")
+    if engine is not None and gravity:
+        engine.load_state_dict(gravity)
+        restored["gravity"] = True
+    state = _section(arrays, "mind")
+    if mind is not None and state:
+        mind.load_state_dict(state)
+        restored["mind"] = True
+    weights = _section(arrays, "brain")
+    if brain and weights:
+        thalamic_junction.load_brain_state(weights)
+        restored["brain"] = True
+    return restored
+
+# -----------------------------------------------------------
+# 2. DISK FORMAT (Flat Binary, Atomic Rename)
+# -----------------------------------------------------------
+# MAGIC | u64 header length | JSON index | raw C-order array bytes (64-byte aligned)
+# One write per array and one read per file: the writer thread holds the GIL
+# for microseconds (zip/.npz framing costs milliseconds of Python per save).
+
+MAGIC = b"PRANASNP"
+_ALIGN = 64
+
+def _aligned(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+def save_snapshot(arrays: Dict[str, np.ndarray], path: str = SNAPSHOT_PATH):
+    """
+    Writes the snapshot next to `path` and renames it into place, so a crash
+    mid-write leaves the previous snapshot intact.
+    """
+    blobs = [(name, np.asarray(arr, order="C")) for name, arr in arrays.items()]
+    index, offset = [], 0
+    for name, arr in blobs:
+        if arr.dtype.hasobject:
+            raise TypeError(f"snapshot array {name!r} has object dtype")
+        index.append({"name": name, "dtype": arr.dtype.str, "shape": arr.shape, "offset": offset})
+        offset = _aligned(offset + arr.nbytes)
+    header = json.dumps({"format": SNAPSHOT_FORMAT, "arrays": index}).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(MAGIC + struct.pack("<Q", len(header)) + header)
+            for (_, arr), entry in zip(blobs, index):
+                fh.seek(data_start + entry["offset"])
+                fh.write(arr.tobytes() if arr.ndim == 0 else arr.data)
+            fh.truncate(data_start + offset)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> Dict[str, np.ndarray]:
+    """Reads a snapshot with one read; arrays are writable views of a single buffer."""
+    with open(path, "rb") as fh:
+        raw = bytearray(fh.read())
+    if raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a PRANA snapshot")
+    (size,) = struct.unpack_from("<Q", raw, len(MAGIC))
+    header = json.loads(bytes(raw[len(MAGIC) + 8:len(MAGIC) + 8 + size]))
+    data_start = _aligned(len(MAGIC) + 8 + size)
+    arrays = {}
+    for entry in header["arrays"]:
+        dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+        count = int(np.prod(shape, dtype=np.int64))
+        arrays[entry["name"]] = np.frombuffer(
+            raw, dtype=dtype, count=count, offset=data_start + entry["offset"]
+        ).reshape(shape)
+    return arrays
+
+def warm_restart(
+    path: str = SNAPSHOT_PATH,
+    engine: Optional[GravityWellEngine] = default_engine,
+    mind: Optional[BicameralMind] = None,
+    brain: bool = True,
+) -> Dict[str, bool]:
+    """Restores from `path` if it exists; a missing snapshot is a cold start (nothing restored)."""
+    if not os.path.exists(path):
+        return {"gravity": False, "mind": False, "brain": False}
+    return restore(load_snapshot(path), engine=engine, mind=mind, brain=brain)
+
+# -----------------------------------------------------------
+# 3. BACKGROUND WRITER (Latest-Only Slot)
+# -----------------------------------------------------------
+
+class SnapshotWriter:
+    """
+    Persists snapshots on a daemon thread.
+    The tick loop only captures arrays and drops them into a single slot; if the
+    disk is slower than the submissions, older pending snapshots are replaced,
+    never queued, so the loop never blocks on I/O.
+    """
+
+    def __init__(self, path: str = SNAPSHOT_PATH, nice: int = 10):
+        self.path = path
+        self.nice = int(nice)
+        self.written = 0
+        self.dropped = 0
+        self.last_error: Optional[BaseException] = None
+        self._pending: Optional[Dict[str, np.ndarray]] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name="prana-snapshot", daemon=True)
+        self._thread.start()
+
+    def submit(self, arrays: Dict[str, np.ndarray]):
+        with self._lock:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = arrays
+            self._idle.clear()
+        self._wake.set()
+
+    def snapshot(self, engine=None, mind=None, brain: bool = True):
+        """Captures on the calling thread and hands the write to the writer thread."""
+        self.submit(capture(engine=engine, mind=mind, brain=brain))
+
+    def every(self, ticks: int, engine=None, mind=None, brain: bool = True):
+        """on_tick callback for PranaPipeline.run that snapshots every `ticks` ticks."""
+        counter = [0]
+
+        def on_tick(_ctx):
+            counter[0] += 1
+            if counter[0] % ticks == 0:
+                self.snapshot(engine=engine, mind=mind, brain=brain)
+        return on_tick
+
+    def _run(self):
+        lower_thread_priority(self.nice)
+        while True:
+            self._wake.wait()
+            with self._lock:
+                self._wake.clear()
+                arrays, self._pending = self._pending, None
+                if arrays is None:
+                    self._idle.set()
+                    if self._stop:
+                        return
+                    continue
+            try:
+                save_snapshot(arrays, self.path)
+                self.written += 1
+            except Exception as exc: # A bad snapshot must not kill the writer
+                self.last_error = exc
+            finally:
+                self._wake.set() # Re-check the slot (and the stop flag)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every submitted snapshot has been written (or dropped)."""
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        self._stop = True
+        self._wake.set()
+        self._thread.join(timeout)
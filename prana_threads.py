@@ -0,0 +1,22 @@
+# =================================================================
+# prana_threads.py — PRANA AUTONOMIC TONE (Background Thread Priority)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Housekeeping Organs Yield the CPU to the Heartbeat
+# =================================================================
+
+import os
+import threading
+
+def lower_thread_priority(nice: int) -> bool:
+    """
+    Renices the calling thread by `nice` so the tick thread wins the CPU.
+    Linux schedules threads individually; elsewhere (or without permission)
+    this is a no-op. Returns whether the priority was changed.
+    """
+    if not nice or not hasattr(os, "setpriority"):
+        return False
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), int(nice))
+    except OSError:
+        return False
+    return True
@@ -0,0 +1,333 @@
+# =================================================================
+# prana_ticklog.py — PRANA DREAM JOURNAL (Tick Record & Replay)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Bit-Exact Re-Living of Recorded Market Heartbeats
+# =================================================================
+
+import json
+import os
+import struct
+import time
+import numpy as np
+from typing import Any, Dict, Optional
+
+from sensory_onchain_ingestor import VITAL_KEYS, GravityWellEngine, default_engine
+from thalamic_junction import ECHO_KEYS, echo_backend, set_echo_backend
+
+TICKLOG_FORMAT = 1
+MAGIC = b"PRANATLG"
+_ALIGN = 64
+
+# Published outputs re-checked on replay, in record order
+COMMAND_KEYS = ("action_potential", "sensory_gain", "energy_gate", "mood_tone", "nervous_tension")
+SHADOW_KEYS = ("shadow_fear", "panic_probability", "uncertainty_index", "samples")
+# System organs shadow_step reads, with its defaults
+SYSTEM_KEYS = (("stress", 0.0), ("stress_velocity", 0.0), ("energy", 1.0))
+
+# One little-endian record per tick (25 float64, 200 bytes): inputs, then the
+# outputs they produced. All-float64 lets the writer fill a record as one flat row.
+TICK_DTYPE = np.dtype([
+    ("ts", "<f8"),
+    ("vitals", "<f8", (len(VITAL_KEYS),)),
+    ("echo", "<f8", (len(ECHO_KEYS),)),
+    ("rhythm", "<f8"),
+    ("system", "<f8", (len(SYSTEM_KEYS),)),
+    ("gravity", "<f8", (3,)),             # gravity_index, chaos_attractor, event_horizon
+    ("command", "<f8", (len(COMMAND_KEYS),)),
+    ("shadow", "<f8", (len(SHADOW_KEYS),)),
+])
+
+# File: MAGIC | u64 header length | JSON header | records (from a 64-byte boundary)
+# The header carries what replay needs besides the records: the Shadow's
+# engine settings and generator state, and the pulse before the first record.
+# Gravity ring buffers and brain weights go to a companion prana_snapshot
+# file (<path>.snapshot), since process_echo's weights are random per process.
+
+def _aligned(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+def snapshot_path(path: str) -> str:
+    return path + ".snapshot"
+
+# -----------------------------------------------------------
+# 1. RECORDING (Buffered Append-Only Writer)
+# -----------------------------------------------------------
+
+class TickLogWriter:
+    """
+    Appends one TICK_DTYPE record per tick to a preallocated buffer and
+    writes it out in a single bulk write every `buffer_ticks` ticks (and on
+    flush/close). A crash loses at most the unflushed buffer; the reader
+    ignores a torn trailing record.
+    A log is bound to the state it started from, so an existing `path` is
+    never reused: the writer raises FileExistsError instead of truncating it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        engine: Optional[GravityWellEngine] = None,
+        shadow_engine=None,
+        shadow_tolerance: Optional[float] = None,
+        last_pulse: Optional[Dict[str, Any]] = None,
+        buffer_ticks: int = 4096,
+        snapshot: bool = True,
+    ):
+        from evolution_pro import _default_engine
+
+        if os.path.exists(path):
+            raise FileExistsError(f"tick log {path!r} already exists; remove it or record to a new path")
+        self.path = path
+        self.ticks = 0
+        shadow_engine = shadow_engine or _default_engine()
+        header = {
+            "format": TICKLOG_FORMAT,
+            "dtype": TICK_DTYPE.descr,
+            "created": time.time(),
+            "echo_backend": echo_backend(),
+            "shadow": {
+                "num_simulations": shadow_engine.num_simulations,
+                "sampler": shadow_engine.sampler,
+                "replicates": shadow_engine.replicates,
+                "confidence": shadow_engine.confidence,
+                "max_simulations": shadow_engine.max_simulations,
+                "tolerance": shadow_tolerance,
+                "rng": shadow_engine.rng.bit_generator.state,
+            },
+            "last_pulse": None if not last_pulse else {
+                "echo": [float(last_pulse["echo"].get(k, 0.0)) for k in ECHO_KEYS],
+                "rhythm": float(last_pulse.get("rhythm_phase", 0.5)),
+            },
+        }
+        if snapshot:
+            import prana_snapshot
+            import thalamic_junction
+            thalamic_junction.get_brain() # Materialize the weights this run will infer with
+            prana_snapshot.save_snapshot(
+                prana_snapshot.capture(engine=engine or default_engine), snapshot_path(path)
+            )
+        elif os.path.exists(snapshot_path(path)):
+            os.remove(snapshot_path(path)) # Never pair records with a stale starting state
+
+        raw = json.dumps(header).encode()
+        self._fh = open(path, "xb", buffering=0)
+        self._fh.write((MAGIC + struct.pack("<Q", len(raw)) + raw).ljust(_aligned(len(MAGIC) + 8 + len(raw)), b"\0"))
+        self._buf = np.zeros(int(buffer_ticks), dtype=TICK_DTYPE)
+        self._rows = self._buf.view(np.float64).reshape(len(self._buf), -1)
+        self._n = 0
+
+    @classmethod
+    def for_pipeline(cls, path: str, pipeline, **kwargs) -> "TickLogWriter":
+        """A writer starting from `pipeline`'s current state; pass record_tick as run(on_tick=...)."""
+        if pipeline.shadow_cache is not None:
+            raise ValueError("a cached shadow (snapped inputs, skipped draws) cannot be replayed exactly")
+        return cls(
+            path,
+            engine=pipeline.engine,
+            shadow_engine=pipeline.shadow_engine,
+            shadow_tolerance=pipeline.shadow_tolerance,
+            last_pulse=pipeline._last_pulse,
+            **kwargs,
+        )
+
+    def append(self, pulse: Dict[str, Any], vitals: Dict[str, float], system: Dict[str, Any],
+               gravity: Dict[str, Any], command: Dict[str, float], shadow: Dict[str, Any]):
+        echo = pulse["echo"]
+        self._rows[self._n] = (
+            [pulse["ts"]]
+            + [vitals[k] for k in VITAL_KEYS]
+            + [echo.get(k, 0.0) for k in ECHO_KEYS]
+            + [pulse.get("rhythm_phase", 0.5)]
+            + [system.get(k, default) for k, default in SYSTEM_KEYS]
+            + [gravity["gravity_index"], gravity["chaos_attractor"], gravity["event_horizon"]]
+            + [command[k] for k in COMMAND_KEYS]
+            + [shadow.get(k, 0.0) for k in SHADOW_KEYS]
+        )
+        self._n += 1
+        self.ticks += 1
+        if self._n == len(self._buf):
+            self.flush()
+
+    def record_tick(self, ctx: Dict[str, Any]):
+        """Records one PranaPipeline tick context."""
+        self.append(ctx["pulse"], ctx["vitals"], ctx["system"], ctx["gravity"], ctx["command"], ctx["shadow"])
+
+    def flush(self):
+        if self._n:
+            self._fh.write(memoryview(self._buf[:self._n]).cast("B"))
+            self._n = 0
+
+    def close(self):
+        if self._fh.closed:
+            return
+        self.flush()
+        os.fsync(self._fh.fileno())
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------------------------------------
+# 2. READING (Memory-Mapped)
+# -----------------------------------------------------------
+
+class TickLog:
+    """A recorded log: `header` (dict) and `records`, a read-only memmap of TICK_DTYPE."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fh:
+            if fh.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a PRANA tick log")
+            (size,) = struct.unpack("<Q", fh.read(8))
+            self.header = json.loads(fh.read(size))
+        if self.header.get("format") != TICKLOG_FORMAT:
+            raise ValueError(f"unsupported tick log format {self.header.get('format')} (expected {TICKLOG_FORMAT})")
+        if np.dtype([tuple(field) for field in self.header["dtype"]]) != TICK_DTYPE:
+            raise ValueError(f"{path} was recorded with a different tick layout")
+        data_start = _aligned(len(MAGIC) + 8 + size)
+        count = (os.path.getsize(path) - data_start) // TICK_DTYPE.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=TICK_DTYPE, mode="r", offset=data_start, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=TICK_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def duration(self) -> float:
+        """Recorded wall time from the first to the last tick (seconds)."""
+        return float(self.records["ts"][-1] - self.records["ts"][0]) if len(self) > 1 else 0.0
+
+# -----------------------------------------------------------
+# 3. REPLAY DRIVER (Max Speed or N x Real Time)
+# -----------------------------------------------------------
+
+def _shadow_engine(config: Dict[str, Any]):
+    from evolution_pro import MonteCarloEngine
+
+    state = config["rng"]
+    bit_generator = getattr(np.random, state["bit_generator"])()
+    bit_generator.state = state
+    return MonteCarloEngine(
+        config["num_simulations"],
+        rng=np.random.Generator(bit_generator),
+        sampler=config["sampler"],
+        replicates=config["replicates"],
+        confidence=config["confidence"],
+        max_simulations=config["max_simulations"],
+    )
+
+def replay(
+    path: str,
+    speed: Optional[float] = None,
+    check: bool = True,
+    restore: bool = True,
+    engine: Optional[GravityWellEngine] = None,
+    chunk: int = 4096,
+) -> Dict[str, Any]:
+    """
+    Feeds a tick log back through process_echo, the gravity well and
+    shadow_step, as fast as possible (speed=None) or at `speed` x the
+    recorded pace. With `restore`, gravity history and brain weights are
+    loaded from the companion snapshot (this replaces the process's
+    inference brain). With `check`, every output is compared for exact
+    equality with the recorded one.
+
+    Outputs only match exactly if the brain was not retrained during the
+    recording (a running subconscious trainer publishes new weights).
+    """
+    log = TickLog(path)
+    backend = echo_backend()
+    set_echo_backend(log.header.get("echo_backend", "torch")) # Backends agree only to float rounding
+    try:
+        return _replay(log, speed, check, restore, engine, chunk)
+    finally:
+        set_echo_backend(backend)
+
+def _replay(log: TickLog, speed: Optional[float], check: bool, restore: bool,
+            engine: Optional[GravityWellEngine], chunk: int) -> Dict[str, Any]:
+    from evolution_pro import shadow_step
+    from thalamic_junction import process_echo
+
+    path = log.path
+    engine = engine or GravityWellEngine()
+    if restore and os.path.exists(snapshot_path(path)):
+        import prana_snapshot
+        prana_snapshot.restore(prana_snapshot.load_snapshot(snapshot_path(path)), engine=engine, brain=True)
+    shadow_engine = _shadow_engine(log.header["shadow"])
+    tolerance = log.header["shadow"]["tolerance"]
+    last = log.header["last_pulse"]
+    last_pulse = None if last is None else {"echo": dict(zip(ECHO_KEYS, last["echo"])), "rhythm_phase": last["rhythm"]}
+
+    mismatches = {"gravity": 0, "echo": 0, "shadow": 0}
+    first_mismatch: Optional[int] = None
+    n = len(log)
+    t0 = time.perf_counter()
+    ts0 = float(log.records["ts"][0]) if n else 0.0
+    max_lag = 0.0
+
+    for lo in range(0, n, chunk):
+        block = log.records[lo:lo + chunk]
+        columns = {name: block[name].tolist() for name in TICK_DTYPE.names}
+        for j in range(len(block)):
+            ts = columns["ts"][j]
+            if speed:
+                lag = (time.perf_counter() - t0) - (ts - ts0) / speed
+                if lag < 0:
+                    time.sleep(-lag)
+                else:
+                    max_lag = max(max_lag, lag)
+
+            pulse = {"echo": dict(zip(ECHO_KEYS, columns["echo"][j])), "rhythm_phase": columns["rhythm"][j], "ts": ts}
+            command = process_echo(pulse, last_pulse)
+            last_pulse = pulse
+            gravity = engine.update(dict(zip(VITAL_KEYS, columns["vitals"][j])))
+            system = dict(zip((k for k, _ in SYSTEM_KEYS), columns["system"][j]))
+            shadow = shadow_step({"system": system}, engine=shadow_engine, tolerance=tolerance)
+
+            if check:
+                bad = False
+                if [gravity["gravity_index"], gravity["chaos_attractor"], gravity["event_horizon"]] != columns["gravity"][j]:
+                    mismatches["gravity"] += 1
+                    bad = True
+                if [command[k] for k in COMMAND_KEYS] != columns["command"][j]:
+                    mismatches["echo"] += 1
+                    bad = True
+                if [float(shadow[k]) for k in SHADOW_KEYS] != columns["shadow"][j]:
+                    mismatches["shadow"] += 1
+                    bad = True
+                if bad and first_mismatch is None:
+                    first_mismatch = lo + j
+
+    elapsed = time.perf_counter() - t0
+    return {
+        "ticks": n,
+        "seconds": elapsed,
+        "ticks_per_s": n / elapsed if elapsed > 0 else 0.0,
+        "recorded_seconds": log.duration(),
+        "max_lag_s": max_lag,
+        "mismatches": mismatches if check else None,
+        "first_mismatch": first_mismatch,
+        "exact": (not any(mismatches.values())) if check else None,
+    }
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a PRANA tick log")
+    parser.add_argument("path")
+    parser.add_argument("--speed", type=float, default=None, help="N x recorded pace (default: as fast as possible)")
+    parser.add_argument("--no-check", action="store_true")
+    args = parser.parse_args()
+
+    print("--- PRANA DREAM JOURNAL: REPLAY ---")
+    report = replay(args.path, speed=args.speed, check=not args.no_check)
+    print(f"{report['ticks']} ticks in {report['seconds']:.2f}s ({report['ticks_per_s']:.0f} ticks/s)"
+          f" | recorded span {report['recorded_seconds']:.1f}s")
+    if report["mismatches"] is not None:
+        verdict = "EXACT" if report["exact"] else f"DIVERGED at tick {report['first_mismatch']}"
+        print(f"outputs: {verdict} | mismatches {report['mismatches']}")
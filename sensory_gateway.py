@@ -0,0 +1,156 @@
+# =================================================================
+# sensory_gateway.py — PRANA SENSORY GATEWAY (Async Ingestion)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: Concurrent Nerve Endings with Last-Known-Good Reflexes
+# =================================================================
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+from sensory_onchain_ingestor import VITAL_KEYS, calculate_gravity_well, fetch_network_vitals
+
+# -----------------------------------------------------------
+# 1. SOURCES (Individual Nerve Endings)
+# -----------------------------------------------------------
+
+def _default_parse(payload: Any, key: str) -> float:
+    """Accepts {"<key>": x}, {"value": x} or a bare number."""
+    if isinstance(payload, dict):
+        return float(payload[key] if key in payload else payload["value"])
+    return float(payload)
+
+class VitalSource:
+    """
+    One polled endpoint feeding a single vital (gas_v, mev_a or liq_p).
+    Several sources may feed the same vital; their readings are averaged.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        key: str,
+        timeout: float = 2.0,
+        parse: Optional[Callable[[Any], float]] = None
+    ):
+        if key not in VITAL_KEYS:
+            raise ValueError(f"Unknown vital '{key}', expected one of {VITAL_KEYS}")
+        self.name = name
+        self.url = url
+        self.key = key
+        self.timeout = float(timeout)
+        self.parse = parse or (lambda payload: _default_parse(payload, key))
+        # Last-known-good reading, reused when the source is slow or down
+        self.last_good: Optional[float] = None
+        self.last_good_ts = 0.0
+        self.failures = 0
+
+# -----------------------------------------------------------
+# 2. THE GATEWAY (Concurrent Proprioception)
+# -----------------------------------------------------------
+
+class VitalsGateway:
+    """
+    Polls every source concurrently over one pooled HTTP session.
+    A slow or failing endpoint only costs its own timeout and falls back to
+    its last-known-good value, so it can no longer stall the gravity-well tick.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[VitalSource],
+        queue_size: int = 4,
+        session: Optional["requests.Session"] = None
+    ):
+        self.sources = list(sources)
+        pool = max(1, len(self.sources))
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self._executor = ThreadPoolExecutor(max_workers=pool, thread_name_prefix="prana-nerve")
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def _get(self, source: VitalSource) -> float:
+        response = self.session.get(source.url, timeout=source.timeout)
+        response.raise_for_status()
+        return source.parse(response.json())
+
+    async def fetch_source(self, source: VitalSource) -> Optional[float]:
+        """Fetches one source; returns its last-known-good value on timeout or error."""
+        loop = asyncio.get_running_loop()
+        try:
+            value = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._get, source),
+                timeout=source.timeout
+            )
+        except Exception:
+            source.failures += 1
+            return source.last_good
+        source.last_good = value
+        source.last_good_ts = time.time()
+        return value
+
+    async def sample(self) -> Dict[str, float]:
+        """One concurrent sweep of all sources, merged into a vitals dict."""
+        readings = await asyncio.gather(*(self.fetch_source(s) for s in self.sources))
+        # Vitals with no live or remembered reading keep the resting baseline
+        vitals = fetch_network_vitals()
+        merged: Dict[str, List[float]] = {}
+        for source, value in zip(self.sources, readings):
+            if value is not None:
+                merged.setdefault(source.key, []).append(value)
+        for key, values in merged.items():
+            vitals[key] = sum(values) / len(values)
+        return vitals
+
+    # --- Bounded hand-off to the Event Horizon engine ---
+
+    async def produce(self, interval: float = 0.0, ticks: Optional[int] = None):
+        """Samples forever (or `ticks` times); the oldest queued sample is dropped when full."""
+        done = 0
+        while ticks is None or done < ticks:
+            vitals = await self.sample()
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(vitals)
+            done += 1
+            if interval:
+                await asyncio.sleep(interval)
+
+    async def consume(
+        self,
+        ticks: Optional[int] = None,
+        gravity: Callable[[Dict[str, float]], Dict[str, Any]] = calculate_gravity_well,
+        on_tick: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """Feeds queued vitals into the gravity well (calculate_gravity_well by default)."""
+        done = 0
+        while ticks is None or done < ticks:
+            vitals = await self.queue.get()
+            result = gravity(vitals)
+            if on_tick is not None:
+                on_tick(result)
+            done += 1
+
+    async def tick(
+        self,
+        gravity: Callable[[Dict[str, float]], Dict[str, Any]] = calculate_gravity_well
+    ) -> Dict[str, Any]:
+        """Single sample -> gravity-well step, without the queue."""
+        return gravity(await self.sample())
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
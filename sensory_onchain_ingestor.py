@@ -4,10 +4,11 @@
 # INNOVATION: Nonlinear Lyapunov Divergence & Chaos Attractor Mapping
 # =================================================================
 
-import json, os, time, requests
+import json, math, os, time
 import numpy as np
-from scipy.optimize import curve_fit
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from prana_records import GravityReading
 
 # --- GEOMETRIC CONFIGURATION ---
 BASE = os.path.dirname(os.path.abspath(__file__))
@@ -16,10 +17,10 @@ ONCHAIN_JSON = os.path.join(STATE_DIR, "onchain_heartbeat.json")
 
 # Note: Global seeds for the simulation are kept in the private core
 HISTORY_MAX = 20
-gas_history, mev_history, liq_history = [], [], []
+# Sensor series tracked per chain, in ring-buffer row order
+VITAL_KEYS = ("gas_v", "mev_a", "liq_p")
 
 # --- INERTIA & RESIDUAL FEAR (Biological Metaphor) ---
-previous_onchain_fear = 0.0
 # The decay factor is critical for simulating market 'memory'
 FEAR_DECAY_RATE = 0.94 
 
@@ -45,6 +46,9 @@ def calculate_lyapunov_divergence(series: list) -> float:
     x_data = np.arange(len(series))
     y_data = np.array(series)
     
+    # scipy is only needed by this reference fit; the live path is LyapunovEstimator
+    from scipy.optimize import curve_fit
+
     try:
         # Performing non-linear regression to find the chaotic trend
         popt, _ = curve_fit(
@@ -62,6 +66,217 @@ def calculate_lyapunov_divergence(series: list) -> float:
     except Exception:
         return 0.08 # Safe recovery value for the nervous system
 
+class LyapunovEstimator:
+    """
+    Incremental divergence estimator for one sensor series.
+    Fits the same attractor (a * exp(b * x) + c) as calculate_lyapunov_divergence,
+    but by variable projection: for a fixed growth rate b, the amplitude a and
+    offset c are a closed-form linear least-squares solution, so only b is searched.
+
+    Per-series fit state:
+      * the centred projection basis for every window length (built once, shared),
+      * the last fitted growth rate, which warm-starts the next tick (the first
+        fit starts from a log-linear closed-form guess instead).
+
+    A warm tick scans only WARM_RADIUS grid rates either side of the start,
+    in scalar code for the one window. It keeps that minimum only if it is
+    interior and no rate of a coarse full-grid pass beats it. If the rate has
+    jumped, the bracket around the best coarse rate is tried next, and only
+    then does the tick fall back to the full vectorized search of fit_windows.
+
+    Contract: the fit lands on the global least-squares optimum, so scores
+    match a fully converged curve_fit within CONVERGED_TOLERANCE at the max.
+    The cold p0=[0.1, 0.1, 0.1] start of calculate_lyapunov_divergence
+    sometimes stalls near the linear limit at a higher residual. Against it,
+    scores agree within SCORE_TOLERANCE at the 99th percentile only; single
+    stalled ticks differ by more (see benchmarks/bench_lyapunov.py).
+    """
+
+    # Growth-rate grid: sinh spacing keeps resolution near the linear limit (b = 0)
+    B_GRID = np.sinh(np.linspace(-3.0, 3.0, 1025)) / np.sinh(3.0) * 2.0
+    SCORE_TOLERANCE = 0.05      # vs the cold curve_fit, 99th percentile
+    CONVERGED_TOLERANCE = 1e-5  # vs a converged curve_fit, max
+    WARM_RADIUS = 48            # grid rates scanned either side of a warm start
+    COARSE_STEP = 16            # stride of the full-grid check on a warm tick
+    FIT_CHUNK = 512             # windows fitted at once: bounds the chunk x B_GRID residual block
+    _BASES = {}
+    _WARM = {}
+
+    def __init__(self):
+        self.growth_rate = 0.0
+        self._rate_index: Optional[int] = None
+
+    @staticmethod
+    def _basis(rates: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """(exp(b*x) - 1) / b, with the linear limit x at b = 0; spans the same fits as exp(b*x)."""
+        safe = np.where(rates == 0.0, 1.0, rates)
+        g = np.expm1(np.multiply.outer(rates, x)) / safe[..., None]
+        g[rates == 0.0] = x
+        return g - g.mean(axis=-1, keepdims=True)
+
+    @classmethod
+    def _grid(cls, n: int):
+        cached = cls._BASES.get(n)
+        if cached is None:
+            with np.errstate(over="ignore", invalid="ignore"):
+                gc = cls._basis(cls.B_GRID, np.arange(n, dtype=np.float64))
+            # Long windows push exp(b*x) towards overflow; the profiled residual is
+            # scale-free per rate, so rescale rows and retire the ones that overflowed
+            scale = np.abs(gc).max(axis=1)
+            usable = (scale > 0.0) & (scale < 1e150) # |g|^2 of the final fit stays finite
+            gc = np.where(usable[:, None], gc / np.where(usable, scale, 1.0)[:, None], 0.0)
+            sgg = np.einsum("ij,ij->i", gc, gc)
+            sgg[~usable] = np.inf
+            cached = (np.ascontiguousarray(gc.T), sgg)
+            cls._BASES[n] = cached
+        return cached
+
+    @classmethod
+    def _warm_grid(cls, n: int):
+        """Row-major basis, its coarse stride, and the x / linear ramps of one window length."""
+        cached = cls._WARM.get(n)
+        if cached is None:
+            gc_t, sgg = cls._grid(n)
+            gc = np.ascontiguousarray(gc_t.T)
+            coarse = slice(None, None, cls.COARSE_STEP)
+            x = np.arange(n, dtype=np.float64)
+            cached = (gc, sgg, np.ascontiguousarray(gc[coarse]), sgg[coarse], x, x / (n - 1))
+            cls._WARM[n] = cached
+        return cached
+
+    @classmethod
+    def log_linear_guess(cls, y: np.ndarray) -> int:
+        """B_GRID index of b from a closed-form fit of log|y - c| = log|a| + b * x."""
+        span = float(y.max() - y.min())
+        if not span > 0.0:
+            return len(cls.B_GRID) // 2 # Flat window: the linear limit
+        # c just beyond the end the curve bends away from (a > 0: below the minimum)
+        z = np.log(y - y.min() + 0.05 * span) if y[-1] >= y[0] else np.log(y.max() - y + 0.05 * span)
+        x = np.arange(len(y), dtype=np.float64) - (len(y) - 1) / 2.0
+        b = float(np.dot(x, z) / np.dot(x, x))
+        return int(np.clip(np.searchsorted(cls.B_GRID, b), 1, len(cls.B_GRID) - 2))
+
+    @classmethod
+    def fit_windows(cls, windows: np.ndarray):
+        """
+        Vectorized fit of M equal-length windows (M x n, n >= 5).
+        Returns (scores, growth_rates), one entry per window.
+        Runs FIT_CHUNK windows at a time, so memory stays flat in M.
+        """
+        y = np.array(windows, dtype=np.float64, ndmin=2)
+        if y.shape[0] > cls.FIT_CHUNK:
+            parts = [cls.fit_windows(y[lo:lo + cls.FIT_CHUNK]) for lo in range(0, y.shape[0], cls.FIT_CHUNK)]
+            return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+        m, n = y.shape
+        finite = np.isfinite(y).all(axis=1)
+        y[~finite] = 0.0
+
+        gc_t, sgg = cls._grid(n)
+        mean = y.mean(axis=1)
+        yc = y - mean[:, None]
+        sgy = yc @ gc_t
+        # Profiled residual: SSE(b) = |yc|^2 - <g,yc>^2 / |g|^2
+        sse = -(sgy * sgy) / sgg
+        j = np.argmin(sse, axis=1)
+
+        last = len(cls.B_GRID) - 1
+        runaway = (j == 0) | (j == last)
+        if runaway.any():
+            # Runaway growth rate (a single-point spike): like curve_fit, settle in
+            # the best interior basin, or in the linear limit if there is none
+            s = sse[runaway]
+            inner = s[:, 1:-1]
+            basin = (inner <= s[:, :-2]) & (inner <= s[:, 2:])
+            k = np.argmin(np.where(basin, inner, np.inf), axis=1)
+            j[runaway] = np.where(basin.any(axis=1), k + 1, last // 2)
+
+        # Parabolic refinement of b through the three neighbouring grid points
+        rows = np.arange(m)
+        b0, b1, b2 = cls.B_GRID[j - 1], cls.B_GRID[j], cls.B_GRID[j + 1]
+        s0, s1, s2 = sse[rows, j - 1], sse[rows, j], sse[rows, j + 1]
+        num = (b1 - b0) ** 2 * (s1 - s2) - (b1 - b2) ** 2 * (s1 - s0)
+        den = (b1 - b0) * (s1 - s2) - (b1 - b2) * (s1 - s0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vertex = b1 - 0.5 * num / den
+        b = np.where((den != 0.0) & (b0 < vertex) & (vertex < b2), vertex, b1)
+
+        g = cls._basis(b, np.arange(n, dtype=np.float64))
+        ss = np.einsum("ij,ij->i", g, g)
+        beta = np.divide(np.einsum("ij,ij->i", g, yc), ss, out=np.zeros(m), where=ss > 0.0)
+        fit = mean[:, None] + g * beta[:, None]
+
+        # Linear vs. Chaos Comparison
+        linear_projection = np.linspace(y[:, 0], y[:, -1], n, axis=1)
+        chaos_divergence = np.abs(fit - linear_projection).mean(axis=1)
+        scores = np.minimum(1.0, chaos_divergence / 0.35)
+        scores[~finite] = 0.08 # Safe recovery value for the nervous system
+        return scores, b
+
+    def _warm_fit(self, y: np.ndarray) -> Optional[float]:
+        """fit_windows for one window, searched around the last rate; None if the search must widen."""
+        n = y.shape[0]
+        gc, sgg, coarse_gc, coarse_sgg, x, ramp = self._warm_grid(n)
+        mean = float(y.mean())
+        if not math.isfinite(mean):
+            return None
+        yc = y - mean
+        sgy = coarse_gc @ yc
+        coarse = sgy * sgy / coarse_sgg # |yc|^2 - SSE(b) on every COARSE_STEP-th rate
+        floor = coarse.max()
+        warm = self._rate_index if self._rate_index is not None else self.log_linear_guess(y)
+        peak = int(coarse.argmax()) * self.COARSE_STEP
+        # The warm bracket, plus the best coarse rate's when the rate jumped or
+        # another basin competes; the better interior minimum wins
+        starts = (warm,) if abs(peak - warm) < self.WARM_RADIUS else (warm, peak)
+        found = None
+        for start in starts:
+            lo = max(0, start - self.WARM_RADIUS)
+            hi = min(len(self.B_GRID), start + self.WARM_RADIUS + 1)
+            sgy = gc[lo:hi] @ yc
+            explained = sgy * sgy / sgg[lo:hi]
+            k = int(explained.argmax())
+            # Interior: not still rising past the bracket edge
+            if 0 < k < hi - lo - 1 and (found is None or explained[k] > found[2][found[1]]):
+                found = (lo, k, explained)
+        if found is None or found[2][found[1]] < floor:
+            return None # Runaway or unresolved window: full search
+        lo, k, explained = found
+        best = explained[k]
+
+        # Parabolic refinement of b, as in fit_windows
+        j = lo + k
+        b0, b1, b2 = self.B_GRID[j - 1], self.B_GRID[j], self.B_GRID[j + 1]
+        s0, s1, s2 = -explained[k - 1], -best, -explained[k + 1]
+        num = (b1 - b0) ** 2 * (s1 - s2) - (b1 - b2) ** 2 * (s1 - s0)
+        den = (b1 - b0) * (s1 - s2) - (b1 - b2) * (s1 - s0)
+        b = b1
+        if den != 0.0 and b0 < b1 - 0.5 * num / den < b2:
+            b = b1 - 0.5 * num / den
+
+        g = np.expm1(b * x) / b if b != 0.0 else x.copy()
+        g -= g.mean()
+        ss = float(np.dot(g, g))
+        beta = float(np.dot(g, yc)) / ss if ss > 0.0 else 0.0
+        # Linear vs. Chaos Comparison
+        linear_projection = y[0] + (y[-1] - y[0]) * ramp
+        chaos_divergence = float(np.abs(g * beta + (mean - linear_projection)).mean())
+        self.growth_rate = float(b)
+        self._rate_index = j
+        return min(1.0, chaos_divergence / 0.35)
+
+    def update(self, series) -> float:
+        """Returns the chaos score for the current window, warm-started from the last fit."""
+        y = np.asarray(series, dtype=np.float64)
+        if y.shape[0] < 5:
+            return 0.05 # Minimum seed to maintain systemic flow
+        score = self._warm_fit(y)
+        if score is None:
+            scores, rates = self.fit_windows(y)
+            score = float(scores[0])
+            self.growth_rate = float(rates[0])
+            self._rate_index = int(np.clip(np.searchsorted(self.B_GRID, rates[0]), 1, len(self.B_GRID) - 2))
+        return score
+
 # -----------------------------------------------------------
 # 2. NETWORK INGESTION (Proprioception)
 # -----------------------------------------------------------
@@ -80,49 +295,185 @@ def fetch_network_vitals() -> Dict[str, float]:
 # 3. THE EVENT HORIZON ENGINE (Calculation Core)
 # -----------------------------------------------------------
 
-def calculate_gravity_well() -> Dict[str, Any]:
+class GravityWellEngine:
     """
-    Main engine: Aggregates entropy, inertia, and chaos into a singular fear index.
-    Implements 'Organ Cross-Talk' where different sensors affect each other's gain.
+    Event Horizon engine for N independent chains or pools.
+    Each chain owns a preallocated ring buffer per sensor series (VITAL_KEYS)
+    and its own fear inertia, so one process can track dozens of markets.
     """
-    global previous_onchain_fear
-    
-    # 1. Sense the environment
-    vitals = fetch_network_vitals()
-    
-    # 2. Map the Attractor (Non-linear prediction)
-    chaos_gas = calculate_lyapunov_divergence(gas_history)
-    chaos_mev = calculate_lyapunov_divergence(mev_history)
-    attractor_score = (chaos_gas + chaos_mev) / 2
 
-    # 3. Logic for Collapse Alignment
-    # Detects when multiple sensors align in a 'panic signal'
-    alignment_count = 2 # Abstracted logic
+    def __init__(self, n_chains: int = 1, history_max: int = HISTORY_MAX,
+                 buffers: Optional[Dict[str, np.ndarray]] = None):
+        self.n_chains = int(n_chains)
+        self.history_max = int(history_max)
+        # history[chain, series, slot]; head is the next slot to write
+        self.history = np.zeros((self.n_chains, len(VITAL_KEYS), self.history_max))
+        self.head = np.zeros(self.n_chains, dtype=np.int64)
+        self.count = np.zeros(self.n_chains, dtype=np.int64)
+        # Recursive Memory (The Fear Aggregator Organ), one per chain
+        self.previous_fear = np.zeros(self.n_chains)
+        if buffers is not None:
+            # Externally owned state (e.g. shared memory), same keys as state_dict()
+            for name, default in self.state_dict().items():
+                buf = buffers[name]
+                if buf.shape != default.shape or buf.dtype != default.dtype:
+                    raise ValueError(f"buffer {name!r} must be {default.dtype}{default.shape}")
+                setattr(self, name, buf)
+        self._attractors = [
+            (LyapunovEstimator(), LyapunovEstimator()) for _ in range(self.n_chains)
+        ]
 
-    # 4. ORGAN CROSS-TALK Logic
-    # PRANA components (fragility, energy) modulate the final perception
-    fear_multiplier = 1.15 # Dynamic scaling based on system state
+    # --- Ring buffers ---
 
-    # 5. FEAR AGGREGATION & INERTIA
-    instant_fear = (vitals["gas_v"] * 0.2) + (vitals["mev_a"] * 0.4) + attractor_score
-    
-    # Nonlinear sensitivity (Power law scaling)
-    sensitive_fear = min(1.0, instant_fear ** 0.72)
+    def _push(self, chains: np.ndarray, values: np.ndarray):
+        self.history[chains, :, self.head[chains]] = values
+        self.head[chains] = (self.head[chains] + 1) % self.history_max
+        self.count[chains] = np.minimum(self.count[chains] + 1, self.history_max)
 
-    # Recursive Memory (The Fear Aggregator Organ)
-    aggregated_fear = max(sensitive_fear, previous_onchain_fear * FEAR_DECAY_RATE)
-    previous_onchain_fear = aggregated_fear
+    def windows(self, chains=None) -> np.ndarray:
+        """Chronological view (chains x series x history_max); rows with count < history_max are left-aligned."""
+        chains = np.arange(self.n_chains) if chains is None else np.atleast_1d(chains)
+        start = (self.head[chains] - self.count[chains]) % self.history_max
+        idx = (start[:, None] + np.arange(self.history_max)) % self.history_max
+        return np.take_along_axis(self.history[chains], idx[:, None, :], axis=2)
 
-    # 6. Event Horizon Detection (The Point of No Return)
-    is_event_horizon = aggregated_fear > 0.78 and attractor_score > 0.5
+    def series(self, key: str, chain: int = 0) -> np.ndarray:
+        """Chronological history of one sensor series for one chain."""
+        window = self.windows(chain)[0, VITAL_KEYS.index(key)]
+        return window[:self.count[chain]]
 
-    return {
-        "gravity_index": round(aggregated_fear, 3),
-        "chaos_attractor": round(attractor_score, 3),
-        "event_horizon": is_event_horizon,
-        "dynamic_sleep": 10 if is_event_horizon else 60,
-        "status": "OPERATIONAL"
-    }
+    # --- Snapshots ---
+
+    def state_dict(self) -> Dict[str, np.ndarray]:
+        """Ring buffers and fear inertia as NumPy arrays (copies)."""
+        return {
+            "history": self.history.copy(),
+            "head": self.head.copy(),
+            "count": self.count.copy(),
+            "previous_fear": self.previous_fear.copy(),
+        }
+
+    def load_state_dict(self, state: Dict[str, np.ndarray]):
+        """Restores a state_dict taken from an engine with the same n_chains and history_max."""
+        if np.shape(state["history"]) != self.history.shape:
+            raise ValueError(
+                f"snapshot history shape {np.shape(state['history'])} does not match engine {self.history.shape}"
+            )
+        self.history[...] = state["history"]
+        self.head[...] = state["head"]
+        self.count[...] = state["count"]
+        self.previous_fear[...] = state["previous_fear"]
+        # Estimators refit on the restored windows at the next tick
+        self._attractors = [
+            (LyapunovEstimator(), LyapunovEstimator()) for _ in range(self.n_chains)
+        ]
+
+    # --- Fear aggregation ---
+
+    def _aggregate(self, chains: np.ndarray, vitals: np.ndarray, attractor: np.ndarray):
+        # 3. Logic for Collapse Alignment
+        # Detects when multiple sensors align in a 'panic signal'
+        alignment_count = 2 # Abstracted logic
+
+        # 4. ORGAN CROSS-TALK Logic
+        # PRANA components (fragility, energy) modulate the final perception
+        fear_multiplier = 1.15 # Dynamic scaling based on system state
+
+        # 5. FEAR AGGREGATION & INERTIA
+        instant_fear = (vitals[:, 0] * 0.2) + (vitals[:, 1] * 0.4) + attractor
+
+        # Nonlinear sensitivity (Power law scaling)
+        sensitive_fear = np.minimum(1.0, instant_fear ** 0.72)
+
+        # Recursive Memory (The Fear Aggregator Organ)
+        aggregated = np.maximum(sensitive_fear, self.previous_fear[chains] * FEAR_DECAY_RATE)
+        self.previous_fear[chains] = aggregated
+
+        # 6. Event Horizon Detection (The Point of No Return)
+        horizon = (aggregated > 0.78) & (attractor > 0.5)
+        return aggregated, horizon
+
+    def update(self, vitals: Dict[str, float], chain: int = 0) -> GravityReading:
+        """Advances one chain by one tick of vitals."""
+        values = np.array([[float(vitals[k]) for k in VITAL_KEYS]])
+        chains = np.array([chain])
+        self._push(chains, values)
+
+        # 2. Map the Attractor (Non-linear prediction)
+        gas_attractor, mev_attractor = self._attractors[chain]
+        window = self.series("gas_v", chain), self.series("mev_a", chain)
+        attractor_score = (gas_attractor.update(window[0]) + mev_attractor.update(window[1])) / 2
+
+        aggregated, horizon = self._aggregate(chains, values, np.array([attractor_score]))
+        is_event_horizon = bool(horizon[0])
+
+        return GravityReading(
+            gravity_index=round(float(aggregated[0]), 3),
+            chaos_attractor=round(attractor_score, 3),
+            event_horizon=is_event_horizon,
+            dynamic_sleep=10 if is_event_horizon else 60,
+            status="OPERATIONAL"
+        )
+
+    def update_many(self, vitals_batch) -> Dict[str, np.ndarray]:
+        """
+        Advances every chain by one tick in a single vectorized step.
+        vitals_batch: (n_chains x 3) array in VITAL_KEYS order, or one vitals dict per chain.
+        Returns unrounded columnar arrays, one entry per chain.
+        """
+        if len(vitals_batch) and isinstance(vitals_batch[0], dict):
+            vitals_batch = [[v[k] for k in VITAL_KEYS] for v in vitals_batch]
+        values = np.asarray(vitals_batch, dtype=np.float64).reshape(self.n_chains, len(VITAL_KEYS))
+        chains = np.arange(self.n_chains)
+        self._push(chains, values)
+
+        # 2. Map the Attractor: one batched fit per window length (all chains once warm),
+        # gathering the windows of FIT_CHUNK / 2 chains (two series each) at a time
+        attractor = np.full(self.n_chains, 0.05)
+        step = max(1, LyapunovEstimator.FIT_CHUNK // 2)
+        for lo in range(0, self.n_chains, step):
+            block = chains[lo:lo + step]
+            windows = self.windows(block)
+            count = self.count[block]
+            for n in np.unique(count):
+                if n < 5:
+                    continue
+                rows = np.flatnonzero(count == n)
+                scores, _ = LyapunovEstimator.fit_windows(windows[rows, :2, :n].reshape(-1, n))
+                attractor[block[rows]] = scores.reshape(-1, 2).mean(axis=1)
+
+        aggregated, horizon = self._aggregate(chains, values, attractor)
+        return {
+            "gravity_index": aggregated,
+            "chaos_attractor": attractor,
+            "event_horizon": horizon,
+            "dynamic_sleep": np.where(horizon, 10, 60),
+        }
+
+# Default single-chain engine behind the module-level API
+default_engine = GravityWellEngine()
+
+# Legacy module globals, now read-only views of default_engine's state
+_LEGACY_HISTORIES = {"gas_history": "gas_v", "mev_history": "mev_a", "liq_history": "liq_p"}
+
+def __getattr__(name: str):
+    if name in _LEGACY_HISTORIES:
+        return default_engine.series(_LEGACY_HISTORIES[name]).tolist()
+    if name == "previous_onchain_fear":
+        return float(default_engine.previous_fear[0])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def calculate_gravity_well(vitals: Optional[Dict[str, float]] = None) -> GravityReading:
+    """
+    Main engine: Aggregates entropy, inertia, and chaos into a singular fear index.
+    Implements 'Organ Cross-Talk' where different sensors affect each other's gain.
+    Compatibility shim over default_engine; vitals may be pushed in by the gateway.
+    Returns a GravityReading record (reads like the old dict; as_dict() for JSON).
+    """
+    # 1. Sense the environment
+    if vitals is None:
+        vitals = fetch_network_vitals()
+    return default_engine.update(vitals)
 
 if __name__ == "__main__":
     print("--- PRANA ON-CHAIN ENGINE: CHAOS ATTRACTOR ACTIVE ---")
@@ -0,0 +1,28 @@
+# =================================================================
+# subconscious_brain.py — PRANA SUBCONSCIOUS BRAIN (Neural Architecture)
+# © 2026 Antonii Iliev Velkov
+# INNOVATION: 12-Dimensional Market Proprioception Core
+# =================================================================
+
+# Kept apart from thalamic_junction so that importing the junction never pulls
+# in torch: the junction imports this module on first use of the brain.
+
+import torch.nn as nn
+
+class SubconsciousBrain(nn.Module):
+    def __init__(self, input_dim=12): 
+        """
+        Neural core designed to process 12 dimensions of market proprioception:
+        Values, Deltas, Nervous Tension, and Circadian Rhythms.
+        """
+        super().__init__()
+        self.network = nn.Sequential(
+            nn.Linear(input_dim, 32),
+            nn.Tanh(), # Biological saturation function (Tanh handles non-linear limits)
+            nn.Linear(32, 16),
+            nn.ReLU(),
+            nn.Linear(16, 4) # Outputs: [Action_Potential, Sensory_Gain, Energy_Gate, Mood_Tone]
+        )
+
+    def forward(self, x):
+        return self.network(x)
@@ -0,0 +1,5 @@
+# PRANA's organs are flat top-level modules: make them importable under plain `pytest`
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import pytest
+
+from sensory_gateway import VitalSource, VitalsGateway
+from sensory_onchain_ingestor import fetch_network_vitals
+
+class _Response:
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    def json(self):
+        return self.payload
+
+class StubSession:
+    """requests.Session stand-in: url -> list of scripted (delay, payload, status) replies."""
+
+    def __init__(self, script):
+        self.script = {url: list(replies) for url, replies in script.items()}
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        delay, payload, status = self.script[url].pop(0)
+        if delay:
+            time.sleep(delay)
+        if isinstance(payload, Exception):
+            raise payload
+        return _Response(payload, status)
+
+    def close(self):
+        self.closed = True
+
+def _gateway(script, sources, queue_size=4):
+    return VitalsGateway(sources, queue_size=queue_size, session=StubSession(script))
+
+@pytest.fixture
+def closing():
+    gateways = []
+    yield gateways.append
+    for gateway in gateways:
+        gateway.close()
+
+def test_live_readings_are_merged_and_remembered(closing):
+    sources = [
+        VitalSource("gas-a", "http://a", "gas_v"),
+        VitalSource("gas-b", "http://b", "gas_v"),
+        VitalSource("mev", "http://m", "mev_a"),
+    ]
+    gateway = _gateway({
+        "http://a": [(0, {"gas_v": 0.4}, 200)],
+        "http://b": [(0, {"value": 0.6}, 200)],
+        "http://m": [(0, 0.9, 200)],
+    }, sources)
+    closing(gateway)
+    vitals = asyncio.run(gateway.sample())
+    assert vitals["gas_v"] == pytest.approx(0.5) # Two sources of one vital are averaged
+    assert vitals["mev_a"] == pytest.approx(0.9)
+    assert vitals["liq_p"] == fetch_network_vitals()["liq_p"] # No source: resting baseline
+    assert sources[0].last_good == 0.4 and sources[0].last_good_ts > 0
+    assert all(source.failures == 0 for source in sources)
+
+def test_timeout_falls_back_to_last_known_good(closing):
+    source = VitalSource("slow", "http://slow", "liq_p", timeout=0.05)
+    gateway = _gateway({"http://slow": [(0, 0.7, 200), (0.3, 0.1, 200)]}, [source])
+    closing(gateway)
+    assert asyncio.run(gateway.fetch_source(source)) == 0.7
+    remembered = source.last_good_ts
+
+    t0 = time.perf_counter()
+    assert asyncio.run(gateway.fetch_source(source)) == 0.7
+    assert time.perf_counter() - t0 < 0.25 # Only the source's own timeout is paid
+    assert source.failures == 1
+    assert source.last_good == 0.7 and source.last_good_ts == remembered
+
+def test_errors_without_a_reading_keep_the_baseline(closing):
+    sources = [
+        VitalSource("down", "http://down", "gas_v"),
+        VitalSource("broken", "http://broken", "mev_a"),
+        VitalSource("garbled", "http://garbled", "liq_p"),
+    ]
+    gateway = _gateway({
+        "http://down": [(0, None, 503)],
+        "http://broken": [(0, ConnectionError("reset"), 200)],
+        "http://garbled": [(0, {"unexpected": 1}, 200)],
+    }, sources)
+    closing(gateway)
+    assert asyncio.run(gateway.sample()) == fetch_network_vitals()
+    assert [source.failures for source in sources] == [1, 1, 1]
+    assert all(source.last_good is None for source in sources)
+
+def test_full_queue_drops_the_oldest_sample(closing):
+    source = VitalSource("gas", "http://gas", "gas_v")
+    readings = [0.1, 0.2, 0.3, 0.4, 0.5]
+    gateway = _gateway({"http://gas": [(0, r, 200) for r in readings]}, [source], queue_size=2)
+    closing(gateway)
+    asyncio.run(gateway.produce(ticks=len(readings)))
+    assert gateway.dropped == 3
+    queued = [gateway.queue.get_nowait()["gas_v"] for _ in range(gateway.queue.qsize())]
+    assert queued == pytest.approx([0.4, 0.5])
+
+def test_consume_feeds_queued_vitals_to_the_gravity_well(closing):
+    source = VitalSource("gas", "http://gas", "gas_v")
+    gateway = _gateway({"http://gas": [(0, 0.3, 200), (0, 0.6, 200)]}, [source])
+    closing(gateway)
+    seen = []
+
+    async def run():
+        await gateway.produce(ticks=2)
+        await gateway.consume(ticks=2, gravity=lambda vitals: vitals["gas_v"], on_tick=seen.append)
+
+    asyncio.run(run())
+    assert seen == pytest.approx([0.3, 0.6])
+    assert gateway.dropped == 0
+
+def test_close_releases_the_session():
+    gateway = _gateway({}, [VitalSource("gas", "http://gas", "gas_v")])
+    gateway.close()
+    assert gateway.session.closed
@@ -0,0 +1,82 @@
+import pytest
+
+from prana_scheduler import (
+    CHAOS_HORIZON,
+    GRAVITY_HORIZON,
+    AdaptiveScheduler,
+    Sensor,
+    SimulatedClock,
+)
+
+def _scheduler(sensors, fetch=None, coalesce=0.0):
+    calls = []
+
+    def fetch_batch(names):
+        calls.append((clock.now(), tuple(names)))
+        return {name: 1.0 for name in names} if fetch is None else fetch(names)
+
+    clock = SimulatedClock()
+    return AdaptiveScheduler(sensors, fetch_batch, clock=clock, coalesce=coalesce), calls
+
+def test_batches_follow_deadlines():
+    sensors = [Sensor("fast", 5, 10), Sensor("mid", 5, 20), Sensor("slow", 5, 40)]
+    scheduler, calls = _scheduler(sensors)
+    scheduler.run(until=40.0)
+    assert [(t, set(names)) for t, names in calls] == [
+        (0.0, {"fast", "mid", "slow"}),
+        (10.0, {"fast"}),
+        (20.0, {"fast", "mid"}),
+        (30.0, {"fast"}),
+        (40.0, {"fast", "mid", "slow"}),
+    ]
+
+def test_coalesce_merges_nearby_deadlines():
+    scheduler, calls = _scheduler([Sensor("a", 5, 10), Sensor("b", 5, 10.4)], coalesce=0.5)
+    scheduler.poll_once()
+    scheduler.poll_once()
+    assert calls[1][0] == 10.0 and set(calls[1][1]) == {"a", "b"}
+
+def test_urgency_pulls_deadlines_in_and_calm_relaxes_gradually():
+    sensor = Sensor("chain", min_interval=5, max_interval=120, relax=2.0)
+    scheduler, calls = _scheduler([sensor])
+    scheduler.poll_once()
+    assert scheduler.next_deadline() == 120.0
+
+    scheduler.observe(gravity_index=GRAVITY_HORIZON, chaos_attractor=CHAOS_HORIZON)
+    assert sensor.interval == pytest.approx(5.0)
+    assert scheduler.next_deadline() == pytest.approx(5.0)
+
+    scheduler.observe(gravity_index=0.0, chaos_attractor=0.0)
+    gaps = []
+    for _ in range(6):
+        before = scheduler.clock.now()
+        scheduler.poll_once()
+        gaps.append(scheduler.clock.now() - before)
+    assert gaps == pytest.approx([5, 10, 20, 40, 80, 120])
+
+def test_failed_fetch_is_a_miss_not_a_lost_sensor():
+    failures = iter([False, True, False, False])
+
+    def flaky(names):
+        if next(failures):
+            raise TimeoutError("gateway timed out")
+        return {name: 1.0 for name in names}
+
+    sensor = Sensor("chain", 5, 10)
+    scheduler, calls = _scheduler([sensor], fetch=flaky)
+    assert scheduler.run(polls=4) == 4
+    assert (sensor.polls, sensor.misses) == (3, 1)
+    assert isinstance(scheduler.last_error, TimeoutError)
+    assert [t for t, _ in calls] == [0.0, 10.0, 20.0, 30.0]
+    assert scheduler.next_deadline() == 40.0
+
+def test_simulated_runs_are_deterministic():
+    def run():
+        sensors = [Sensor("a", 5, 60), Sensor("b", 5, 120, weights=(0.0, 0.0, 1.0))]
+        scheduler, calls = _scheduler(sensors, coalesce=0.5)
+        for step in range(20):
+            scheduler.poll_once()
+            scheduler.observe(gravity_index=0.04 * step, nervous_tension=0.05 * (20 - step))
+        return calls, scheduler.stats()
+
+    assert run() == run()
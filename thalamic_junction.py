@@ -4,77 +4,122 @@
 # INNOVATION: Nervous Tension Analysis & Circadian Rhythm Integration
 # =================================================================
 
+import copy
+import sys
 import time
 import math
-import torch
-import torch.nn as nn
-from typing import Dict, Any, List
+import threading
+from operator import attrgetter
+import numpy as np
+from typing import Dict, Any, List, Optional, Sequence, TYPE_CHECKING
+
+from prana_records import Command, Echo, Pulse
+from prana_threads import lower_thread_priority
+
+if TYPE_CHECKING:
+    import torch
+
+# torch is imported on first use: workers that only need the laws, the Shadow
+# or the Bicameral Mind never pay its multi-second import.
 
 # ─────────────────────────────────────────────────────────────────
 # SECTION 1: NEURAL ARCHITECTURE (THE SUBCONSCIOUS BRAIN)
 # ─────────────────────────────────────────────────────────────────
 
-class SubconsciousBrain(nn.Module):
-    def __init__(self, input_dim=12): 
-        """
-        Neural core designed to process 12 dimensions of market proprioception:
-        Values, Deltas, Nervous Tension, and Circadian Rhythms.
-        """
-        super().__init__()
-        self.network = nn.Sequential(
-            nn.Linear(input_dim, 32),
-            nn.Tanh(), # Biological saturation function (Tanh handles non-linear limits)
-            nn.Linear(32, 16),
-            nn.ReLU(),
-            nn.Linear(16, 4) # Outputs: [Action_Potential, Sensory_Gain, Energy_Gate, Mood_Tone]
-        )
-
-    def forward(self, x):
-        return self.network(x)
-
-# Initialization of the neural engine
-brain = SubconsciousBrain(input_dim=12)
-optimizer = torch.optim.Adam(brain.parameters(), lr=0.001)
+def _brain_class():
+    """SubconsciousBrain, imported on first use (its module needs torch.nn)."""
+    from subconscious_brain import SubconsciousBrain
+    return SubconsciousBrain
+
+# The neural engine is initialized on first use
+_brain = None
+_optimizer = None
+
+# Weights restored from a snapshot before torch was needed (applied on first use)
+_pending_state: Optional[Dict[str, np.ndarray]] = None
+# Bumped whenever the inference weights are replaced (derived kernels reload on change)
+_brain_version = 0
+
+def get_brain():
+    """Returns the inference SubconsciousBrain, building it on first use."""
+    global _brain, _pending_state
+    if _brain is None:
+        brain = _brain_class()(input_dim=12)
+        if _pending_state is not None:
+            import torch
+            brain.load_state_dict({k: torch.from_numpy(np.array(v)) for k, v in _pending_state.items()})
+            _pending_state = None
+        _brain = brain
+    return _brain
+
+def get_optimizer():
+    """Returns the Adam optimizer over get_brain(), building it on first use."""
+    global _optimizer
+    if _optimizer is None:
+        import torch
+        _optimizer = torch.optim.Adam(get_brain().parameters(), lr=0.001)
+    return _optimizer
+
+def __getattr__(name: str):
+    # Module-level `SubconsciousBrain`, `brain` and `optimizer` stay importable
+    # (old pickles of thalamic_junction.SubconsciousBrain resolve through here too)
+    if name == "SubconsciousBrain":
+        return _brain_class()
+    if name == "brain":
+        return get_brain()
+    if name == "optimizer":
+        return get_optimizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ─────────────────────────────────────────────────────────────────
 # SECTION 2: PULSE GENERATION & CIRCADIAN RHYTHM
 # ─────────────────────────────────────────────────────────────────
 
-def generate_impulse(state: Dict[str, Any]) -> Dict[str, Any]:
+def circadian_phase(now: float) -> float:
+    """
+    Innovation: Circadian Cycle (Sinusoidal activity wave)
+    Simulates a ~6.28 hour energy cycle based on systemic time
+    """
+    return (math.sin(now / 3600) + 1) / 2
+
+def generate_impulse(state: Dict[str, Any]) -> Pulse:
     """
     Generates the primary scanning pulse with an integrated 'Bio-Rhythm'.
     PRANA experiences natural peaks and troughs in energy, simulating organic life.
+    Returns a Pulse record (reads like the old dict; as_dict() for JSON).
     """
     now = time.time()
+    rhythm = circadian_phase(now)
     
-    # Innovation: Circadian Cycle (Sinusoidal activity wave)
-    # Simulates a ~6.28 hour energy cycle based on systemic time
-    rhythm = (math.sin(now / 3600) + 1) / 2 
-    
-    return {
-        "voltage": float(state.get("system", {}).get("energy", 1.0)) * (0.8 + 0.2 * rhythm),
-        "echo": {}, 
-        "rhythm_phase": round(rhythm, 3),
-        "ts": now
-    }
+    return Pulse(
+        voltage=float(state.get("system", {}).get("energy", 1.0)) * (0.8 + 0.2 * rhythm),
+        echo=Echo(),
+        rhythm_phase=round(rhythm, 3),
+        ts=now
+    )
 
 # ─────────────────────────────────────────────────────────────────
 # SECTION 3: DIFFERENTIAL NERVOUS ANALYSIS (SOUL LOGIC)
 # ─────────────────────────────────────────────────────────────────
 
-def process_echo(current_pulse: Dict[str, Any], last_pulse: Dict[str, Any]) -> Dict[str, float]:
-    """
-    ML Analysis of organ 'Echoes'. 
-    Detects 'Nervous Tension' by analyzing the acceleration of change (Systemic Jitter).
-    """
-    keys = ["stress", "entropy", "toxicity", "glycogen", "predictive_error"]
+# Organ readings carried in every pulse echo, in input-vector order
+ECHO_KEYS = Echo.FIELDS
+
+def _echo_values(echo) -> List[float]:
+    if type(echo) is Echo:
+        return echo.values()
+    return [float(echo.get(k, 0.0)) for k in ECHO_KEYS]
+
+def _echo_features(current_pulse: Dict[str, Any], last_pulse: Dict[str, Any]):
+    """Returns the 12 input features (Values + Deltas + Tension + Rhythm) and the tension."""
+    keys = ECHO_KEYS
     
-    # 1. Capture current sensor values
-    current_vals = [float(current_pulse["echo"].get(k, 0.0)) for k in keys]
+    # 1. Capture current sensor values (Pulse records or pulse dicts)
+    current_vals = _echo_values(current_pulse["echo"])
     
     # 2. Calculate Deltas and Nervous Tension (High-frequency drift)
     if last_pulse:
-        last_vals = [float(last_pulse["echo"].get(k, 0.0)) for k in keys]
+        last_vals = _echo_values(last_pulse["echo"])
         deltas = [c - l for c, l in zip(current_vals, last_vals)]
         # Innovation: Tension is the sum of absolute accelerations in data drift
         tension = sum([abs(d) for d in deltas])
@@ -82,35 +127,501 @@ def process_echo(current_pulse: Dict[str, Any], last_pulse: Dict[str, Any]) -> D
         deltas = [0.0] * len(keys)
         tension = 0.0
 
-    # 3. Construct Input Vector (12-dimensions: Values + Deltas + Tension + Rhythm)
-    input_vector = torch.tensor(current_vals + deltas + [tension, current_pulse.get("rhythm_phase", 0.5)]).float().view(1, -1)
+    return current_vals + deltas + [tension, current_pulse.get("rhythm_phase", 0.5)], tension
+
+def build_input_vector(current_pulse: Dict[str, Any], last_pulse: Dict[str, Any]) -> "torch.Tensor":
+    """The 1 x 12 input vector process_echo feeds the brain (for update_subconscious)."""
+    import torch
+    features, _ = _echo_features(current_pulse, last_pulse)
+    return torch.tensor(features).float().view(1, -1)
+
+def process_echo(current_pulse: Dict[str, Any], last_pulse: Dict[str, Any]) -> Command:
+    """
+    ML Analysis of organ 'Echoes'. 
+    Detects 'Nervous Tension' by analyzing the acceleration of change (Systemic Jitter).
+    """
+    # 1-3. Construct Input Vector (12-dimensions: Values + Deltas + Tension + Rhythm)
+    features, tension = _echo_features(current_pulse, last_pulse)
 
     # 4. Neural Inference
-    brain.eval()
-    with torch.no_grad():
-        prediction = brain(input_vector).squeeze().tolist()
+    if _echo_backend == "numpy":
+        prediction = _numpy_kernel().predict(features)
+    else:
+        import torch
+        input_vector = torch.tensor(features).float().view(1, -1)
+        brain = get_brain()
+        brain.eval()
+        with torch.no_grad():
+            prediction = brain(input_vector).squeeze().tolist()
 
     # 5. Transform Inference into Biological Commands
+    return Command(
+        action_potential=round(clamp(prediction[0]), 3), # Threshold to initiate action
+        sensory_gain=round(clamp(prediction[1] + (tension * 0.2)), 3), # Tension sharpens awareness
+        energy_gate=round(clamp(prediction[2]), 3), # Resource allocation gate
+        mood_tone=round(prediction[3], 3), # Internal "state of being" (Sentiment bias)
+        nervous_tension=round(tension, 4)
+    )
+
+# Reused N x 12 input tensor for batched inference (grown on demand)
+_batch_input: Optional["torch.Tensor"] = None
+
+def _input_buffer(n: int) -> "torch.Tensor":
+    global _batch_input
+    import torch
+    if _batch_input is None or _batch_input.shape[0] < n:
+        capacity = max(n, 2 * (0 if _batch_input is None else _batch_input.shape[0]), 64)
+        _batch_input = torch.empty((capacity, 12), dtype=torch.float32)
+    return _batch_input[:n]
+
+def set_inference_threads(intra_op: int, inter_op: Optional[int] = None):
+    """
+    Tunes torch CPU parallelism: 1 intra-op thread favours per-call latency,
+    more threads favour throughput on large batches. inter_op can only be set
+    once per process, before the first parallel region.
+    """
+    import torch
+    torch.set_num_threads(int(intra_op))
+    if inter_op is not None:
+        try:
+            torch.set_num_interop_threads(int(inter_op))
+        except RuntimeError:
+            pass # Already fixed by an earlier parallel region
+
+# ─────────────────────────────────────────────────────────────────
+# NUMPY INFERENCE KERNEL (Torch-Free Reflex Arc)
+# ─────────────────────────────────────────────────────────────────
+
+# process_echo backends: the torch module itself, or NumpyBrainKernel
+ECHO_BACKENDS = ("torch", "numpy")
+_echo_backend = "torch"
+# In-place updates (optimizer steps) bump a tensor's version counter
+_param_version = attrgetter("_version")
+
+class NumpyBrainKernel:
+    """
+    Forward pass of the SubconsciousBrain (12 -> 32 Tanh -> 16 ReLU -> 4) in NumPy.
+    For one pulse, torch's dispatch costs far more than the 1k multiply-adds, so
+    the weights are copied into contiguous float32 arrays (transposed: a batch
+    of rows is x @ W) and every activation lives in a preallocated buffer.
+
+    sync() reloads the weights when the inference brain is swapped (trainer
+    publish, snapshot restore) or its parameters are updated in place
+    (get_optimizer().step(), tracked by the tensors' version counters). Weights restored before torch was loaded are
+    read directly, so a numpy-backend process never imports torch for inference.
+    Outputs match torch to float32 rounding (~1e-7), not bit for bit.
+    Buffers are per kernel: use one kernel per thread.
+    """
+
+    LAYERS = ("network.0", "network.2", "network.4")
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = int(capacity)
+        self.version = -1
+        self.weights: List = []
+        self._source = None
+        self._params: tuple = ()
+        self._param_versions: tuple = ()
+
+    def load(self, state: Dict[str, Any]):
+        """Copies brain_state()-style weights (NumPy arrays or tensors) into the kernel."""
+        weights = []
+        for layer in self.LAYERS:
+            w = state[layer + ".weight"]
+            b = state[layer + ".bias"]
+            if not isinstance(w, np.ndarray):
+                w, b = w.detach().cpu().numpy(), b.detach().cpu().numpy()
+            weights.append((np.ascontiguousarray(w.T, dtype=np.float32), np.array(b, dtype=np.float32)))
+        self.weights = weights
+        self._alloc(self.capacity)
+
+    def _alloc(self, capacity: int):
+        self.capacity = capacity
+        self._x = np.zeros((capacity, self.weights[0][0].shape[0]), dtype=np.float32)
+        self._h = [np.empty((capacity, w.shape[1]), dtype=np.float32) for w, _ in self.weights]
+        # Single-pulse views, sliced once (slicing costs as much as a tiny matmul)
+        self._one = [self._x[:1]] + [h[:1] for h in self._h]
+
+    def sync(self) -> "NumpyBrainKernel":
+        """Reloads the weights if the inference brain changed since the last load."""
+        version = _brain_version
+        source = _brain if _brain is not None else _pending_state
+        if source is None:
+            source = get_brain()
+        if (source is not self._source or version != self.version
+                or tuple(map(_param_version, self._params)) != self._param_versions):
+            if isinstance(source, dict):
+                self.load(source)
+                self._params = ()
+            else:
+                self.load(source.state_dict())
+                self._params = tuple(source.parameters())
+            self._param_versions = tuple(map(_param_version, self._params))
+            self._source = source
+            self.version = version
+        return self
+
+    def inputs(self, n: int) -> np.ndarray:
+        """The preallocated n x 12 float32 input block (grown on demand)."""
+        if n > self.capacity:
+            self._alloc(max(n, 2 * self.capacity))
+        return self._x[:n]
+
+    def _run(self, x: np.ndarray, h1: np.ndarray, h2: np.ndarray, out: np.ndarray) -> np.ndarray:
+        (w1, b1), (w2, b2), (w3, b3) = self.weights
+        np.dot(x, w1, out=h1)
+        np.add(h1, b1, out=h1)
+        np.tanh(h1, out=h1)
+        np.dot(h1, w2, out=h2)
+        np.add(h2, b2, out=h2)
+        np.maximum(h2, 0.0, out=h2)
+        np.dot(h2, w3, out=out)
+        np.add(out, b3, out=out)
+        return out
+
+    def forward(self, n: int) -> np.ndarray:
+        """Runs the first n rows of inputs(); returns an n x 4 view of the output buffer."""
+        h1, h2, out = self._h
+        return self._run(self._x[:n], h1[:n], h2[:n], out[:n])
+
+    def predict(self, features: Sequence[float]) -> List[float]:
+        """One 12-feature pulse -> the brain's 4 outputs."""
+        x = self._one[0]
+        x[0] = features
+        return self._run(*self._one)[0].tolist()
+
+_kernels = threading.local()
+
+def _numpy_kernel() -> NumpyBrainKernel:
+    kernel = getattr(_kernels, "kernel", None)
+    if kernel is None:
+        kernel = _kernels.kernel = NumpyBrainKernel()
+    return kernel.sync()
+
+def set_echo_backend(name: str):
+    """Selects the process_echo / process_echo_arrays inference backend ("torch" or "numpy")."""
+    global _echo_backend
+    if name not in ECHO_BACKENDS:
+        raise ValueError(f"unknown echo backend {name!r} (expected one of {ECHO_BACKENDS})")
+    _echo_backend = name
+
+def echo_backend() -> str:
+    return _echo_backend
+
+def process_echo_batch(
+    pulses: Sequence[Dict[str, Any]],
+    last_pulses: Optional[Sequence[Optional[Dict[str, Any]]]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Batched process_echo for N market streams: one N x 12 forward pass.
+    last_pulses[i] may be None/empty for a stream without a previous pulse.
+    Returns columnar float64 arrays keyed like process_echo's command dict.
+    """
+    n = len(pulses)
+
+    # 1. Capture current sensor values
+    current = np.array([_echo_values(p["echo"]) for p in pulses], dtype=np.float64)
+    current = current.reshape(n, len(ECHO_KEYS))
+
+    # 2. Previous values; streams without a last pulse stay at rest
+    last = None
+    if last_pulses is not None:
+        rows = [i for i, lp in enumerate(last_pulses) if lp]
+        if rows:
+            last = current.copy()
+            last[rows] = [_echo_values(last_pulses[i]["echo"]) for i in rows]
+    rhythm = np.array([p.get("rhythm_phase", 0.5) for p in pulses], dtype=np.float64)
+    return process_echo_arrays(current, rhythm, last)
+
+def process_echo_arrays(
+    current: np.ndarray,
+    rhythm,
+    last: Optional[np.ndarray] = None,
+    has_last: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Columnar core of process_echo_batch for callers that already hold arrays.
+    current / last: N x len(ECHO_KEYS) readings; rhythm: phase per stream (or one
+    for all); has_last masks the streams whose `last` row is valid (all if None).
+    """
+    n = current.shape[0]
+    numpy_backend = _echo_backend == "numpy"
+    if numpy_backend:
+        kernel = _numpy_kernel()
+        view = kernel.inputs(n)
+    else:
+        x = _input_buffer(n)
+        view = x.numpy()
+
+    # 2. Deltas and Nervous Tension
+    if last is None:
+        deltas = np.zeros_like(current)
+    else:
+        deltas = current - last
+        if has_last is not None:
+            deltas[~has_last] = 0.0
+    tension = np.abs(deltas).sum(axis=1)
+
+    # 3. Input Vector (Values + Deltas + Tension + Rhythm), written in place
+    view[:, 0:5] = current
+    view[:, 5:10] = deltas
+    view[:, 10] = tension
+    view[:, 11] = rhythm
+
+    # 4. Neural Inference
+    if numpy_backend:
+        prediction = kernel.forward(n).astype(np.float64)
+    else:
+        import torch
+        brain = get_brain()
+        if brain.training:
+            brain.eval()
+        with torch.inference_mode():
+            prediction = brain(x).numpy().astype(np.float64)
+
+    # 5. Biological Commands, vectorized
     return {
-        "action_potential": round(clamp(prediction[0]), 3), # Threshold to initiate action
-        "sensory_gain": round(clamp(prediction[1] + (tension * 0.2)), 3), # Tension sharpens awareness
-        "energy_gate": round(clamp(prediction[2]), 3), # Resource allocation gate
-        "mood_tone": round(prediction[3], 3), # Internal "state of being" (Sentiment bias)
-        "nervous_tension": round(tension, 4)
+        "action_potential": np.round(np.clip(prediction[:, 0], 0.0, 1.0), 3),
+        "sensory_gain": np.round(np.clip(prediction[:, 1] + tension * 0.2, 0.0, 1.0), 3),
+        "energy_gate": np.round(np.clip(prediction[:, 2], 0.0, 1.0), 3),
+        "mood_tone": np.round(prediction[:, 3], 3),
+        "nervous_tension": np.round(tension, 4)
     }
 
 # ─────────────────────────────────────────────────────────────────
 # SECTION 4: REINFORCEMENT & EVOLUTIONARY REPLAY
 # ─────────────────────────────────────────────────────────────────
 
-def update_subconscious(reward: float, last_input_vector: torch.Tensor):
+class ReplayBuffer:
+    """
+    Fixed-capacity experience memory of (input_vector, reward) pairs.
+    Preallocated tensors used as a ring: the oldest experience is overwritten.
+    """
+
+    def __init__(self, capacity: int = 65536, input_dim: int = 12):
+        import torch
+        self.capacity = int(capacity)
+        self.inputs = torch.zeros((self.capacity, input_dim), dtype=torch.float32)
+        self.rewards = torch.zeros(self.capacity, dtype=torch.float32)
+        self.size = 0
+        self.cursor = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def push(self, input_vector: "torch.Tensor", reward: float):
+        with self._lock:
+            self.inputs[self.cursor] = input_vector.reshape(-1)
+            self.rewards[self.cursor] = float(reward)
+            self.cursor = (self.cursor + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+
+    def push_many(self, input_vectors: "torch.Tensor", rewards):
+        """Bulk insert of N experiences (N x input_dim, N)."""
+        import torch
+        input_vectors = torch.as_tensor(input_vectors, dtype=torch.float32)
+        rewards = torch.as_tensor(rewards, dtype=torch.float32).reshape(-1)
+        n = len(rewards)
+        # Only the last `capacity` rows survive; dropping the rest keeps the
+        # scatter indices distinct (duplicate-index writes have no set order)
+        start = max(0, n - self.capacity)
+        with self._lock:
+            idx = (torch.arange(start, n) + self.cursor) % self.capacity
+            self.inputs[idx] = input_vectors[start:]
+            self.rewards[idx] = rewards[start:]
+            self.cursor = int((self.cursor + n) % self.capacity)
+            self.size = min(self.size + n, self.capacity)
+
+    def sample(self, batch_size: int, generator: Optional["torch.Generator"] = None):
+        """Uniform minibatch (inputs, rewards), copied out of the ring."""
+        import torch
+        with self._lock:
+            idx = torch.randint(0, self.size, (int(batch_size),), generator=generator)
+            return self.inputs[idx], self.rewards[idx]
+
+class SubconsciousTrainer:
+    """
+    Background Lucid Replay: trains a shadow copy of the SubconsciousBrain on
+    minibatches from a ReplayBuffer and periodically publishes its weights into
+    the inference model. Publishing swaps the module reference in one step, so
+    process_echo never waits on a lock or sees half-updated weights.
+
+    Training regresses Action_Potential toward the observed reward.
+    To protect inference latency the thread runs at a lower OS priority (nice)
+    and shortens the interpreter's GIL switch interval while it is alive.
+    Torch thread counts are process-wide (see set_inference_threads).
+    """
+
+    def __init__(
+        self,
+        buffer: "ReplayBuffer",
+        batch_size: int = 256,
+        lr: float = 0.001,
+        publish_every: int = 50,
+        pause: float = 0.0,
+        nice: int = 10,
+        switch_interval: Optional[float] = 0.0005,
+        seed: Optional[int] = None
+    ):
+        import torch
+        # Constructor settings, compared by start_subconscious_training()
+        self.settings = {
+            "batch_size": batch_size, "lr": lr, "publish_every": publish_every, "pause": pause,
+            "nice": nice, "switch_interval": switch_interval, "seed": seed,
+        }
+        self.buffer = buffer
+        self.batch_size = int(batch_size)
+        self.publish_every = int(publish_every)
+        self.pause = float(pause)
+        self.nice = int(nice)
+        self.switch_interval = switch_interval
+        self._saved_interval: Optional[float] = None
+        self.shadow = copy.deepcopy(get_brain()).train()
+        self.optimizer = torch.optim.Adam(self.shadow.parameters(), lr=lr)
+        self.generator = torch.Generator()
+        if seed is not None:
+            self.generator.manual_seed(seed)
+        self.steps = 0
+        self.samples_trained = 0
+        self.publishes = 0
+        self.last_loss = float("nan")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def step(self) -> Optional[float]:
+        """One optimizer step on a replay minibatch; None while the buffer is too small."""
+        import torch
+        if len(self.buffer) < self.batch_size:
+            return None
+        inputs, rewards = self.buffer.sample(self.batch_size, self.generator)
+        prediction = self.shadow(inputs)[:, 0]
+        loss = torch.nn.functional.mse_loss(prediction, rewards)
+        self.optimizer.zero_grad(set_to_none=True)
+        loss.backward()
+        self.optimizer.step()
+        self.steps += 1
+        self.samples_trained += self.batch_size
+        self.last_loss = loss.item()
+        if self.steps % self.publish_every == 0:
+            self.publish()
+        return self.last_loss
+
+    def publish(self):
+        """Copies the shadow weights into a fresh eval-mode brain and swaps it in."""
+        import torch
+        with torch.no_grad():
+            fresh = copy.deepcopy(self.shadow).eval()
+        for p in fresh.parameters():
+            p.requires_grad_(False)
+        _swap_brain(fresh)
+        self.publishes += 1
+
+    def _run(self):
+        lower_thread_priority(self.nice)
+        while not self._stop.is_set():
+            if self.step() is None:
+                self._stop.wait(0.01)
+            else:
+                # Yield the GIL to the tick thread between steps
+                time.sleep(self.pause)
+
+    def start(self) -> "SubconsciousTrainer":
+        if self._thread is None or not self._thread.is_alive():
+            if self.switch_interval is not None:
+                # Shorter GIL hand-off so inference is not parked behind Python-side training code
+                self._saved_interval = sys.getswitchinterval()
+                sys.setswitchinterval(self.switch_interval)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="prana-lucid-replay", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, publish: bool = True):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._saved_interval is not None:
+            sys.setswitchinterval(self._saved_interval)
+            self._saved_interval = None
+        if publish and self.steps:
+            self.publish()
+
+def _swap_brain(model):
+    """Atomically replaces the inference brain (readers fetch it once per call)."""
+    global _brain, _optimizer, _brain_version
+    _brain = model
+    _optimizer = None # Bound to the retired parameters; rebuilt on demand
+    _brain_version += 1
+
+def brain_state() -> Optional[Dict[str, np.ndarray]]:
+    """NumPy copy of the inference weights, or None while the brain is still unbuilt."""
+    brain = _brain
+    if brain is None:
+        return None if _pending_state is None else dict(_pending_state)
+    return {k: v.detach().cpu().numpy().copy() for k, v in brain.state_dict().items()}
+
+def load_brain_state(state: Dict[str, np.ndarray]):
+    """
+    Restores inference weights from brain_state() arrays.
+    If torch has not been loaded yet the weights wait for get_brain(), so a
+    warm restart does not pay the torch import up front. Restore before
+    start_subconscious_training(): a running trainer publishes over it.
+    """
+    global _pending_state, _brain_version
+    if _brain is None:
+        _pending_state = {k: np.array(v) for k, v in state.items()}
+        _brain_version += 1
+        return
+    import torch
+    model = _brain_class()(input_dim=12)
+    model.load_state_dict({k: torch.from_numpy(np.array(v)) for k, v in state.items()})
+    model.eval()
+    _swap_brain(model)
+
+_replay_buffer: Optional[ReplayBuffer] = None
+_trainer: Optional[SubconsciousTrainer] = None
+
+def get_replay_buffer() -> ReplayBuffer:
+    global _replay_buffer
+    if _replay_buffer is None:
+        _replay_buffer = ReplayBuffer()
+    return _replay_buffer
+
+def start_subconscious_training(**kwargs) -> SubconsciousTrainer:
+    """
+    Starts (or returns) the background trainer over the shared replay buffer.
+    Settings that differ from a running trainer's raise ValueError: stop it first.
+    """
+    global _trainer
+    if _trainer is not None:
+        unknown = set(kwargs) - set(_trainer.settings)
+        if unknown:
+            raise TypeError(f"unexpected trainer settings: {sorted(unknown)}")
+        changed = {k: v for k, v in kwargs.items() if _trainer.settings[k] != v}
+        if changed:
+            raise ValueError(
+                f"subconscious trainer already running with {_trainer.settings}; "
+                f"stop_subconscious_training() before changing {sorted(changed)}"
+            )
+    else:
+        _trainer = SubconsciousTrainer(get_replay_buffer(), **kwargs)
+    return _trainer.start()
+
+def stop_subconscious_training(publish: bool = True):
+    global _trainer
+    if _trainer is not None:
+        _trainer.stop(publish=publish)
+        _trainer = None
+
+def update_subconscious(reward: float, last_input_vector: "torch.Tensor"):
     """
     Reinforcement learning logic for the subconscious core.
-    Strengthens neural pathways associated with positive survival outcomes.
+    Strengthens neural pathways associated with positive survival outcomes:
+    the experience is stored for Lucid Replay by the background trainer.
     """
-    brain.train()
-    # Strategic logic for lucid replay integration is protected here
-    pass
+    get_replay_buffer().push(last_input_vector, reward)
 
 # ─────────────────────────────────────────────────────────────────
 # SECTION 5: UTILITIES